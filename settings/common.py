@@ -309,6 +309,7 @@ INSTALLED_APPS = [
     "taiga.export_import",
     "taiga.feedback",
     "taiga.stats",
+    "taiga.hooks",
     "taiga.hooks.github",
     "taiga.hooks.gitlab",
     "taiga.hooks.bitbucket",
@@ -399,6 +400,11 @@ AUTHENTICATION_BACKENDS = (
 )
 
 MAX_AGE_AUTH_TOKEN = None
+AUTH_TOKENS_CACHE_SIZE = 10000      # Verified tokens kept in memory
+# The authenticated users are cached only if the default cache is shared by
+# all the processes (memcached, redis...), not with the LocMemCache. None or
+# 0 disables the cache.
+AUTH_USER_CACHE_TIMEOUT = 60        # In seconds
 MAX_AGE_CANCEL_ACCOUNT = 30 * 24 * 60 * 60 # 30 days in seconds
 
 REST_FRAMEWORK = {
@@ -476,10 +482,24 @@ THUMBNAIL_ALIASES = {
     },
 }
 
+# Thumbnails generated in background when the file changes and stored in
+# the `thumbnails` field of the model: {"model": ("file field", [aliases])}
+THN_PRECOMPUTED = {
+    "users.User": ("photo", [THN_AVATAR_SMALL, THN_AVATAR_BIG]),
+    "projects.Project": ("logo", [THN_LOGO_SMALL, THN_LOGO_BIG]),
+    "attachments.Attachment": ("attached_file", [THN_ATTACHMENT_TIMELINE, THN_ATTACHMENT_CARD]),
+}
+THN_PRECOMPUTED_WORKERS = 4
+
+ATTACHMENTS_SHA1_WORKERS = 4  # Processes used to hash the attachment files in the generate_sha1 command
+
 # GRAVATAR_DEFAULT_AVATAR = "img/user-noimage.png"
 GRAVATAR_DEFAULT_AVATAR = ""
 GRAVATAR_AVATAR_SIZE = THN_AVATAR_SIZE
 
+# Number of resolved photo thumbnails and gravatar urls kept in memory
+AVATAR_URLS_CACHE_SIZE = 4096
+
 TAGS_PREDEFINED_COLORS = ["#fce94f", "#edd400", "#c4a000", "#8ae234",
                           "#73d216", "#4e9a06", "#d3d7cf", "#fcaf3e",
                           "#f57900", "#ce5c00", "#729fcf", "#3465a4",
@@ -514,14 +534,47 @@ BITBUCKET_VALID_ORIGIN_IPS = ["131.103.20.165", "131.103.20.166", "104.192.143.1
 GITLAB_VALID_ORIGIN_IPS = []
 
 EXPORTS_TTL = 60 * 60 * 24  # 24 hours
+# Processes used to render the sections of the archive dumps. Only the
+# `dump_project` management command renders them in parallel: the celery
+# workers are daemonic processes and the API requests run in a transaction,
+# so the exports made from the API render the sections serially.
+EXPORTS_ARCHIVE_WORKERS = 4
 
 CELERY_ENABLED = False
+
+HOOKS_DELIVERIES_KEPT = 100           # Received git hook payloads kept by project, to detect the redeliveries
+
 WEBHOOKS_ENABLED = False
+WEBHOOKS_REQUEST_TIMEOUT = 30         # In seconds
+WEBHOOKS_POOL_SIZE = 10               # Connections kept by host
+WEBHOOKS_DELIVERY_WORKERS = 4         # Webhooks delivered concurrently
+WEBHOOKS_LOGS_KEPT = 10
+WEBHOOKS_LOGS_PRUNE_INTERVAL = 10     # Deliveries of a webhook between prunes
+# Send the changes of a transaction in "bulk" payloads instead of one by one
+WEBHOOKS_BULK_MODE = False
+WEBHOOKS_BULK_MAX_ITEMS = 100
+WEBHOOKS_BULK_MAX_SIZE = 1024 * 1024  # In bytes
+
+# Cache of the serialized user stories, tasks and issues of the list endpoints
+SERIALIZED_CACHE_ENABLED = True
+SERIALIZED_CACHE_TIMEOUT = 60 * 60  # In seconds
+
+# Json backend used by the api renderers, the events and the exporter. The
+# orjson one is faster but its output is not byte-for-byte the same (no
+# whitespace between items, floats like 1e20 instead of 1e+20 and NaN or
+# Infinity as null). It falls back to the stdlib one if orjson is not
+# installed.
+JSON_BACKEND = "taiga.base.utils.json.StdlibBackend"
+# JSON_BACKEND = "taiga.base.utils.json.OrjsonBackend"
 
 
 # If is True /front/sitemap.xml show a valid sitemap of taiga-front client
 FRONT_SITEMAP_ENABLED = False
 FRONT_SITEMAP_CACHE_TIMEOUT = 24*60*60  # In second
+# The sitemap files are pre-generated in this directory, run the rebuild_sitemaps
+# command after enabling it
+FRONT_SITEMAP_PATH = os.path.join(BASE_DIR, "sitemaps")
+FRONT_SITEMAP_SHARD_SIZE = 10000  # Range of ids in every file (a sitemap file can have up to 50000 urls)
 
 EXTRA_BLOCKING_CODES = []
 
@@ -22,6 +22,8 @@ CELERY_ALWAYS_EAGER = True
 
 MEDIA_ROOT = "/tmp"
 
+EXPORTS_ARCHIVE_WORKERS = 1
+
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 INSTALLED_APPS = INSTALLED_APPS + [
     "tests",
@@ -33,3 +35,5 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] = {
     "import-mode": None,
     "import-dump-mode": None,
 }
+
+SERIALIZED_CACHE_ENABLED = False
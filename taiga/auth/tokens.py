@@ -18,9 +18,20 @@ from django.contrib.auth import get_user_model
 from taiga.base import exceptions as exc
 
 from django.apps import apps
+from django.conf import settings
 from django.core import signing
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.cache import cache
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.utils import baseconv
 from django.utils.translation import ugettext as _
 
+from functools import lru_cache
+
+import time
+
 
 def get_token_for_user(user, scope):
     """
@@ -43,15 +54,65 @@ def get_user_for_token(token, scope, max_age=None):
     in the incoming token.
     """
     try:
-        data = signing.loads(token, max_age=max_age)
+        data, timestamp = _unsign_token(token)
     except signing.BadSignature:
         raise exc.NotAuthenticated(_("Invalid token"))
 
+    if max_age is not None and time.time() - timestamp > max_age:
+        raise exc.NotAuthenticated(_("Invalid token"))
+
     model_cls = get_user_model()
 
     try:
-        user = model_cls.objects.get(pk=data["user_%s_id" % (scope)])
+        user = get_cached_user(data["user_%s_id" % (scope)])
     except (model_cls.DoesNotExist, KeyError):
         raise exc.NotAuthenticated(_("Invalid token"))
     else:
         return user
+
+
+@lru_cache(maxsize=settings.AUTH_TOKENS_CACHE_SIZE)
+def _unsign_token(token):
+    # The content of a valid token never changes so the result of the
+    # verification (invalid tokens raise and aren't cached) can be reused,
+    # the expiration is checked later with the signing timestamp.
+    data = signing.loads(token)
+    timestamp = baseconv.base62.decode(token.rsplit(":", 2)[1])
+    return data, timestamp
+
+
+def _get_cached_user_key(user_id):
+    return "auth-user:{}".format(user_id)
+
+
+def is_user_cache_enabled():
+    # The users are cached only in a cache shared by all the processes,
+    # with a local memory one the invalidations wouldn't reach the other
+    # processes and they could authenticate disabled users.
+    return (settings.AUTH_USER_CACHE_TIMEOUT and
+            not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache))
+
+
+def get_cached_user(user_id):
+    """
+    Get a user by id from a short living cache of users, it raises
+    DoesNotExist if the user doesn't exist.
+
+    Every call returns a new instance so it can be modified freely.
+    """
+    if not is_user_cache_enabled():
+        return get_user_model().objects.get(pk=user_id)
+
+    key = _get_cached_user_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = get_user_model().objects.get(pk=user_id)
+        cache.set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+
+def invalidate_cached_user(user_id):
+    key = _get_cached_user_key(user_id)
+    cache.delete(key)
+    # A concurrent request could cache the old data before the commit
+    connection.on_commit(lambda: cache.delete(key))
@@ -72,9 +72,11 @@ from collections import OrderedDict
 from decimal import Decimal, DecimalException
 import copy
 import datetime
+import functools
 import inspect
 import re
 import warnings
+import weakref
 
 
 def is_non_str_iterable(obj):
@@ -84,6 +86,10 @@ def is_non_str_iterable(obj):
     return hasattr(obj, "__iter__")
 
 
+# Results of `is_simple_callable` by function, for plain functions and methods
+_simple_callables = (weakref.WeakKeyDictionary(), weakref.WeakKeyDictionary())
+
+
 def is_simple_callable(obj):
     """
     True if the object is a callable that takes no arguments.
@@ -94,10 +100,23 @@ def is_simple_callable(obj):
     if not (function or method):
         return False
 
-    args, _, _, defaults = inspect.getargspec(obj)
-    len_args = len(args) if function else len(args) - 1
-    len_defaults = len(defaults) if defaults else 0
-    return len_args <= len_defaults
+    # The signature of a function doesn't change, so inspect it only once
+    cache = _simple_callables[method]
+    func = obj.__func__ if method else obj
+    if func not in cache:
+        args, _, _, defaults = inspect.getargspec(obj)
+        len_args = len(args) if function else len(args) - 1
+        len_defaults = len(defaults) if defaults else 0
+        cache[func] = len_args <= len_defaults
+    return cache[func]
+
+
+@functools.lru_cache(maxsize=None)
+def split_source(source):
+    """
+    Return the components of a dotted `source` as a tuple.
+    """
+    return tuple(source.split("."))
 
 
 def get_component(obj, attr_name):
@@ -234,13 +253,46 @@ class Field(object):
         source = self.source or field_name
         value = obj
 
-        for component in source.split("."):
+        for component in split_source(source):
             value = get_component(value, component)
             if value is None:
                 break
 
         return self.to_native(value)
 
+    def get_native_accessor(self, field_name):
+        """
+        Return a function that, given an object, returns the same value as
+        `field_to_native(obj, field_name)`.
+
+        Fields that don't override `field_to_native` get an accessor with the
+        components of their source already resolved.
+        """
+        field_to_native = type(self).field_to_native
+        if field_to_native is WritableField.field_to_native:
+            if self.write_only:
+                return lambda obj: None
+        elif field_to_native is not Field.field_to_native:
+            return lambda obj: self.field_to_native(obj, field_name)
+
+        to_native = self.to_native
+        if self.source == "*":
+            return to_native
+
+        components = split_source(self.source or field_name)
+        if len(components) == 1:
+            component = components[0]
+            return lambda obj: to_native(get_component(obj, component))
+
+        def accessor(obj):
+            value = obj
+            for component in components:
+                value = get_component(value, component)
+                if value is None:
+                    break
+            return to_native(value)
+        return accessor
+
     def to_native(self, value):
         """
         Converts the field's value into it's simple representation.
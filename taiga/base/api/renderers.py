@@ -70,7 +70,8 @@ from .settings import api_settings
 from .utils import encoders
 from .utils.breadcrumbs import get_breadcrumbs
 
-import json
+from taiga.base.utils import json
+
 import copy
 
 
@@ -131,7 +132,7 @@ class JSONRenderer(BaseRenderer):
 
         indent = self._get_indent(accepted_media_type, renderer_context)
 
-        ret = json.dumps(data, cls=self.encoder_class,
+        ret = json.dumps(data, encoder_class=self.encoder_class,
             indent=indent, ensure_ascii=self.ensure_ascii)
 
         # On python 2.x json.dumps() returns bytestrings if ensure_ascii=True,
@@ -151,8 +152,8 @@ class JSONRenderer(BaseRenderer):
 
         indent = self._get_indent(accepted_media_type, renderer_context)
 
-        ret = json.dump(data, outputfile, cls=self.encoder_class,
-            indent=indent, ensure_ascii=self.ensure_ascii)
+        outputfile.write(json.dumps(data, encoder_class=self.encoder_class,
+            indent=indent, ensure_ascii=self.ensure_ascii))
 
 
 class UnicodeJSONRenderer(JSONRenderer):
@@ -485,6 +486,7 @@ class BrowsableAPIRenderer(BaseRenderer):
                 return
 
             serializer = view.get_serializer(instance=obj, data=data, files=files)
+            serializer.with_metadata = True
             serializer.is_valid()
             data = serializer.data
 
@@ -161,6 +161,46 @@ class OrderedDictWithMetadata(OrderedDict):
         return OrderedDict(self).__dict__
 
 
+class SortedFields(OrderedDict):
+    """
+    The fields of a serializer. Keeps a version number that changes every
+    time the fields are modified, so the serialization plans built from
+    them can be invalidated.
+    """
+    version = 0
+
+    def _changed(self):
+        self.version += 1
+
+    def __setitem__(self, key, value):
+        super(SortedFields, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(SortedFields, self).__delitem__(key)
+        self._changed()
+
+    def pop(self, *args, **kwargs):
+        self._changed()
+        return super(SortedFields, self).pop(*args, **kwargs)
+
+    def popitem(self, *args, **kwargs):
+        self._changed()
+        return super(SortedFields, self).popitem(*args, **kwargs)
+
+    def setdefault(self, *args, **kwargs):
+        self._changed()
+        return super(SortedFields, self).setdefault(*args, **kwargs)
+
+    def update(self, *args, **kwargs):
+        self._changed()
+        return super(SortedFields, self).update(*args, **kwargs)
+
+    def clear(self):
+        self._changed()
+        return super(SortedFields, self).clear()
+
+
 def _is_protected_type(obj):
     """
     True if the object is a native datatype that does not need to
@@ -222,7 +262,11 @@ class BaseSerializer(WritableField):
         pass
 
     _options_class = SerializerOptions
-    _dict_class = OrderedDictWithMetadata
+    _dict_class = OrderedDict
+    _metadata_dict_class = OrderedDictWithMetadata
+
+    # Attach the fields to the serialized data (needed only to render forms)
+    with_metadata = False
 
     def __init__(self, instance=None, data=None, files=None,
                  context=None, partial=False, many=None,
@@ -241,6 +285,8 @@ class BaseSerializer(WritableField):
         self.init_files = files
         self.object = instance
         self.fields = self.get_fields()
+        self._native_plan = None
+        self._native_plan_key = None
 
         self._data = None
         self._files = None
@@ -295,6 +341,7 @@ class BaseSerializer(WritableField):
             for key in self.opts.exclude:
                 ret.pop(key, None)
 
+        ret = SortedFields(ret)
         for key, field in ret.items():
             field.initialize(parent=self, field_name=key)
 
@@ -379,12 +426,51 @@ class BaseSerializer(WritableField):
             return instance
         return attrs
 
+    def get_native_plan(self):
+        """
+        Return the serialization plan, a tuple of (key, accessor) pairs, one
+        per field.
+
+        The plan is compiled once and reused for every serialized object.
+        Fields are initialized only when it's compiled, so it's compiled
+        again if the fields, the root serializer or the context change.
+        """
+        fields = self.fields
+        version = getattr(fields, "version", None)
+        key = (id(fields), version, self.root, id(self.context))
+
+        if self._native_plan is None or version is None or key != self._native_plan_key:
+            plan = []
+            for field_name, field in fields.items():
+                field.initialize(parent=self, field_name=field_name)
+                plan.append((self.get_field_key(field_name), field.get_native_accessor(field_name)))
+
+            self._native_plan = tuple(plan)
+            self._native_plan_key = key
+
+        return self._native_plan
+
     def to_native(self, obj):
         """
         Serialize objects -> primitives.
         """
+        if self.with_metadata:
+            return self.to_native_with_metadata(obj)
+
         ret = self._dict_class()
-        ret.fields = self._dict_class()
+        if obj is not None:
+            for key, accessor in self.get_native_plan():
+                ret[key] = accessor(obj)
+
+        return ret
+
+    def to_native_with_metadata(self, obj):
+        """
+        Serialize objects -> primitives, attaching the serializer fields to
+        the result.
+        """
+        ret = self._metadata_dict_class()
+        ret.fields = self._metadata_dict_class()
         ret.empty = obj is None
 
         for field_name, field in self.fields.items():
@@ -439,7 +525,7 @@ class BaseSerializer(WritableField):
             source = self.source or field_name
             value = obj
 
-            for component in source.split("."):
+            for component in split_source(source):
                 if value is None:
                     break
                 value = get_component(value, component)
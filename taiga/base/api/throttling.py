@@ -187,6 +187,71 @@ class SimpleRateThrottle(BaseThrottle):
         return remaining_duration / float(available_requests)
 
 
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    A SimpleRateThrottle that, instead of the whole history of requests,
+    only stores a counter for the current and the previous fixed windows
+    of `duration` seconds. The number of requests in the sliding window is
+    estimated weighting the previous counter with the part of the previous
+    window still inside it.
+
+    Counters are updated with the atomic `incr` of the cache, so concurrent
+    workers can't lose updates and every check is O(1).
+    """
+
+    def get_window_key(self, window):
+        return "%s_%d" % (self.key, window)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.elapsed = self.now - window * self.duration
+        self.current_key = self.get_window_key(window)
+
+        # Reserve the request before checking, concurrent requests will see it
+        try:
+            self.current = self.cache.incr(self.current_key)
+        except ValueError:
+            # Counters live two windows, the current and the next one
+            self.cache.add(self.current_key, 0, self.duration * 2)
+            self.current = self.cache.incr(self.current_key)
+
+        self.previous = self.cache.get(self.get_window_key(window - 1), 0)
+        weight = 1 - self.elapsed / self.duration
+
+        if self.previous * weight + self.current > self.num_requests:
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def throttle_success(self):
+        return True
+
+    def throttle_failure(self):
+        # Rejected requests don't count
+        self.current = self.cache.decr(self.current_key)
+        return False
+
+    def wait(self):
+        if self.num_requests < 1:
+            return None
+
+        if self.current >= self.num_requests:
+            # The current window is full, wait until the weight of its
+            # counter, once it becomes the previous one, is low enough.
+            return ((self.duration - self.elapsed) +
+                    self.duration * (1 - (self.num_requests - 1) / self.current))
+
+        available = self.num_requests - 1 - self.current
+        return max(self.duration * (1 - available / self.previous) - self.elapsed, 0)
+
+
 class AnonRateThrottle(SimpleRateThrottle):
     """
     Limits the rate of API calls that may be made by a anonymous users.
@@ -55,34 +55,46 @@ import types
 import json
 
 
+def encode_datetime(o):
+    # For Date Time string spec, see ECMA 262
+    # http://ecma-international.org/ecma-262/5.1/#sec-15.9.1.15
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:23] + r[26:]
+    if r.endswith("+00:00"):
+        r = r[:-6] + "Z"
+    return r
+
+
+def encode_time(o):
+    if timezone and timezone.is_aware(o):
+        raise ValueError("JSON can't represent timezone-aware times.")
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:12]
+    return r
+
+
+def encode_timedelta(o):
+    return str(o.total_seconds())
+
+
 class JSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time/timedelta,
     decimal types, and generators.
     """
     def default(self, o):
-        # For Date Time string spec, see ECMA 262
-        # http://ecma-international.org/ecma-262/5.1/#sec-15.9.1.15
         if isinstance(o, Promise):
             return force_text(o)
         elif isinstance(o, datetime.datetime):
-            r = o.isoformat()
-            if o.microsecond:
-                r = r[:23] + r[26:]
-            if r.endswith("+00:00"):
-                r = r[:-6] + "Z"
-            return r
+            return encode_datetime(o)
         elif isinstance(o, datetime.date):
             return o.isoformat()
         elif isinstance(o, datetime.time):
-            if timezone and timezone.is_aware(o):
-                raise ValueError("JSON can't represent timezone-aware times.")
-            r = o.isoformat()
-            if o.microsecond:
-                r = r[:12]
-            return r
+            return encode_time(o)
         elif isinstance(o, datetime.timedelta):
-            return str(o.total_seconds())
+            return encode_timedelta(o)
         elif isinstance(o, decimal.Decimal):
             return str(o)
         elif isinstance(o, QuerySet):
@@ -99,4 +111,34 @@ class JSONEncoder(json.JSONEncoder):
         return super(JSONEncoder, self).default(o)
 
 
+# Encoders by exact type of the most common non native values. The
+# classes of the lazy translation strings are added as they are found.
+_type_encoders = {
+    datetime.datetime: encode_datetime,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: encode_time,
+    datetime.timedelta: encode_timedelta,
+    decimal.Decimal: str,
+}
+
+_json_encoder = JSONEncoder()
+
+
+def encode_default(o):
+    """
+    Same as `JSONEncoder().default(o)` but values of the most common types
+    are encoded with a single dict lookup instead of a chain of isinstance
+    checks. Use it as the `default` hook of the json backends.
+    """
+    encoder = _type_encoders.get(type(o), None)
+    if encoder is not None:
+        return encoder(o)
+
+    if isinstance(o, Promise):
+        _type_encoders[type(o)] = force_text
+        return force_text(o)
+
+    return _json_encoder.default(o)
+
+
 SafeDumper = None
@@ -0,0 +1,75 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+from optparse import make_option
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import resolve, reverse
+from django.test.client import RequestFactory
+
+from taiga.auth import tokens
+
+
+class Command(BaseCommand):
+    help = "Measure the requests per second of a trivial endpoint authenticated with a token"
+    option_list = BaseCommand.option_list + (
+        make_option('--user', '-u', default=None, dest='username',
+            help='Username of the authenticated user (the first active one by default)'),
+        make_option('--requests', '-n', type="int", default=1000, dest='requests',
+            help='Number of requests'),
+        make_option('--no-cache', action="store_true", default=False, dest='no_cache',
+            help='Clear the cached tokens and users before every request'),
+    )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.filter(is_active=True, is_system=False).order_by("id")
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            raise CommandError("There is no user to authenticate")
+
+        url = reverse("users-me")
+        match = resolve(url)
+        token = tokens.get_token_for_user(user, "authentication")
+        factory = RequestFactory()
+
+        def request():
+            if options["no_cache"]:
+                tokens._unsign_token.cache_clear()
+                cache.delete(tokens._get_cached_user_key(user.id))
+
+            response = match.func(factory.get(url, HTTP_AUTHORIZATION="Bearer {}".format(token)),
+                                  *match.args, **match.kwargs)
+            if response.status_code != 200:
+                raise CommandError("Unexpected response status {}".format(response.status_code))
+
+        # Warm up
+        request()
+
+        num_requests = options["requests"]
+        start = time.perf_counter()
+        for i in range(num_requests):
+            request()
+        elapsed = time.perf_counter() - start
+
+        print("{} requests in {:.2f} s  {:>10.1f} requests/s  {:>8.1f} us/request".format(
+            num_requests, elapsed, num_requests / elapsed, elapsed * 1000000 / num_requests))
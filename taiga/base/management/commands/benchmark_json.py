@@ -0,0 +1,66 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import timeit
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from taiga.base.utils import json
+
+from .benchmark_serializers import BENCHMARKS
+
+
+JSON_BACKENDS = [
+    ("stdlib", "taiga.base.utils.json.StdlibBackend"),
+    ("orjson", "taiga.base.utils.json.OrjsonBackend"),
+]
+
+
+class Command(BaseCommand):
+    help = "Measure the throughput of the json backends rendering serialized resources"
+    option_list = BaseCommand.option_list + (
+        make_option('--limit', '-l', type="int", default=1000, dest='limit',
+            help='Number of serialized objects rendered on every run'),
+        make_option('--repeat', '-r', type="int", default=5, dest='repeat',
+            help='Number of runs, the best one is reported'),
+    )
+
+    def handle(self, *args, **options):
+        backends = []
+        for backend_name, backend_path in JSON_BACKENDS:
+            backend = json._get_backend(backend_path)
+            if backend_name != "stdlib" and isinstance(backend, json.StdlibBackend):
+                print("{} backend is not available".format(backend_name))
+                continue
+            backends.append((backend_name, backend))
+
+        for name, serializer_class, queryset in BENCHMARKS:
+            objects = list(queryset.order_by("id")[:options["limit"]])
+            if not objects:
+                print("{:<12} no objects to render".format(name))
+                continue
+
+            data = serializer_class(objects, many=True).data
+
+            for backend_name, backend in backends:
+                size = len(backend.dumps(data).encode("utf-8"))
+                timer = timeit.Timer(lambda: backend.dumps(data))
+                best = min(timer.repeat(repeat=options["repeat"], number=1))
+                print("{:<12} {:<8} {:>6} objects  {:>10.2f} ms  {:>8.2f} MB/s".format(
+                    name, backend_name, len(objects), best * 1000, size / best / (1024 * 1024)))
@@ -0,0 +1,74 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import timeit
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from taiga.projects.issues.models import Issue
+from taiga.projects.issues.serializers import IssueListSerializer
+from taiga.projects.models import Project
+from taiga.projects.serializers import ProjectSerializer
+from taiga.projects.tasks.models import Task
+from taiga.projects.tasks.serializers import TaskListSerializer
+from taiga.projects.userstories.models import UserStory
+from taiga.projects.userstories.serializers import UserStoryListSerializer
+
+
+BENCHMARKS = [
+    ("userstories", UserStoryListSerializer, UserStory.objects.select_related("owner", "status", "project")),
+    ("tasks", TaskListSerializer, Task.objects.select_related("owner", "status", "project")),
+    ("issues", IssueListSerializer, Issue.objects.select_related("owner", "status", "project")),
+    ("projects", ProjectSerializer, Project.objects.select_related("owner")),
+]
+
+
+class Command(BaseCommand):
+    help = "Measure the serialization time of the main resource serializers"
+    option_list = BaseCommand.option_list + (
+        make_option('--limit', '-l', type="int", default=1000, dest='limit',
+            help='Number of objects serialized on every run'),
+        make_option('--repeat', '-r', type="int", default=5, dest='repeat',
+            help='Number of runs, the best one is reported'),
+        make_option('--only', '-o', default=None, dest='only',
+            help='Run only the benchmark with this name'),
+    )
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        repeat = options["repeat"]
+
+        for name, serializer_class, queryset in BENCHMARKS:
+            if options["only"] and options["only"] != name:
+                continue
+
+            objects = list(queryset.order_by("id")[:limit])
+            if not objects:
+                print("{:<12} no objects to serialize".format(name))
+                continue
+
+            # A first run caches, in the instances, the related objects
+            # that aren't fetched with select_related, so most of the
+            # database access doesn't count in the measures.
+            serializer_class(objects, many=True).data
+
+            timer = timeit.Timer(lambda: serializer_class(objects, many=True).data)
+            best = min(timer.repeat(repeat=repeat, number=1))
+            print("{:<12} {:>6} objects  {:>10.2f} ms  {:>8.1f} us/object".format(
+                name, len(objects), best * 1000, best * 1000000 / len(objects)))
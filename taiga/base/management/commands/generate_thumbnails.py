@@ -0,0 +1,74 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from optparse import make_option
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from taiga.base.utils.processes import get_process_pool_executor
+from taiga.base.utils.thumbnails import are_thumbnails_fresh
+from taiga.base.tasks import update_thumbnails
+
+
+def _update_thumbnails(model_label, pk):
+    # Executed in the workers, the task is called synchronously
+    update_thumbnails(model_label, pk)
+    return pk
+
+
+def _get_pending_pks(model_label, regenerate_all=False):
+    model = apps.get_model(model_label)
+    field_name = settings.THN_PRECOMPUTED[model_label][0]
+
+    qs = model.objects.exclude(**{field_name: ""}).exclude(**{"{}__isnull".format(field_name): True})
+    for pk, file_name, thumbnails in qs.order_by("pk").values_list("pk", field_name, "thumbnails").iterator():
+        if regenerate_all or not are_thumbnails_fresh(thumbnails, file_name):
+            yield pk
+
+
+class Command(BaseCommand):
+    help = "Generate the stored thumbnails of avatars, project logos and attachments"
+    option_list = BaseCommand.option_list + (
+        make_option('--workers', '-w', type="int", default=settings.THN_PRECOMPUTED_WORKERS, dest='workers',
+            help='Number of processes used to generate the thumbnails'),
+        make_option('--all', '-a', action="store_true", default=False, dest='regenerate_all',
+            help='Regenerate the thumbnails of all the objects, not only the missing or outdated ones'),
+        make_option('--only', '-o', default=None, dest='only',
+            help='Generate only the thumbnails of this model (e.g. "users.User")'),
+    )
+
+    def handle(self, *args, **options):
+        workers = max(options["workers"], 1)
+
+        for model_label in settings.THN_PRECOMPUTED:
+            if options["only"] and options["only"] != model_label:
+                continue
+
+            pks = list(_get_pending_pks(model_label, options["regenerate_all"]))
+            print("-> Generating thumbnails of {} {} objects".format(len(pks), model_label))
+            if not pks:
+                continue
+
+            executor = get_process_pool_executor(workers)
+            if executor is not None:
+                with executor:
+                    list(executor.map(_update_thumbnails, [model_label] * len(pks), pks, chunksize=50))
+            else:
+                for pk in pks:
+                    _update_thumbnails(model_label, pk)
@@ -0,0 +1,140 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Anler Hernández <hello@anler.me>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import translation
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class CachedSerializerMixin:
+    """
+    Serializer mixin that caches the serialized representation of every
+    object, keyed by its type, pk and version, the serializer class and the
+    language. It's only used when the serializer context has
+    `serialized_cache` enabled (see `SerializedCacheResourceMixin`).
+
+    The version of an object only changes when it's edited through the
+    api, so the fields in `serialized_cache_fresh_fields` are always
+    serialized again and overlaid on the cached representation. They must
+    include the fields that depend on the user (like `is_voter`), the ones
+    that are updated without increasing the version (orders, counters,
+    related objects changed in bulk, tags renamed in the whole project...)
+    and the ones taken from other objects (like the name and photo of the
+    owner).
+    """
+    serialized_cache_fresh_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serialized_cache_hits = None
+        self._serialized_cache_misses = None
+        self._only_fresh_fields = False
+        self._fresh_plan = None
+
+    def use_serialized_cache(self):
+        return self.context.get("serialized_cache", False)
+
+    def get_serialized_cache_key(self, obj):
+        version = getattr(obj, "version", None)
+        if obj is None or obj.pk is None or not isinstance(version, int):
+            # After a save the version can be an F() expression
+            return None
+
+        return "serialized:{}:{}:{}:{}.{}:{}".format(obj._meta.label_lower, obj.pk, version,
+                                                    self.__class__.__module__, self.__class__.__name__,
+                                                    translation.get_language())
+
+    def get_native_plan(self):
+        plan = super().get_native_plan()
+        if not self._only_fresh_fields:
+            return plan
+
+        if self._fresh_plan is None or self._fresh_plan[0] is not plan:
+            fresh_fields = set(self.serialized_cache_fresh_fields)
+            self._fresh_plan = (plan, tuple((key, accessor) for key, accessor in plan if key in fresh_fields))
+        return self._fresh_plan[1]
+
+    def to_native(self, obj):
+        key = self.get_serialized_cache_key(obj) if self.use_serialized_cache() else None
+        if key is None:
+            return super().to_native(obj)
+
+        if self._serialized_cache_hits is not None:
+            cached = self._serialized_cache_hits.get(key, None)
+        else:
+            cached = cache.get(key)
+
+        if cached is None:
+            ret = super().to_native(obj)
+            cached = {field_key: value for field_key, value in ret.items()
+                      if field_key not in self.serialized_cache_fresh_fields}
+
+            if self._serialized_cache_misses is not None:
+                self._serialized_cache_misses[key] = cached
+            else:
+                cache.set(key, cached, settings.SERIALIZED_CACHE_TIMEOUT)
+            return ret
+
+        self._only_fresh_fields = True
+        try:
+            fresh = super().to_native(obj)
+        finally:
+            self._only_fresh_fields = False
+
+        ret = self._dict_class()
+        for field_key, accessor in self.get_native_plan():
+            ret[field_key] = fresh[field_key] if field_key in fresh else cached[field_key]
+        return ret
+
+    @property
+    def data(self):
+        if self._data is not None or not self.many or not self.use_serialized_cache():
+            return super().data
+
+        # Read and write the representations of all the objects at once
+        self.object = list(self.object)
+        keys = [key for key in map(self.get_serialized_cache_key, self.object) if key is not None]
+        self._serialized_cache_hits = cache.get_many(keys)
+        self._serialized_cache_misses = {}
+        try:
+            data = super().data
+            if self._serialized_cache_misses:
+                cache.set_many(self._serialized_cache_misses, settings.SERIALIZED_CACHE_TIMEOUT)
+        finally:
+            self._serialized_cache_hits = None
+            self._serialized_cache_misses = None
+
+        return data
+
+
+class SerializedCacheResourceMixin:
+    """
+    Viewset mixin that enables the cache of `CachedSerializerMixin`
+    serializers for the read only requests of `serialized_cache_actions`.
+    """
+    serialized_cache_actions = ("list",)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["serialized_cache"] = (settings.SERIALIZED_CACHE_ENABLED and
+                                       self.request.method in SAFE_METHODS and
+                                       self.action in self.serialized_cache_actions)
+        return context
@@ -15,18 +15,52 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import signals
+
 from .cleanup_files import cleanup_post_delete
 from easy_thumbnails.files import get_thumbnailer
 
+from taiga.base.utils.thumbnails import are_thumbnails_fresh
+from taiga.base.tasks import update_thumbnails
+
 
 def _delete_thumbnail_files(**kwargs):
     thumbnailer = get_thumbnailer(kwargs["file"])
     thumbnailer.delete_thumbnails()
 
 
+def _update_precomputed_thumbnails(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    model_label = sender._meta.label
+    field_name = settings.THN_PRECOMPUTED[model_label][0]
+    file_obj = getattr(instance, field_name)
+    if not file_obj or are_thumbnails_fresh(instance.thumbnails, file_obj):
+        return
+
+    pk = instance.pk
+    if settings.CELERY_ENABLED:
+        connection.on_commit(lambda: update_thumbnails.delay(model_label, pk))
+    else:
+        connection.on_commit(lambda: update_thumbnails(model_label, pk))
+
+
 def connect_thumbnail_signals():
     cleanup_post_delete.connect(_delete_thumbnail_files)
 
+    for model_label in settings.THN_PRECOMPUTED:
+        signals.post_save.connect(_update_precomputed_thumbnails,
+                                  sender=apps.get_model(model_label),
+                                  dispatch_uid="update_precomputed_thumbnails_{}".format(model_label))
+
 
 def disconnect_thumbnail_signals():
     cleanup_post_delete.disconnect(_delete_thumbnail_files)
+
+    for model_label in settings.THN_PRECOMPUTED:
+        signals.post_save.disconnect(sender=apps.get_model(model_label),
+                                     dispatch_uid="update_precomputed_thumbnails_{}".format(model_label))
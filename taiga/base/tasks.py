@@ -0,0 +1,46 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.apps import apps
+from django.conf import settings
+
+from taiga.base.signals import thumbnails_updated
+from taiga.base.utils.thumbnails import generate_thumbnails
+from taiga.celery import app
+
+
+@app.task
+def update_thumbnails(model_label, pk):
+    model = apps.get_model(model_label)
+    field_name, aliases = settings.THN_PRECOMPUTED[model_label]
+
+    obj = model.objects.filter(pk=pk).only("pk", field_name).first()
+    if obj is None:
+        return None
+
+    file_obj = getattr(obj, field_name)
+    if not file_obj:
+        return None
+
+    thumbnails = generate_thumbnails(file_obj, aliases)
+
+    # The file could have been changed meanwhile, in this case the new one
+    # has its own update pending.
+    if model.objects.filter(pk=pk, **{field_name: file_obj.name}).update(thumbnails=thumbnails):
+        # The update doesn't send the post_save signal
+        thumbnails_updated.send(sender=model, instance=obj)
+    return thumbnails
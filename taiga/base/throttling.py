@@ -18,9 +18,9 @@
 from taiga.base.api import throttling
 
 
-class AnonRateThrottle(throttling.AnonRateThrottle):
+class AnonRateThrottle(throttling.SlidingWindowRateThrottle, throttling.AnonRateThrottle):
     scope = "anon"
 
 
-class UserRateThrottle(throttling.UserRateThrottle):
+class UserRateThrottle(throttling.SlidingWindowRateThrottle, throttling.UserRateThrottle):
     scope = "user"
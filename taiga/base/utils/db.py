@@ -72,6 +72,29 @@ def reload_attribute(model_instance, attr_name):
     return qs.values_list(attr_name, flat=True)[0]
 
 
+def exclude_fields_on_save(model_instance, excluded_fields, save_kwargs):
+    """Update the `save()` keyword arguments of an already stored model instance
+    so the `excluded_fields` are not written.
+
+    Useful for fields that are maintained with relative updates (`F()` expressions)
+    and never have to be overwritten with the, maybe outdated, in-memory values.
+
+    :param model_instance: Model instance.
+    :param excluded_fields: Names of the fields to preserve.
+    :param save_kwargs: Keyword arguments of the `save()` call.
+    """
+    if (model_instance._state.adding or save_kwargs.get("force_insert") or
+            save_kwargs.get("update_fields") is not None):
+        return save_kwargs
+
+    deferred_fields = model_instance.get_deferred_fields()
+    save_kwargs["update_fields"] = [field.name for field in model_instance._meta.concrete_fields
+                                    if not field.primary_key and
+                                       field.name not in excluded_fields and
+                                       field.attname not in deferred_fields]
+    return save_kwargs
+
+
 @transaction.atomic
 def save_in_bulk(instances, callback=None, precall=None, **save_options):
     """Save a list of model instances.
@@ -40,3 +40,20 @@ def get_file_path(instance, filename, base_path):
     hash_part = path.join(p1, p2, p3, p4, "".join(p5))
 
     return path.join(base_path, hash_part, basename)
+
+
+def get_file_sha1(file, blocksize=65536):
+    """Calculate the sha1 of a file object reading it in blocks, so the memory
+    used doesn't depend on the size of the file.
+
+    :return: A tuple with the hex digest and the number of bytes read.
+    """
+    hasher = hashlib.sha1()
+    size = 0
+    while True:
+        buff = file.read(blocksize)
+        if not buff:
+            break
+        hasher.update(buff)
+        size += len(buff)
+    return hasher.hexdigest(), size
@@ -57,3 +57,21 @@ def iter_queryset(queryset, itersize:int=20):
         page = paginator.page(page_num)
         for element in page.object_list:
             yield element
+
+
+def iter_queryset_by_chunks(queryset, chunk_size:int=500):
+    """
+    Iterate over all the objects of a queryset loading them in
+    chunks of `chunk_size` elements.
+
+    Only the ids of the whole queryset are kept in memory; every chunk
+    is fetched with its own query so `select_related`, `prefetch_related`
+    and `extra` are applied per chunk and the original ordering is kept.
+    """
+    ids = list(queryset.values_list("id", flat=True))
+    for start in range(0, len(ids), chunk_size):
+        chunk_ids = ids[start:start + chunk_size]
+        objects = {obj.id: obj for obj in queryset.filter(id__in=chunk_ids)}
+        for id in chunk_ids:
+            if id in objects:
+                yield objects[id]
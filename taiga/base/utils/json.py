@@ -15,15 +15,93 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from django.conf import settings
 from django.utils.encoding import force_text
 
 from taiga.base.api.utils import encoders
 
+import functools
+import importlib
 import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+
+class StdlibBackend:
+    """
+    Json backend based on the json module of the standard library.
+    """
+    def dumps(self, data, *, ensure_ascii=True, indent=None, default=encoders.encode_default):
+        return json.dumps(data, default=default, ensure_ascii=ensure_ascii, indent=indent)
+
+
+_NON_ASCII_RE = re.compile(r"[\x7f-\U0010ffff]")
+
+
+def _escape_non_ascii_char(match):
+    code = ord(match.group())
+    if code < 0x10000:
+        return "\\u{:04x}".format(code)
+    code -= 0x10000
+    return "\\u{:04x}\\u{:04x}".format(0xd800 | (code >> 10), 0xdc00 | (code & 0x3ff))
+
+
+class OrjsonBackend:
+    """
+    Json backend based on orjson, a json library written in Rust. Values
+    that the stdlib json module doesn't know how to encode (datetimes,
+    decimals, lazy strings...) are encoded exactly as the stdlib backend
+    does, but the output is written without whitespace between items,
+    floats use the shortest notation (1e20 instead of 1e+20) and NaN and
+    Infinity are encoded as null.
+
+    Indented output and the integers that don't fit in 64 bits are
+    delegated to the stdlib backend.
+    """
+    def __init__(self):
+        import orjson
+        self.orjson = orjson
+        self.options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        self.fallback = StdlibBackend()
+
+    def dumps(self, data, *, ensure_ascii=True, indent=None, default=encoders.encode_default):
+        if indent is not None:
+            return self.fallback.dumps(data, ensure_ascii=ensure_ascii, indent=indent, default=default)
+
+        try:
+            ret = self.orjson.dumps(data, default=default, option=self.options).decode("utf-8")
+        except self.orjson.JSONEncodeError:
+            return self.fallback.dumps(data, ensure_ascii=ensure_ascii, indent=indent, default=default)
+
+        if ensure_ascii and not ret.isascii():
+            ret = _NON_ASCII_RE.sub(_escape_non_ascii_char, ret)
+        return ret
+
+
+@functools.lru_cache(maxsize=None)
+def _get_backend(path):
+    module_name, class_name = path.rsplit(".", 1)
+    try:
+        return getattr(importlib.import_module(module_name), class_name)()
+    except ImportError:
+        logger.info("Json backend %s is not available, using the stdlib one", path)
+        return StdlibBackend()
+
+
+def get_backend():
+    """
+    Return the json backend configured in the JSON_BACKEND setting. If its
+    library is not installed the stdlib backend is used.
+    """
+    return _get_backend(getattr(settings, "JSON_BACKEND", "taiga.base.utils.json.StdlibBackend"))
 
 
 def dumps(data, ensure_ascii=True, encoder_class=encoders.JSONEncoder, indent=None):
-    return json.dumps(data, cls=encoder_class, ensure_ascii=ensure_ascii, indent=indent)
+    if encoder_class is not encoders.JSONEncoder:
+        return json.dumps(data, cls=encoder_class, ensure_ascii=ensure_ascii, indent=indent)
+    return get_backend().dumps(data, ensure_ascii=ensure_ascii, indent=indent)
 
 
 def loads(data):
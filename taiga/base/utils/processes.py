@@ -0,0 +1,51 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent import futures
+import multiprocessing
+
+from django.db import connection, connections
+
+
+class ProcessPoolExecutor(futures.ProcessPoolExecutor):
+    """
+    A `concurrent.futures.ProcessPoolExecutor` safe to use with the
+    database.
+
+    The worker processes are forked when the tasks are submitted and a
+    forked process can't share the database connections of its parent,
+    so they are closed before every submit and each process opens its
+    own ones when it needs them.
+    """
+    def submit(self, *args, **kwargs):
+        connections.close_all()
+        return super().submit(*args, **kwargs)
+
+
+def get_process_pool_executor(workers):
+    """
+    Get a `ProcessPoolExecutor` with `workers` processes, or None if
+    the work has to be done in the current process: with only one
+    worker, inside a transaction (the workers couldn't see its changes
+    and closing the connection would break it) or in a daemonic process
+    like the celery workers, that can't have children.
+    """
+    if workers <= 1 or connection.in_atomic_block:
+        return None
+    if multiprocessing.current_process().daemon:
+        return None
+    return ProcessPoolExecutor(max_workers=workers)
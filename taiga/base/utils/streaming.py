@@ -0,0 +1,42 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Anler Hernández <hello@anler.me>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+
+
+class _EchoBuffer:
+    """
+    File-like object that returns the written value instead of
+    storing it, so a csv writer can be used as a row formatter.
+    """
+    def write(self, value):
+        return value
+
+
+def iter_csv(fieldnames:list, rows):
+    """
+    A generator that formats `rows` (an iterable of dicts) as csv
+    lines, starting with a header line built from `fieldnames`.
+
+    Nothing is accumulated in memory so it can be used as the content
+    of a `StreamingHttpResponse`.
+    """
+    writer = csv.DictWriter(_EchoBuffer(), fieldnames=fieldnames)
+    yield writer.writerow(dict(zip(fieldnames, fieldnames)))
+    for row in rows:
+        yield writer.writerow(row)
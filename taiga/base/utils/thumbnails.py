@@ -29,3 +29,42 @@ def get_thumbnail_url(file_obj, thumbnailer_size):
         thumb_url = None
 
     return thumb_url
+
+
+def generate_thumbnails(file_obj, aliases):
+    """
+    Generate the `aliases` thumbnails of `file_obj` and return them in the
+    format of the `thumbnails` field of the models in THN_PRECOMPUTED:
+
+    {"source": <file name>, <alias>: <thumbnail url or None>, ...}
+    """
+    thumbnails = {"source": file_obj.name}
+    thumbnailer = get_thumbnailer(file_obj)
+    for alias in aliases:
+        try:
+            thumbnails[alias] = thumbnailer[alias].url
+        except InvalidImageFormatError:
+            # Not an image, the rest of the aliases will fail too
+            thumbnails.update({alias: None for alias in aliases if alias not in thumbnails})
+            break
+
+    return thumbnails
+
+
+def are_thumbnails_fresh(thumbnails, file_obj):
+    # `file_obj` can be a FieldFile or the file name got from a raw query
+    file_name = getattr(file_obj, "name", file_obj)
+    return bool(thumbnails) and thumbnails.get("source") == file_name
+
+
+def get_stored_thumbnail_url(thumbnails, file_obj, thumbnailer_size):
+    """
+    Get the thumbnail url from the precomputed `thumbnails` of a model. If they
+    are missing or belong to a previous file the thumbnail is generated inline.
+    """
+    if are_thumbnails_fresh(thumbnails, file_obj) and thumbnailer_size in thumbnails:
+        path_url = thumbnails[thumbnailer_size]
+        return get_absolute_url(path_url) if path_url else None
+
+    return get_thumbnail_url(file_obj, thumbnailer_size)
+
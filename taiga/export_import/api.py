@@ -15,7 +15,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import codecs
 import uuid
 
 from django.utils.decorators import method_decorator
@@ -63,16 +62,21 @@ class ProjectExporterViewSet(mixins.ImportThrottlingPolicyMixin, GenericViewSet)
         project = get_object_or_404(self.get_queryset(), pk=pk)
         self.check_permissions(request, 'export_project', project)
 
+        dump_format = request.QUERY_PARAMS.get("dump_format", "json")
+        if dump_format not in tasks.DUMP_FORMATS:
+            raise exc.WrongArguments(_("Invalid dump format"))
+
         if settings.CELERY_ENABLED:
-            task = tasks.dump_project.delay(request.user, project)
-            tasks.delete_project_dump.apply_async((project.pk, project.slug, task.id),
-                                                  countdown=settings.EXPORTS_TTL)
+            task = tasks.dump_project.delay(request.user, project, dump_format)
+            delete_args = (project.pk, project.slug, task.id)
+            if dump_format != "json":
+                delete_args += (dump_format,)
+            tasks.delete_project_dump.apply_async(delete_args, countdown=settings.EXPORTS_TTL)
             return response.Accepted({"export_id": task.id})
 
-        path = "exports/{}/{}-{}.json".format(project.pk, project.slug, uuid.uuid4().hex)
+        path = tasks.get_dump_path(project.pk, project.slug, uuid.uuid4().hex, dump_format)
         storage_path = default_storage.path(path)
-        with default_storage.open(storage_path, mode="w") as outfile:
-            services.render_project(project, outfile)
+        tasks.render_dump(project, storage_path, dump_format)
 
         response_data = {
             "url": default_storage.url(path)
@@ -308,10 +312,10 @@ class ProjectImporterViewSet(mixins.ImportThrottlingPolicyMixin, CreateModelMixi
         if not dump:
             raise exc.WrongArguments(_("Needed dump file"))
 
-        reader = codecs.getreader("utf-8")
+        dump_file = dump
 
         try:
-            dump = json.load(reader(dump))
+            dump = services.load_dump(dump_file)
         except Exception:
             raise exc.WrongArguments(_("Invalid dump format"))
 
@@ -337,7 +341,10 @@ class ProjectImporterViewSet(mixins.ImportThrottlingPolicyMixin, CreateModelMixi
 
         # Async mode
         if settings.CELERY_ENABLED:
-            task = tasks.load_project_dump.delay(user, dump)
+            dump_file.seek(0)
+            dump_format = services.get_dump_format(dump_file)
+            path = default_storage.save(tasks.get_import_path(uuid.uuid4().hex, dump_format), dump_file)
+            task = tasks.load_project_dump_from_file.delay(user, path)
             return response.Accepted({"import_id": task.id})
 
         # Sync mode
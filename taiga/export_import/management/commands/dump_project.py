@@ -19,6 +19,7 @@ from django.core.management.base import BaseCommand, CommandError
 
 from taiga.projects.models import Project
 from taiga.export_import.services import render_project
+from taiga.export_import.services import render_project_archive
 
 import os
 
@@ -38,6 +39,19 @@ class Command(BaseCommand):
                             metavar="DIR",
                             help="Directory to save the json files. ('./' by default)")
 
+        parser.add_argument("-a", "--archive",
+                            action="store_true",
+                            dest="archive",
+                            default=False,
+                            help="Generate a .tar.gz archive with ndjson sections and attached files instead of json")
+
+        parser.add_argument("-w", "--workers",
+                            action="store",
+                            dest="workers",
+                            type=int,
+                            default=None,
+                            help="Number of processes used to render the archive sections")
+
     def handle(self, *args, **options):
         dst_dir = options["dst_dir"]
 
@@ -55,8 +69,13 @@ class Command(BaseCommand):
             except Project.DoesNotExist:
                 raise CommandError("Project '{}' does not exist".format(project_slug))
 
-            dst_file = os.path.join(dst_dir, "{}.json".format(project_slug))
-            with open(src_file, "w") as f:
-                render_project(project, f)
+            if options["archive"]:
+                dst_file = os.path.join(dst_dir, "{}.tar.gz".format(project_slug))
+                with open(dst_file, "wb") as f:
+                    render_project_archive(project, f, workers=options["workers"])
+            else:
+                dst_file = os.path.join(dst_dir, "{}.json".format(project_slug))
+                with open(dst_file, "w") as f:
+                    render_project(project, f)
 
-            print("-> Generate dump of project '{}' in '{}'".format(project.name, src_file))
+            print("-> Generate dump of project '{}' in '{}'".format(project.name, dst_file))
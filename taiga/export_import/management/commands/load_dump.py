@@ -15,14 +15,18 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import uuid
+
+from django.core.files import File
+from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.db.models import signals
 from optparse import make_option
 
-from taiga.base.utils import json
-from taiga.export_import.import services
-from taiga.export_import.exceptions as err
+from taiga.export_import import services
+from taiga.export_import import exceptions as err
+from taiga.export_import import tasks
 from taiga.export_import.renderers import ExportRenderer
 from taiga.projects.models import Project
 from taiga.users.models import User
@@ -39,34 +43,79 @@ class Command(BaseCommand):
                     dest='overwrite',
                     default=False,
                     help='Delete project if exists'),
+        make_option('--async',
+                    action='store_true',
+                    dest='async',
+                    default=False,
+                    help='Load the dump in a celery worker'),
+        make_option('--resume',
+                    action='store_true',
+                    dest='resume',
+                    default=False,
+                    help='Commit every import step and resume an interrupted import'),
         )
 
-    def handle(self, *args, **options):
-        data = json.loads(open(args[0], 'r').read())
+    def _print_progress(self, step_name, step, total_steps):
+        print("[{}/{}] {} imported".format(step, total_steps, step_name))
+
+    def _delete_project(self, slug):
+        receivers_back = signals.post_delete.receivers
+        signals.post_delete.receivers = []
         try:
-            with transaction.atomic():
-                if options["overwrite"]:
-                    receivers_back = signals.post_delete.receivers
-                    signals.post_delete.receivers = []
-                    try:
-                        proj = Project.objects.get(slug=data.get("slug", "not a slug"))
-                        proj.tasks.all().delete()
-                        proj.user_stories.all().delete()
-                        proj.issues.all().delete()
-                        proj.memberships.all().delete()
-                        proj.roles.all().delete()
-                        proj.delete()
-                    except Project.DoesNotExist:
-                        pass
-                    signals.post_delete.receivers = receivers_back
+            proj = Project.objects.get(slug=slug)
+            proj.tasks.all().delete()
+            proj.user_stories.all().delete()
+            proj.issues.all().delete()
+            proj.memberships.all().delete()
+            proj.roles.all().delete()
+            proj.delete()
+        except Project.DoesNotExist:
+            pass
+        signals.post_delete.receivers = receivers_back
+
+    def handle(self, *args, **options):
+        user = User.objects.get(email=args[1])
+
+        if options["async"]:
+            with open(args[0], "rb") as dump_file:
+                path = default_storage.save(tasks.get_import_path(uuid.uuid4().hex), File(dump_file))
+            task = tasks.load_project_dump_from_file.delay(user, path)
+            print("Loading dump in background (task id: {})".format(task.id))
+            return
+
+        with open(args[0], "rb") as dump_file:
+            data = services.load_dump(dump_file)
+
+            if options["resume"]:
+                # Every import step is commited on its own so the import
+                # can continue from the last completed one.
+                checkpoint = services.stream.ImportCheckpoint("{}.checkpoint".format(args[0]))
+                if checkpoint.project_id is None and options["overwrite"]:
+                    self._delete_project(data.get("slug", "not a slug"))
+
+                try:
+                    services.store_project_from_dict(data, user, progress=self._print_progress,
+                                                     checkpoint=checkpoint)
+                except err.TaigaImportError as e:
+                    print("ERROR:", end=" ")
+                    print(e.message)
+                    print(services.store.get_errors())
+                    print("Fix the error and run the command again to resume the import")
+                else:
+                    checkpoint.clear()
+                return
+
+            try:
+                with transaction.atomic():
+                    if options["overwrite"]:
+                        self._delete_project(data.get("slug", "not a slug"))
 
-                user = User.objects.get(email=args[1])
-                services.store_project_from_dict(data, user)
-        except err.TaigaImportError as e:
-            if e.project:
-                e.project.delete_related_content()
-                e.project.delete()
+                    services.store_project_from_dict(data, user, progress=self._print_progress)
+            except err.TaigaImportError as e:
+                if e.project:
+                    e.project.delete_related_content()
+                    e.project.delete()
 
-            print("ERROR:", end=" ")
-            print(e.message)
-            print(services.store.get_errors())
+                print("ERROR:", end=" ")
+                print(e.message)
+                print(services.store.get_errors())
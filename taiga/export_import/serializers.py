@@ -22,6 +22,7 @@ from collections import OrderedDict
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.files import File
 from django.core.files.base import ContentFile
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import ValidationError
@@ -68,6 +69,10 @@ class FileField(serializers.WritableField):
         if not data:
             return None
 
+        if isinstance(data, File):
+            # Already decoded by the streaming dump loader
+            return data
+
         decoded_data = b''
         # The original file was encoded by chunks but we don't really know its
         # length or if it was multiple of 3 so we must iterate over all those chunks
@@ -313,7 +318,7 @@ class AttachmentExportSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = attachments_models.Attachment
-        exclude = ('id', 'content_type', 'object_id', 'project')
+        exclude = ('id', 'content_type', 'object_id', 'project', 'thumbnails')
 
 
 class AttachmentExportSerializerMixin(serializers.ModelSerializer):
@@ -531,7 +536,7 @@ class MilestoneExportSerializer(WatcheableObjectModelSerializer):
 
     class Meta:
         model = milestones_models.Milestone
-        exclude = ('id', 'project')
+        exclude = ('id', 'project', 'total_user_stories', 'closed_user_stories', 'total_tasks', 'closed_tasks')
 
 
 class TaskExportSerializer(CustomAttributesValuesExportSerializerMixin, HistoryExportSerializerMixin,
@@ -545,7 +550,7 @@ class TaskExportSerializer(CustomAttributesValuesExportSerializerMixin, HistoryE
 
     class Meta:
         model = tasks_models.Task
-        exclude = ('id', 'project')
+        exclude = ('id', 'project', 'total_voters', 'total_watchers', 'watchers_ids')
 
     def custom_attributes_queryset(self, project):
         return project.taskcustomattributes.all()
@@ -563,7 +568,8 @@ class UserStoryExportSerializer(CustomAttributesValuesExportSerializerMixin, His
 
     class Meta:
         model = userstories_models.UserStory
-        exclude = ('id', 'project', 'points', 'tasks')
+        exclude = ('id', 'project', 'points', 'tasks', 'total_tasks', 'closed_tasks', 'total_points',
+                   'total_voters', 'total_watchers', 'watchers_ids')
 
     def custom_attributes_queryset(self, project):
         return project.userstorycustomattributes.all()
@@ -583,7 +589,7 @@ class IssueExportSerializer(CustomAttributesValuesExportSerializerMixin, History
 
     class Meta:
         model = issues_models.Issue
-        exclude = ('id', 'project')
+        exclude = ('id', 'project', 'total_voters', 'total_watchers', 'watchers_ids')
 
     def get_votes(self, obj):
         return [x.email for x in votes_service.get_voters(obj)]
@@ -677,4 +683,4 @@ class ProjectExportSerializer(WatcheableObjectModelSerializer):
 
     class Meta:
         model = projects_models.Project
-        exclude = ('id', 'creation_template', 'members')
+        exclude = ('id', 'creation_template', 'members', 'thumbnails')
@@ -19,8 +19,13 @@
 # is not the baddest practice ;)
 
 from .render import render_project
+from .render import render_project_archive
 from . import render
 
 from .store import store_project_from_dict
 from . import store
 
+from .stream import get_dump_format
+from .stream import load_dump
+from . import stream
+
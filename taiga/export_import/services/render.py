@@ -20,17 +20,28 @@
 
 import base64
 import gc
+import io
 import os
+import shutil
+import tarfile
+import tempfile
 
+from django.conf import settings
 from django.core.files.storage import default_storage
 
 from taiga.base.utils import json
+from taiga.base.utils.processes import get_process_pool_executor
 from taiga.timeline.service import get_project_timeline
 from taiga.base.api.fields import get_component
+from taiga.projects.models import Project
 
 from .. import serializers
 
 
+ARCHIVE_FORMAT_VERSION = 1
+ARCHIVE_SECTIONS = ["wiki_pages", "user_stories", "tasks", "issues", "timeline"]
+
+
 def render_project(project, outfile, chunk_size = 8190):
     serializer = serializers.ProjectExportSerializer(project)
     outfile.write('{\n')
@@ -122,3 +133,165 @@ def render_project(project, outfile, chunk_size = 8190):
 
     outfile.write(']}\n')
 
+
+
+########################################################################
+## Archive format (gzip compressed tar with ndjson sections)
+########################################################################
+#
+# The archive contains these members:
+#
+#   - manifest.json: format version and list of sections.
+#   - project.json: the project data without the sections.
+#   - <section>.ndjson: one serialized object per line for every
+#     section in ARCHIVE_SECTIONS.
+#   - attachments/...: the raw content of the attached files. In the
+#     serialized objects `attached_file` is {"name": ..., "path": ...}
+#     where `path` is the name of the archive member (or None if the
+#     file was missing in the storage).
+
+def _attachment_member_name(section, attachment):
+    return "attachments/{}/{}/{}".format(section, attachment.id,
+                                         os.path.basename(attachment.attached_file.name))
+
+
+def _render_archive_attachments(section, item):
+    attachments_data = []
+    attachments_files = []
+    for attachment in item.attachments.iterator():
+        attachment_serializer = serializers.AttachmentExportSerializer(instance=attachment)
+        attachment_serializer.fields.pop("attached_file")
+        attachment_data = dict(attachment_serializer.data)
+
+        storage_name = attachment.attached_file.name
+        member_name = None
+        if storage_name and default_storage.exists(storage_name):
+            member_name = _attachment_member_name(section, attachment)
+            attachments_files.append((member_name, storage_name))
+
+        attachment_data["attached_file"] = {
+            "name": os.path.basename(storage_name or ""),
+            "path": member_name,
+        }
+        attachments_data.append(attachment_data)
+
+    return attachments_data, attachments_files
+
+
+def _render_archive_section(project_id, section, dst_path):
+    """
+    Serialize a section of the project in `dst_path` (an object per line).
+
+    It can run in a worker process so it receives the project id and
+    returns the list of (<archive member name>, <storage name>) of the
+    attached files to be added to the archive.
+    """
+    project = Project.objects.get(id=project_id)
+    attachments_files = []
+
+    with open(dst_path, "w") as outfile:
+        if section == "timeline":
+            for timeline_item in get_project_timeline(project).iterator():
+                outfile.write(json.dumps(serializers.TimelineExportSerializer(timeline_item).data))
+                outfile.write("\n")
+            return attachments_files
+
+        serializer = serializers.ProjectExportSerializer(project)
+        field = serializer.fields.get(section)
+        field.initialize(parent=serializer, field_name=section)
+        field.fields.pop("attachments", None)
+
+        for item in get_component(project, section).iterator():
+            item_data = field.to_native(item)
+            item_data["attachments"], item_attachments_files = _render_archive_attachments(section, item)
+            attachments_files += item_attachments_files
+
+            outfile.write(json.dumps(item_data))
+            outfile.write("\n")
+
+    return attachments_files
+
+
+def _render_archive_project_data(project):
+    serializer = serializers.ProjectExportSerializer(project)
+    data = {}
+    attachments_files = []
+
+    for field_name, field in serializer.fields.items():
+        if field_name in ARCHIVE_SECTIONS:
+            continue
+
+        field.initialize(parent=serializer, field_name=field_name)
+        if field_name == "logo":
+            logo_name = project.logo.name if project.logo else None
+            if logo_name and default_storage.exists(logo_name):
+                member_name = "attachments/logo/{}".format(os.path.basename(logo_name))
+                attachments_files.append((member_name, logo_name))
+                data["logo"] = {"name": os.path.basename(logo_name), "path": member_name}
+            else:
+                data["logo"] = None
+            continue
+
+        data[field_name] = field.field_to_native(project, field_name)
+
+    return data, attachments_files
+
+
+def _add_bytes_to_archive(archive, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    archive.addfile(info, io.BytesIO(data))
+
+
+def _add_storage_file_to_archive(archive, name, storage_name):
+    info = tarfile.TarInfo(name)
+    info.size = default_storage.size(storage_name)
+    with default_storage.open(storage_name) as f:
+        archive.addfile(info, f)
+
+
+def _render_archive_sections(project, sections_paths, workers):
+    executor = get_process_pool_executor(workers)
+    if executor is not None:
+        with executor:
+            futures = [executor.submit(_render_archive_section, project.id, section, path)
+                       for section, path in sections_paths]
+            return [future.result() for future in futures]
+
+    return [_render_archive_section(project.id, section, path) for section, path in sections_paths]
+
+
+def render_project_archive(project, outfile, workers=None):
+    """
+    Write a dump of `project` in the archive format in `outfile` (a binary
+    file object). The sections are serialized in parallel using `workers`
+    processes (settings.EXPORTS_ARCHIVE_WORKERS by default), unless it's
+    called from a daemonic process (the celery workers) or a transaction.
+    """
+    if workers is None:
+        workers = getattr(settings, "EXPORTS_ARCHIVE_WORKERS", 1)
+
+    tmp_dir = tempfile.mkdtemp(prefix="taiga-export-")
+    try:
+        sections_paths = [(section, os.path.join(tmp_dir, "{}.ndjson".format(section)))
+                          for section in ARCHIVE_SECTIONS]
+        sections_attachments_files = _render_archive_sections(project, sections_paths, workers)
+        project_data, attachments_files = _render_archive_project_data(project)
+
+        manifest = {
+            "version": ARCHIVE_FORMAT_VERSION,
+            "sections": ARCHIVE_SECTIONS,
+        }
+
+        with tarfile.open(fileobj=outfile, mode="w|gz") as archive:
+            _add_bytes_to_archive(archive, "manifest.json", json.dumps(manifest).encode("utf-8"))
+            _add_bytes_to_archive(archive, "project.json", json.dumps(project_data).encode("utf-8"))
+
+            for section, path in sections_paths:
+                archive.add(path, arcname="{}.ndjson".format(section))
+
+            for section_attachments_files in [attachments_files] + sections_attachments_files:
+                for member_name, storage_name in section_attachments_files:
+                    _add_storage_file_to_archive(archive, member_name, storage_name)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
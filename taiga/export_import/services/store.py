@@ -21,18 +21,22 @@
 import os
 import uuid
 
+from collections import OrderedDict
+
 from unidecode import unidecode
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.template.defaultfilters import slugify
 from django.utils.translation import ugettext as _
 
 from taiga.projects.history.services import make_key_from_model_object, take_snapshot
-from taiga.projects.models import Membership
+from taiga.projects.models import Membership, Project
 from taiga.projects.references import sequences as seq
 from taiga.projects.references import models as refs
 from taiga.projects.userstories.models import RolePoints
+from taiga.projects.userstories import services as us_services
 from taiga.projects.services import find_invited_user
 from taiga.timeline.service import build_project_namespace
 from taiga.users import services as users_service
@@ -66,6 +70,95 @@ def reset_errors():
     _errors_log.clear()
 
 
+########################################################################
+## Import context
+########################################################################
+
+BULK_CREATE_BATCH_SIZE = 500
+
+
+class ImportContext:
+    """
+    State of a whole project import: the objects waiting to be inserted with
+    `bulk_create` and the references waiting to be set in the sequences.
+    Every import has its own context so concurrent imports don't share
+    anything.
+    """
+    def __init__(self, bulk_create=True):
+        self.bulk_create = bulk_create
+        self._bulk_create_buffer = OrderedDict()
+        self._sequences_max = {}
+        self._objects_without_ref = []
+
+    def save_or_bulk_create(self, obj):
+        """
+        Save `obj` or, with `bulk_create` enabled, add it to the buffer of
+        objects that will be inserted with `bulk_create` (without calling
+        `save()` and without sending signals).
+        """
+        if not self.bulk_create:
+            obj.save()
+            return
+
+        objs = self._bulk_create_buffer.setdefault(obj.__class__, [])
+        objs.append(obj)
+        if len(objs) >= BULK_CREATE_BATCH_SIZE:
+            self.flush_bulk_create(obj.__class__)
+
+    def flush_bulk_create(self, model=None):
+        models = [model] if model else list(self._bulk_create_buffer.keys())
+        for model in models:
+            objs = self._bulk_create_buffer.pop(model, [])
+            if objs:
+                model.objects.bulk_create(objs, batch_size=BULK_CREATE_BATCH_SIZE)
+
+    def add_ref(self, project, ref):
+        sequence_name = refs.make_sequence_name(project)
+        self._sequences_max[sequence_name] = max(self._sequences_max.get(sequence_name, 0), ref)
+
+    def add_object_without_ref(self, obj):
+        self._objects_without_ref.append(obj)
+
+    def set_references(self):
+        """
+        Move the references sequences beyond the refs added, once per
+        sequence, and then give a new ref to the objects without one.
+        """
+        for sequence_name, ref in self._sequences_max.items():
+            if not seq.exists(sequence_name):
+                seq.create(sequence_name)
+            seq.set_max(sequence_name, ref)
+        self._sequences_max.clear()
+
+        for obj in self._objects_without_ref:
+            obj.ref, _ = refs.make_reference(obj, obj.project)
+            obj.save()
+        self._objects_without_ref.clear()
+
+
+def _save_or_bulk_create(obj, context=None):
+    if context is None:
+        obj.save()
+    else:
+        context.save_or_bulk_create(obj)
+
+
+def _set_reference(project, obj, context=None):
+    if context is not None:
+        if obj.ref:
+            context.add_ref(project, obj.ref)
+        else:
+            context.add_object_without_ref(obj)
+    elif obj.ref:
+        sequence_name = refs.make_sequence_name(project)
+        if not seq.exists(sequence_name):
+            seq.create(sequence_name)
+        seq.set_max(sequence_name, obj.ref)
+    else:
+        obj.ref, _ = refs.make_reference(obj, project)
+        obj.save()
+
+
 ########################################################################
 ## Store functions
 ########################################################################
@@ -131,7 +224,7 @@ def _store_custom_attributes_values(obj, data_values, obj_field, serializer_clas
     return None
 
 
-def _store_attachment(project, obj, attachment):
+def _store_attachment(project, obj, attachment, context=None):
     serialized = serializers.AttachmentExportSerializer(data=attachment)
     if serialized.is_valid():
         serialized.object.content_type = ContentType.objects.get_for_model(obj.__class__)
@@ -142,20 +235,30 @@ def _store_attachment(project, obj, attachment):
         serialized.object._importing = True
         serialized.object.size = serialized.object.attached_file.size
         serialized.object.name = os.path.basename(serialized.object.attached_file.name)
-        serialized.save()
+
+        if context is not None and context.bulk_create:
+            # Store the file now, only the row insert is deferred.
+            attachment = serialized.object
+            attachment.prepare_for_insert()
+            content = attachment.attached_file.file
+            attachment.attached_file.save(attachment.name, content, save=False)
+            content.close()
+            _save_or_bulk_create(attachment, context)
+        else:
+            serialized.save()
         return serialized
     add_errors("attachments", serialized.errors)
     return serialized
 
 
-def _store_history(project, obj, history):
+def _store_history(project, obj, history, context=None):
     serialized = serializers.HistoryExportSerializer(data=history, context={"project": project})
     if serialized.is_valid():
         serialized.object.key = make_key_from_model_object(obj)
         if serialized.object.diff is None:
             serialized.object.diff = []
         serialized.object._importing = True
-        serialized.save()
+        _save_or_bulk_create(serialized.object, context)
         return serialized
     add_errors("history", serialized.errors)
     return serialized
@@ -271,7 +374,7 @@ def store_custom_attributes(project, data, field, serializer):
 
 ## MILESTONE
 
-def store_milestone(project, milestone):
+def store_milestone(project, milestone, context=None):
     serialized = serializers.MilestoneExportSerializer(data=milestone, project=project)
     if serialized.is_valid():
         serialized.object.project = project
@@ -281,41 +384,55 @@ def store_milestone(project, milestone):
 
         for task_without_us in milestone.get("tasks_without_us", []):
             task_without_us["user_story"] = None
-            store_task(project, task_without_us)
+            store_task(project, task_without_us, context)
         return serialized
 
     add_errors("milestones", serialized.errors)
     return None
 
 
-def store_milestones(project, data):
+def store_milestones(project, data, context=None):
     results = []
     for milestone_data in data.get("milestones", []):
-        milestone = store_milestone(project, milestone_data)
+        milestone = store_milestone(project, milestone_data, context)
         results.append(milestone)
     return results
 
 
 ## USER STORIES
 
-def _store_role_point(project, us, role_point):
-    serialized = serializers.RolePointsExportSerializer(data=role_point, context={"project": project})
-    if serialized.is_valid():
-        try:
-            existing_role_point = us.role_points.get(role=serialized.object.role)
-            existing_role_point.points = serialized.object.points
+def _store_role_points(project, us, role_points):
+    """
+    Create the role points of a new user story with a single insert. If
+    there is more than one value for the same role the last one is used.
+    """
+    role_points_by_role_id = OrderedDict()
+    for role_point in role_points:
+        serialized = serializers.RolePointsExportSerializer(data=role_point, context={"project": project})
+        if serialized.is_valid():
+            serialized.object.user_story = us
+            role_points_by_role_id[serialized.object.role_id] = serialized.object
+        else:
+            add_errors("role_points", serialized.errors)
+
+    existing_role_points = {rp.role_id: rp for rp in us.role_points.all()}
+    new_role_points = []
+    for role_id, role_point in role_points_by_role_id.items():
+        existing_role_point = existing_role_points.get(role_id, None)
+        if existing_role_point:
+            existing_role_point.points = role_point.points
             existing_role_point.save()
-            return existing_role_point
+        else:
+            new_role_points.append(role_point)
 
-        except RolePoints.DoesNotExist:
-            serialized.object.user_story = us
-            serialized.save()
-            return serialized.object
+    RolePoints.objects.bulk_create(new_role_points)
+    if new_role_points:
+        # bulk_create doesn't send signals
+        us_services.recalculate_total_points(user_story_ids=[us.id])
+    return list(role_points_by_role_id.values())
 
-    add_errors("role_points", serialized.errors)
-    return None
 
-def store_user_story(project, data):
+def store_user_story(project, data, context=None):
     if "status" not in data and project.default_us_status:
         data["status"] = project.default_us_status.name
 
@@ -333,24 +450,16 @@ def store_user_story(project, data):
         serialized.save()
         serialized.save_watchers()
 
-        if serialized.object.ref:
-            sequence_name = refs.make_sequence_name(project)
-            if not seq.exists(sequence_name):
-                seq.create(sequence_name)
-            seq.set_max(sequence_name, serialized.object.ref)
-        else:
-            serialized.object.ref, _ = refs.make_reference(serialized.object, project)
-            serialized.object.save()
+        _set_reference(project, serialized.object, context)
 
         for us_attachment in data.get("attachments", []):
-            _store_attachment(project, serialized.object, us_attachment)
+            _store_attachment(project, serialized.object, us_attachment, context)
 
-        for role_point in data.get("role_points", []):
-            _store_role_point(project, serialized.object, role_point)
+        _store_role_points(project, serialized.object, data.get("role_points", []))
 
         history_entries = data.get("history", [])
         for history in history_entries:
-            _store_history(project, serialized.object, history)
+            _store_history(project, serialized.object, history, context)
 
         if not history_entries:
             take_snapshot(serialized.object, user=serialized.object.owner)
@@ -369,17 +478,17 @@ def store_user_story(project, data):
     return None
 
 
-def store_user_stories(project, data):
+def store_user_stories(project, data, context=None):
     results = []
     for userstory in data.get("user_stories", []):
-        us = store_user_story(project, userstory)
+        us = store_user_story(project, userstory, context)
         results.append(us)
     return results
 
 
 ## TASKS
 
-def store_task(project, data):
+def store_task(project, data, context=None):
     if "status" not in data and project.default_task_status:
         data["status"] = project.default_task_status.name
 
@@ -394,21 +503,14 @@ def store_task(project, data):
         serialized.save()
         serialized.save_watchers()
 
-        if serialized.object.ref:
-            sequence_name = refs.make_sequence_name(project)
-            if not seq.exists(sequence_name):
-                seq.create(sequence_name)
-            seq.set_max(sequence_name, serialized.object.ref)
-        else:
-            serialized.object.ref, _ = refs.make_reference(serialized.object, project)
-            serialized.object.save()
+        _set_reference(project, serialized.object, context)
 
         for task_attachment in data.get("attachments", []):
-            _store_attachment(project, serialized.object, task_attachment)
+            _store_attachment(project, serialized.object, task_attachment, context)
 
         history_entries = data.get("history", [])
         for history in history_entries:
-            _store_history(project, serialized.object, history)
+            _store_history(project, serialized.object, history, context)
 
         if not history_entries:
             take_snapshot(serialized.object, user=serialized.object.owner)
@@ -427,17 +529,17 @@ def store_task(project, data):
     return None
 
 
-def store_tasks(project, data):
+def store_tasks(project, data, context=None):
     results = []
     for task in data.get("tasks", []):
-        task = store_task(project, task)
+        task = store_task(project, task, context)
         results.append(task)
     return results
 
 
 ## ISSUES
 
-def store_issue(project, data):
+def store_issue(project, data, context=None):
     serialized = serializers.IssueExportSerializer(data=data, context={"project": project})
 
     if "type" not in data and project.default_issue_type:
@@ -462,21 +564,14 @@ def store_issue(project, data):
         serialized.save()
         serialized.save_watchers()
 
-        if serialized.object.ref:
-            sequence_name = refs.make_sequence_name(project)
-            if not seq.exists(sequence_name):
-                seq.create(sequence_name)
-            seq.set_max(sequence_name, serialized.object.ref)
-        else:
-            serialized.object.ref, _ = refs.make_reference(serialized.object, project)
-            serialized.object.save()
+        _set_reference(project, serialized.object, context)
 
         for attachment in data.get("attachments", []):
-            _store_attachment(project, serialized.object, attachment)
+            _store_attachment(project, serialized.object, attachment, context)
 
         history_entries = data.get("history", [])
         for history in history_entries:
-            _store_history(project, serialized.object, history)
+            _store_history(project, serialized.object, history, context)
 
         if not history_entries:
             take_snapshot(serialized.object, user=serialized.object.owner)
@@ -495,16 +590,16 @@ def store_issue(project, data):
     return None
 
 
-def store_issues(project, data):
+def store_issues(project, data, context=None):
     issues = []
     for issue in data.get("issues", []):
-        issues.append(store_issue(project, issue))
+        issues.append(store_issue(project, issue, context))
     return issues
 
 
 ## WIKI PAGES
 
-def store_wiki_page(project, wiki_page):
+def store_wiki_page(project, wiki_page, context=None):
     wiki_page["slug"] = slugify(unidecode(wiki_page.get("slug", "")))
     serialized = serializers.WikiPageExportSerializer(data=wiki_page)
     if serialized.is_valid():
@@ -517,11 +612,11 @@ def store_wiki_page(project, wiki_page):
         serialized.save_watchers()
 
         for attachment in wiki_page.get("attachments", []):
-            _store_attachment(project, serialized.object, attachment)
+            _store_attachment(project, serialized.object, attachment, context)
 
         history_entries = wiki_page.get("history", [])
         for history in history_entries:
-            _store_history(project, serialized.object, history)
+            _store_history(project, serialized.object, history, context)
 
         if not history_entries:
             take_snapshot(serialized.object, user=serialized.object.owner)
@@ -532,10 +627,10 @@ def store_wiki_page(project, wiki_page):
     return None
 
 
-def store_wiki_pages(project, data):
+def store_wiki_pages(project, data, context=None):
     results = []
     for wiki_page in data.get("wiki_pages", []):
-        results.append(store_wiki_page(project, wiki_page))
+        results.append(store_wiki_page(project, wiki_page, context))
     return results
 
 
@@ -570,23 +665,23 @@ def store_tags_colors(project, data):
 
 ## TIMELINE
 
-def _store_timeline_entry(project, timeline):
+def _store_timeline_entry(project, timeline, context=None):
     serialized = serializers.TimelineExportSerializer(data=timeline, context={"project": project})
     if serialized.is_valid():
         serialized.object.project = project
         serialized.object.namespace = build_project_namespace(project)
         serialized.object.object_id = project.id
         serialized.object._importing = True
-        serialized.save()
+        _save_or_bulk_create(serialized.object, context)
         return serialized
     add_errors("timeline", serialized.errors)
     return serialized
 
 
-def store_timeline_entries(project, data):
+def store_timeline_entries(project, data, context=None):
     results = []
     for timeline in data.get("timeline", []):
-        tl = _store_timeline_entry(project, timeline)
+        tl = _store_timeline_entry(project, timeline, context)
         results.append(tl)
     return results
 
@@ -635,22 +730,19 @@ def _create_membership_for_project_owner(project):
             )
 
 
-def _populate_project_object(project, data):
-    def check_if_there_is_some_error(message=_("error importing project data"), project=None):
-        errors = get_errors(clear=False)
-        if errors:
-            raise err.TaigaImportError(message, project, errors=errors)
+IMPORT_STEPS = ["roles", "memberships", "project_attributes", "default_project_attributes",
+                "custom_attributes", "milestones", "user_stories", "tasks", "issues",
+                "wiki_pages", "wiki_links", "tags_colors", "timeline"]
 
-    # Create roles
-    store_roles(project, data)
-    check_if_there_is_some_error(_("error importing roles"), None)
 
-    # Create memberships
-    store_memberships(project, data)
-    _create_membership_for_project_owner(project)
-    check_if_there_is_some_error(_("error importing memberships"),  project)
+def _store_each(store_function, project, items, context):
+    # Unlike store_user_stories & co. it doesn't keep the results so
+    # the stored objects can be released while iterating big sections.
+    for item in items:
+        store_function(project, item, context)
+
 
-    # Create project attributes values
+def _store_project_attributes_values(project, data):
     store_project_attributes_values(project, data, "us_statuses", serializers.UserStoryStatusExportSerializer)
     store_project_attributes_values(project, data, "points", serializers.PointsExportSerializer)
     store_project_attributes_values(project, data, "task_statuses", serializers.TaskStatusExportSerializer)
@@ -658,71 +750,114 @@ def _populate_project_object(project, data):
     store_project_attributes_values(project, data, "issue_statuses", serializers.IssueStatusExportSerializer)
     store_project_attributes_values(project, data, "priorities", serializers.PriorityExportSerializer)
     store_project_attributes_values(project, data, "severities", serializers.SeverityExportSerializer)
-    check_if_there_is_some_error(_("error importing lists of project attributes"), project)
 
-    # Create default values for project attributes
-    store_default_project_attributes_values(project, data)
-    check_if_there_is_some_error(_("error importing default project attributes values"), project)
 
-    # Create custom attributes
+def _store_custom_attributes(project, data):
     store_custom_attributes(project, data, "userstorycustomattributes",
                             serializers.UserStoryCustomAttributeExportSerializer)
     store_custom_attributes(project, data, "taskcustomattributes",
                             serializers.TaskCustomAttributeExportSerializer)
     store_custom_attributes(project, data, "issuecustomattributes",
                             serializers.IssueCustomAttributeExportSerializer)
-    check_if_there_is_some_error(_("error importing custom attributes"), project)
-
-
-    # Create milestones
-    store_milestones(project, data)
-    check_if_there_is_some_error(_("error importing sprints"), project)
-
-    # Create user stories
-    store_user_stories(project, data)
-    check_if_there_is_some_error(_("error importing user stories"), project)
-
-    # Createer tasks
-    store_tasks(project, data)
-    check_if_there_is_some_error(_("error importing tasks"), project)
 
-    # Create issues
-    store_issues(project, data)
-    check_if_there_is_some_error(_("error importing issues"), project)
 
-    # Create wiki pages
-    store_wiki_pages(project, data)
-    check_if_there_is_some_error(_("error importing wiki pages"), project)
-
-    # Create wiki links
-    store_wiki_links(project, data)
-    check_if_there_is_some_error(_("error importing wiki links"), project)
+def _store_memberships(project, data):
+    store_memberships(project, data)
+    _create_membership_for_project_owner(project)
 
-    # Create tags
-    store_tags_colors(project, data)
-    check_if_there_is_some_error(_("error importing tags"), project)
 
-    # Create timeline
-    store_timeline_entries(project, data)
-    check_if_there_is_some_error(_("error importing timelines"), project)
+def _get_import_steps(project, data, context):
+    # (<step name>, <store function>, <error message>, <delete the project on error>)
+    return OrderedDict((step[0], step) for step in [
+        ("roles", lambda: store_roles(project, data),
+         _("error importing roles"), False),
+        ("memberships", lambda: _store_memberships(project, data),
+         _("error importing memberships"), True),
+        ("project_attributes", lambda: _store_project_attributes_values(project, data),
+         _("error importing lists of project attributes"), True),
+        ("default_project_attributes", lambda: store_default_project_attributes_values(project, data),
+         _("error importing default project attributes values"), True),
+        ("custom_attributes", lambda: _store_custom_attributes(project, data),
+         _("error importing custom attributes"), True),
+        ("milestones", lambda: store_milestones(project, data, context),
+         _("error importing sprints"), True),
+        ("user_stories", lambda: _store_each(store_user_story, project, data.get("user_stories", []), context),
+         _("error importing user stories"), True),
+        ("tasks", lambda: _store_each(store_task, project, data.get("tasks", []), context),
+         _("error importing tasks"), True),
+        ("issues", lambda: _store_each(store_issue, project, data.get("issues", []), context),
+         _("error importing issues"), True),
+        ("wiki_pages", lambda: _store_each(store_wiki_page, project, data.get("wiki_pages", []), context),
+         _("error importing wiki pages"), True),
+        ("wiki_links", lambda: store_wiki_links(project, data),
+         _("error importing wiki links"), True),
+        ("tags_colors", lambda: store_tags_colors(project, data),
+         _("error importing tags"), True),
+        ("timeline", lambda: _store_each(_store_timeline_entry, project, data.get("timeline", []), context),
+         _("error importing timelines"), True),
+    ])
+
+
+def _populate_project_object(project, data, context, progress=None, checkpoint=None):
+    steps = _get_import_steps(project, data, context)
+    assert list(steps.keys()) == IMPORT_STEPS
+
+    for step_number, (step_name, store, error_message, delete_project) in enumerate(steps.values(), 1):
+        if checkpoint and step_name in checkpoint.completed_steps:
+            continue
+
+        # Every step is stored atomically so an interrupted import can
+        # be resumed from the last completed one.
+        with transaction.atomic():
+            store()
+            context.flush_bulk_create()
+            context.set_references()
+
+            errors = get_errors(clear=False)
+            if errors:
+                raise err.TaigaImportError(error_message, project if delete_project else None, errors=errors)
+
+        if checkpoint:
+            checkpoint.step_done(step_name)
+
+        if progress:
+            progress(step_name, step_number, len(IMPORT_STEPS))
 
     # Regenerate stats
     project.refresh_totals()
 
 
-def store_project_from_dict(data, owner=None):
+def store_project_from_dict(data, owner=None, progress=None, checkpoint=None):
+    """
+    Create a project from a dump dict. History entries, timeline entries,
+    attachments and role points are inserted in batches.
+
+    `progress`, if given, is called as progress(<step name>, <step number>, <total steps>)
+    after each of the IMPORT_STEPS is stored.
+
+    `checkpoint`, if given, must have `project_id`, `completed_steps`,
+    `project_created(project)` and `step_done(step_name)`; it's used to
+    resume a previous import of the same dump.
+    """
     reset_errors()
+    context = ImportContext()
 
-    # Validate
-    if owner:
-        _validate_if_owner_have_enought_space_to_this_project(owner, data)
+    if checkpoint and checkpoint.project_id:
+        # Resume a previous import
+        project = Project.objects.get(id=checkpoint.project_id)
+    else:
+        # Validate
+        if owner:
+            _validate_if_owner_have_enought_space_to_this_project(owner, data)
 
-    # Create project
-    project = _create_project_object(data)
+        # Create project
+        project = _create_project_object(data)
+        if checkpoint:
+            checkpoint.project_created(project)
 
     # Populate project
     try:
-        _populate_project_object(project, data)
+        _populate_project_object(project, data, context, progress=progress, checkpoint=checkpoint)
     except err.TaigaImportError:
         # reraise known inport errors
         raise
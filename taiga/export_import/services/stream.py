@@ -0,0 +1,447 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Anler Hernández <hello@anler.me>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Incremental reader for json project dumps.
+#
+# The dump is read in two passes over the (seekable) file. The first one
+# loads every top-level field except the big sections in STREAMED_SECTIONS,
+# for which only the file offset is recorded. The second one happens while
+# storing: the items of each section are parsed one by one, so the memory
+# used is bounded by the biggest item and not by the whole dump. The base64
+# attached files of every item are decoded to temporary files.
+#
+# The archive dumps (see render_project_archive) are read in one pass over
+# the compressed tar, its members are extracted to a temporary directory
+# and the ndjson sections are parsed line by line while storing.
+
+import base64
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.utils.translation import ugettext as _
+
+from .. import exceptions as err
+from .render import ARCHIVE_FORMAT_VERSION
+
+
+STREAMED_SECTIONS = ["user_stories", "tasks", "issues", "wiki_pages", "timeline"]
+
+ARCHIVE_MAGIC_NUMBER = b"\x1f\x8b"  # gzip
+
+READ_CHUNK_SIZE = 1024 * 1024
+BASE64_DECODE_CHUNK_SIZE = 4 * 16 * 1024
+
+_WHITESPACE = b" \t\n\r"
+_CONTAINER_TOKENS_RE = re.compile(rb'["{}\[\]]')
+_STRING_TOKENS_RE = re.compile(rb'["\\]')
+_SCALAR_END_RE = re.compile(rb'[,}\]\s]')
+
+
+class DumpParseError(err.TaigaImportError):
+    def __init__(self, message):
+        super().__init__(message, None)
+
+
+class _Reader:
+    """
+    Buffered reader over a binary file that can find the limits of json
+    values without decoding them.
+    """
+    def __init__(self, fileobj, offset=0):
+        self.fileobj = fileobj
+        self.fileobj.seek(offset)
+        self.offset = offset  # File offset of buf[0]
+        self.buf = b""
+        self.pos = 0
+        self._captured = None
+        self._capture_start = None
+
+    def _fill(self):
+        data = self.fileobj.read(READ_CHUNK_SIZE)
+        if not data:
+            return False
+
+        if self._captured is not None:
+            self._captured.append(self.buf[self._capture_start:self.pos])
+            self._capture_start = 0
+
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def _ensure(self, size=1):
+        while len(self.buf) - self.pos < size:
+            if not self._fill():
+                raise DumpParseError(_("Unexpected end of the dump file"))
+
+    def tell(self):
+        return self.offset + self.pos
+
+    def next_token(self):
+        """Skip the whitespaces and return the next byte without consuming it."""
+        while True:
+            self._ensure()
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, token):
+        if self.next_token() != token:
+            raise DumpParseError(_("Invalid dump format"))
+        self.pos += 1
+
+    def _skip_string(self):
+        self.pos += 1  # Opening quote
+        while True:
+            match = _STRING_TOKENS_RE.search(self.buf, self.pos)
+            if not match:
+                self.pos = len(self.buf)
+                self._ensure()
+                continue
+
+            if match.group() == b'"':
+                self.pos = match.end()
+                return
+
+            # Escaped char, it can be in the next chunk
+            self.pos = match.start()
+            self._ensure(2)
+            self.pos += 2
+
+    def _skip_container(self):
+        depth = 0
+        while True:
+            match = _CONTAINER_TOKENS_RE.search(self.buf, self.pos)
+            if not match:
+                self.pos = len(self.buf)
+                self._ensure()
+                continue
+
+            token = match.group()
+            if token == b'"':
+                self.pos = match.start()
+                self._skip_string()
+                continue
+
+            self.pos = match.end()
+            depth += 1 if token in (b"{", b"[") else -1
+            if depth == 0:
+                return
+
+    def _skip_scalar(self):
+        while True:
+            match = _SCALAR_END_RE.search(self.buf, self.pos)
+            if match:
+                self.pos = match.start()
+                return
+
+            self.pos = len(self.buf)
+            if not self._fill():
+                return
+
+    def skip_value(self):
+        token = self.next_token()
+        if token == b'"':
+            self._skip_string()
+        elif token in (b"{", b"["):
+            self._skip_container()
+        else:
+            self._skip_scalar()
+
+    def read_value(self):
+        """Read and decode the next json value."""
+        self.next_token()
+        self._captured = []
+        self._capture_start = self.pos
+        try:
+            self.skip_value()
+            self._captured.append(self.buf[self._capture_start:self.pos])
+            raw_value = b"".join(self._captured)
+        finally:
+            self._captured = None
+            self._capture_start = None
+
+        try:
+            return json.loads(raw_value.decode("utf-8"))
+        except ValueError:
+            raise DumpParseError(_("Invalid dump format"))
+
+    def iter_object_keys(self):
+        """Iterate the keys of an object leaving the reader before each value."""
+        self.expect(b"{")
+        if self.next_token() == b"}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(b":")
+            yield key
+
+            token = self.next_token()
+            self.pos += 1
+            if token == b"}":
+                return
+            if token != b",":
+                raise DumpParseError(_("Invalid dump format"))
+
+    def iter_array_items(self):
+        self.expect(b"[")
+        if self.next_token() == b"]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.read_value()
+
+            token = self.next_token()
+            self.pos += 1
+            if token == b"]":
+                return
+            if token != b",":
+                raise DumpParseError(_("Invalid dump format"))
+
+
+def _spill_file(file_data):
+    """
+    Decode a base64 encoded file of the dump ({"data": ..., "name": ...}) into
+    a temporary file. As in FileField.from_native the data can have padding
+    in the middle because it was encoded by chunks.
+    """
+    tmp_file = tempfile.NamedTemporaryFile(prefix="taiga-import-")
+    for segment in re.finditer(r"[^=]+", file_data["data"]):
+        segment = segment.group()
+        for start in range(0, len(segment), BASE64_DECODE_CHUNK_SIZE):
+            chunk = segment[start:start + BASE64_DECODE_CHUNK_SIZE]
+            chunk += "=" * (-len(chunk) % 4)
+            tmp_file.write(base64.b64decode(chunk))
+
+    tmp_file.flush()
+    tmp_file.seek(0)
+    return File(tmp_file, name=file_data["name"])
+
+
+def _spill_attachments(item):
+    for attachment in item.get("attachments", None) or []:
+        attached_file = attachment.get("attached_file", None)
+        if isinstance(attached_file, dict) and "data" in attached_file:
+            attachment["attached_file"] = _spill_file(attached_file)
+    return item
+
+
+class StreamedSection:
+    """
+    Iterable over the items of a section of the dump. Every iteration
+    parses the section again from its offset in the file.
+    """
+    def __init__(self, fileobj, offset):
+        self.fileobj = fileobj
+        self.offset = offset
+
+    def __iter__(self):
+        reader = _Reader(self.fileobj, self.offset)
+        for item in reader.iter_array_items():
+            if isinstance(item, dict):
+                _spill_attachments(item)
+            yield item
+
+
+class StreamedDump(dict):
+    """
+    A project dump dict where the values of STREAMED_SECTIONS are
+    `StreamedSection` instances instead of lists.
+    """
+    def __init__(self, fileobj):
+        super().__init__()
+        reader = _Reader(fileobj)
+        for key in reader.iter_object_keys():
+            if key in STREAMED_SECTIONS and reader.next_token() == b"[":
+                self[key] = StreamedSection(fileobj, reader.tell())
+                reader.skip_value()
+            else:
+                self[key] = reader.read_value()
+
+
+def _open_archive_file(file_data, files_paths):
+    """
+    Get the file of an archive dump from its {"name": ..., "path": ...}.
+    As in the json dumps, the files missing when the project was exported
+    are empty.
+    """
+    name = file_data.get("name", None)
+    path = files_paths.get(file_data.get("path", None), None)
+    if path is None:
+        return ContentFile(b"", name=name)
+    return File(open(path, "rb"), name=name or os.path.basename(path))
+
+
+def _open_archive_attachments(item, files_paths):
+    for attachment in item.get("attachments", None) or []:
+        attached_file = attachment.get("attached_file", None)
+        if isinstance(attached_file, dict) and "path" in attached_file:
+            attachment["attached_file"] = _open_archive_file(attached_file, files_paths)
+    return item
+
+
+class ArchiveSection:
+    """
+    Iterable over the items of a section of an archive dump, an item
+    per line of its ndjson file.
+    """
+    def __init__(self, path, files_paths):
+        self.path = path
+        self.files_paths = files_paths
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                try:
+                    item = json.loads(line.decode("utf-8"))
+                except ValueError:
+                    raise DumpParseError(_("Invalid dump format"))
+
+                if isinstance(item, dict):
+                    _open_archive_attachments(item, self.files_paths)
+                yield item
+
+
+class ArchiveDump(dict):
+    """
+    A project dump dict read from an archive dump, the values of its
+    sections are `ArchiveSection` instances. The members of the archive
+    are kept in a temporary directory while the dump exists.
+    """
+    def __init__(self, fileobj):
+        super().__init__()
+        self._tmp_dir = tempfile.TemporaryDirectory(prefix="taiga-import-")
+
+        files_paths = {}
+        try:
+            with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+
+                    # The members are saved with their own names, not the archive ones
+                    path = os.path.join(self._tmp_dir.name, str(len(files_paths)))
+                    with open(path, "wb") as f:
+                        shutil.copyfileobj(archive.extractfile(member), f, READ_CHUNK_SIZE)
+                    files_paths[member.name] = path
+        except (tarfile.TarError, EOFError, OSError):
+            raise DumpParseError(_("Invalid dump format"))
+
+        manifest = self._load_member(files_paths, "manifest.json")
+        if manifest.get("version", None) != ARCHIVE_FORMAT_VERSION:
+            raise DumpParseError(_("Unsupported dump format version"))
+
+        self.update(self._load_member(files_paths, "project.json"))
+
+        if isinstance(self.get("logo", None), dict):
+            self["logo"] = _open_archive_file(self["logo"], files_paths)
+
+        for section in manifest.get("sections", []):
+            path = files_paths.get("{}.ndjson".format(section), None)
+            if path is None:
+                raise DumpParseError(_("Invalid dump format"))
+            self[section] = ArchiveSection(path, files_paths)
+
+    def _load_member(self, files_paths, name):
+        path = files_paths.get(name, None)
+        if path is None:
+            raise DumpParseError(_("Invalid dump format"))
+
+        try:
+            with open(path, "rb") as f:
+                data = json.loads(f.read().decode("utf-8"))
+        except ValueError:
+            raise DumpParseError(_("Invalid dump format"))
+
+        if not isinstance(data, dict):
+            raise DumpParseError(_("Invalid dump format"))
+        return data
+
+
+def get_dump_format(fileobj):
+    """
+    Detect the format, "json" or "archive", of the project dump in a
+    seekable binary file object.
+    """
+    magic_number = fileobj.read(len(ARCHIVE_MAGIC_NUMBER))
+    fileobj.seek(0)
+
+    if magic_number == ARCHIVE_MAGIC_NUMBER:
+        return "archive"
+    return "json"
+
+
+def load_dump(fileobj):
+    """
+    Read a project dump, json or archive, from a seekable binary file
+    object. The file must remain open while the returned json dump is
+    stored.
+    """
+    if get_dump_format(fileobj) == "archive":
+        return ArchiveDump(fileobj)
+    return StreamedDump(fileobj)
+
+
+class ImportCheckpoint:
+    """
+    Keeps, in a json file, the project created by an import and its
+    completed IMPORT_STEPS, so an interrupted import can be resumed.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.project_id = None
+        self.completed_steps = set()
+
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.project_id = data.get("project_id", None)
+            self.completed_steps = set(data.get("completed_steps", []))
+
+    def _save(self):
+        tmp_path = "{}.tmp".format(self.path)
+        with open(tmp_path, "w") as f:
+            json.dump({"project_id": self.project_id,
+                       "completed_steps": sorted(self.completed_steps)}, f)
+        os.replace(tmp_path, self.path)
+
+    def project_created(self, project):
+        self.project_id = project.id
+        self._save()
+
+    def step_done(self, step_name):
+        self.completed_steps.add(step_name)
+        self._save()
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
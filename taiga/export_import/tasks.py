@@ -29,6 +29,7 @@ from django.utils.translation import ugettext as _
 from taiga.base.mails import mail_builder
 from taiga.base.utils import json
 from taiga.celery import app
+from taiga.projects.models import Project
 
 from . import exceptions as err
 from . import services
@@ -39,15 +40,35 @@ logger = logging.getLogger('taiga.export_import')
 import resource
 
 
+DUMP_FORMATS = {
+    "json": "json",
+    "archive": "tar.gz",
+}
+
+
+def get_dump_path(project_id, project_slug, task_id, dump_format="json"):
+    return "exports/{}/{}-{}.{}".format(project_id, project_slug, task_id, DUMP_FORMATS[dump_format])
+
+
+def render_dump(project, storage_path, dump_format="json", workers=None):
+    if dump_format == "archive":
+        with default_storage.open(storage_path, mode="wb") as outfile:
+            services.render_project_archive(project, outfile, workers=workers)
+    else:
+        with default_storage.open(storage_path, mode="w") as outfile:
+            services.render_project(project, outfile)
+
+
 @app.task(bind=True)
-def dump_project(self, user, project):
-    path = "exports/{}/{}-{}.json".format(project.pk, project.slug, self.request.id)
+def dump_project(self, user, project, dump_format="json"):
+    path = get_dump_path(project.pk, project.slug, self.request.id, dump_format)
     storage_path = default_storage.path(path)
 
     try:
         url = default_storage.url(path)
-        with default_storage.open(storage_path, mode="w") as outfile:
-            services.render_project(project, outfile)
+        # The celery workers are daemonic processes and can't start the
+        # workers of the archive sections (see EXPORTS_ARCHIVE_WORKERS)
+        render_dump(project, storage_path, dump_format, workers=1)
 
     except Exception:
         # Error
@@ -74,8 +95,8 @@ def dump_project(self, user, project):
 
 
 @app.task
-def delete_project_dump(project_id, project_slug, task_id):
-    default_storage.delete("exports/{}/{}-{}.json".format(project_id, project_slug, task_id))
+def delete_project_dump(project_id, project_slug, task_id, dump_format="json"):
+    default_storage.delete(get_dump_path(project_id, project_slug, task_id, dump_format))
 
 
 ADMIN_ERROR_LOAD_PROJECT_DUMP_MESSAGE = _("""
@@ -95,10 +116,14 @@ TRACE ERROR:
 ------------""")
 
 
-@app.task
-def load_project_dump(user, dump):
+def _load_project_dump(task, user, dump):
+    def progress(step_name, step, total_steps):
+        task.update_state(state="PROGRESS", meta={"step": step_name,
+                                                  "current": step,
+                                                  "total": total_steps})
+
     try:
-        project = services.store_project_from_dict(dump, user)
+        project = services.store_project_from_dict(dump, user, progress=progress)
     except err.TaigaImportError as e:
         # On Error
         ## remove project
@@ -132,3 +157,33 @@ def load_project_dump(user, dump):
         ctx = {"user": user, "project": project}
         email = mail_builder.load_dump(user, ctx)
         email.send()
+
+
+@app.task(bind=True)
+def load_project_dump(self, user, dump):
+    _load_project_dump(self, user, dump)
+
+
+def get_import_path(import_id, dump_format="json"):
+    return "imports/{}.{}".format(import_id, DUMP_FORMATS[dump_format])
+
+
+@app.task(bind=True)
+def load_project_dump_from_file(self, user, path):
+    """
+    Load a dump, json or archive, previously saved in the default storage.
+    The dump is streamed from the file instead of being sent, parsed, to
+    the worker.
+    """
+    try:
+        with default_storage.open(path, mode="rb") as dump_file:
+            dump = services.load_dump(dump_file)
+
+            slug = dump.get("slug", None)
+            if slug is not None and Project.objects.filter(slug=slug).exists():
+                del dump["slug"]
+
+            dump["owner"] = user.email
+            _load_project_dump(self, user, dump)
+    finally:
+        default_storage.delete(path)
@@ -17,6 +17,7 @@
 
 from django.conf import settings
 from django.db import models
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 
 from . import services
@@ -82,5 +83,12 @@ class ApplicationToken(models.Model):
         self.auth_code = _generate_uuid()
 
     def generate_token(self):
+        services.invalidate_application_token(self.token)
         self.auth_code = None
         self.token = _generate_uuid()
+
+
+@receiver(models.signals.post_delete, sender=ApplicationToken,
+          dispatch_uid="application_token_invalidate_cache")
+def application_token_invalidate_cache(sender, instance, **kwargs):
+    services.invalidate_application_token(instance.token)
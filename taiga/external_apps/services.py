@@ -16,24 +16,54 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from taiga.auth.tokens import get_cached_user
+from taiga.auth.tokens import is_user_cache_enabled
 from taiga.base import exceptions as exc
 from taiga.base.api.utils import get_object_or_404
 
 from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils.translation import ugettext as _
 
 from . import encryption
 
 import json
 
+def _get_application_token_cache_key(token:str) -> str:
+    return "auth-application-token:{}".format(token)
+
+
+def _get_user_id_for_application_token(token:str) -> int:
+    app_token = apps.get_model("external_apps", "ApplicationToken").objects.filter(token=token).first()
+    if not app_token:
+        raise exc.NotAuthenticated(_("Invalid token"))
+    return app_token.user_id
+
+
 def get_user_for_application_token(token:str) -> object:
     """
     Given an application token it tries to find an associated user
     """
-    app_token = apps.get_model("external_apps", "ApplicationToken").objects.filter(token=token).first()
-    if not app_token:
+    if is_user_cache_enabled():
+        key = _get_application_token_cache_key(token)
+        user_id = cache.get(key)
+        if user_id is None:
+            user_id = _get_user_id_for_application_token(token)
+            cache.set(key, user_id, settings.AUTH_USER_CACHE_TIMEOUT)
+    else:
+        user_id = _get_user_id_for_application_token(token)
+
+    try:
+        return get_cached_user(user_id)
+    except get_user_model().DoesNotExist:
         raise exc.NotAuthenticated(_("Invalid token"))
-    return app_token.user
+
+
+def invalidate_application_token(token:str):
+    if token:
+        cache.delete(_get_application_token_cache_key(token))
 
 
 def authorize_token(application_id:int, user:object, state:str) -> object:
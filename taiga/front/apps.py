@@ -0,0 +1,71 @@
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Taiga Agile LLC <support@taiga.io>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.apps import AppConfig
+from django.apps import apps
+from django.conf import settings
+from django.db.models import signals
+
+
+def _get_sitemaps_models():
+    from .sitemaps import sitemaps
+    model_labels = {sitemap_class.model for sitemap_class in sitemaps.values()
+                    if sitemap_class.model is not None}
+    return [apps.get_model(model_label) for model_label in sorted(model_labels)]
+
+
+def connect_sitemaps_signals():
+    from .sitemaps import signals as handlers
+    project_model = apps.get_model("projects", "Project")
+
+    for model in _get_sitemaps_models():
+        if model is project_model:
+            signals.pre_save.connect(handlers.store_previous_project_state,
+                                     sender=model,
+                                     dispatch_uid="sitemaps_store_previous_project_state")
+            signals.post_save.connect(handlers.update_project_sitemaps,
+                                      sender=model,
+                                      dispatch_uid="sitemaps_update_on_save_{}".format(model._meta.label))
+        else:
+            signals.post_save.connect(handlers.update_sitemaps,
+                                      sender=model,
+                                      dispatch_uid="sitemaps_update_on_save_{}".format(model._meta.label))
+        signals.post_delete.connect(handlers.update_sitemaps,
+                                    sender=model,
+                                    dispatch_uid="sitemaps_update_on_delete_{}".format(model._meta.label))
+
+
+def disconnect_sitemaps_signals():
+    project_model = apps.get_model("projects", "Project")
+
+    for model in _get_sitemaps_models():
+        if model is project_model:
+            signals.pre_save.disconnect(sender=model,
+                                        dispatch_uid="sitemaps_store_previous_project_state")
+        signals.post_save.disconnect(sender=model,
+                                     dispatch_uid="sitemaps_update_on_save_{}".format(model._meta.label))
+        signals.post_delete.disconnect(sender=model,
+                                       dispatch_uid="sitemaps_update_on_delete_{}".format(model._meta.label))
+
+
+class FrontAppConfig(AppConfig):
+    name = "taiga.front"
+    verbose_name = "Front"
+
+    def ready(self):
+        if settings.FRONT_SITEMAP_ENABLED:
+            connect_sitemaps_signals()
@@ -0,0 +1,46 @@
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Taiga Agile LLC <support@taiga.io>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from taiga.front.sitemaps import services
+from taiga.front.sitemaps import sitemaps
+
+
+class Command(BaseCommand):
+    help = "Generate again the files of the front sitemap"
+
+    def add_arguments(self, parser):
+        parser.add_argument("sections",
+                            nargs="*",
+                            help="<section section ...> (all the sections by default)")
+
+    def handle(self, *args, **options):
+        if not settings.FRONT_SITEMAP_ENABLED:
+            raise CommandError("The front sitemap is not enabled (FRONT_SITEMAP_ENABLED).")
+
+        sections = options["sections"] or list(sitemaps)
+        for section in sections:
+            if section not in sitemaps:
+                raise CommandError("Unknown section {}.".format(section))
+
+        for section in sections:
+            print("-> Generating sitemap section {}".format(section))
+            services.rebuild_section(section)
+
+        services.write_index()
@@ -19,26 +19,37 @@ from django.contrib.sitemaps import Sitemap as DjangoSitemap
 
 
 class Sitemap(DjangoSitemap):
+    # Used to maintain the pre-generated files (see `taiga.front.sitemaps.services`):
+    # the model of the items and the lookup from them to their project, if any.
+    model = None
+    project_lookup = None
+
+    def get_key(self, item):
+        """Numeric key of an item, used to place it in a sitemap file."""
+        return item.pk
+
+    def get_url_info(self, item):
+        priority = self.__get('priority', item, None)
+        return {
+            'item': item,
+            'location': self.__get('location', item),
+            'lastmod': self.__get('lastmod', item, None),
+            'changefreq': self.__get('changefreq', item, None),
+            'priority': str(priority if priority is not None else ''),
+        }
+
     def get_urls(self, page=1, site=None, protocol=None):
         urls = []
         latest_lastmod = None
         all_items_lastmod = True  # track if all items have a lastmod
         for item in self.paginator.page(page).object_list:
-            loc = self.__get('location', item)
-            priority = self.__get('priority', item, None)
-            lastmod = self.__get('lastmod', item, None)
+            url_info = self.get_url_info(item)
+            lastmod = url_info['lastmod']
             if all_items_lastmod:
                 all_items_lastmod = lastmod is not None
                 if (all_items_lastmod and
                         (latest_lastmod is None or lastmod > latest_lastmod)):
                     latest_lastmod = lastmod
-            url_info = {
-                'item': item,
-                'location': loc,
-                'lastmod': lastmod,
-                'changefreq': self.__get('changefreq', item, None),
-                'priority': str(priority if priority is not None else ''),
-            }
             urls.append(url_info)
         if all_items_lastmod and latest_lastmod:
             self.latest_lastmod = latest_lastmod
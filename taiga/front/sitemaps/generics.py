@@ -33,6 +33,9 @@ class GenericSitemap(Sitemap):
             {"url_key": "forgot-password", "changefreq": "monthly", "priority": 1}
         ]
 
+    def get_key(self, obj):
+        return [item["url_key"] for item in self.items()].index(obj["url_key"])
+
     def location(self, obj):
         return resolve(obj["url_key"])
 
@@ -24,6 +24,9 @@ from .base import Sitemap
 
 
 class IssuesSitemap(Sitemap):
+    model = "issues.Issue"
+    project_lookup = "project"
+
     def items(self):
         issue_model = apps.get_model("issues", "Issue")
 
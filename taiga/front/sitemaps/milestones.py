@@ -24,6 +24,9 @@ from .base import Sitemap
 
 
 class MilestonesSitemap(Sitemap):
+    model = "milestones.Milestone"
+    project_lookup = "project"
+
     def items(self):
         milestone_model = apps.get_model("milestones", "Milestone")
 
@@ -24,6 +24,9 @@ from .base import Sitemap
 
 
 class ProjectsSitemap(Sitemap):
+    model = "projects.Project"
+    project_lookup = "pk"
+
     def items(self):
         project_model = apps.get_model("projects", "Project")
 
@@ -51,6 +54,9 @@ class ProjectsSitemap(Sitemap):
 
 
 class ProjectBacklogsSitemap(Sitemap):
+    model = "projects.Project"
+    project_lookup = "pk"
+
     def items(self):
         project_model = apps.get_model("projects", "Project")
 
@@ -79,6 +85,9 @@ class ProjectBacklogsSitemap(Sitemap):
 
 
 class ProjectKanbansSitemap(Sitemap):
+    model = "projects.Project"
+    project_lookup = "pk"
+
     def items(self):
         project_model = apps.get_model("projects", "Project")
 
@@ -107,6 +116,9 @@ class ProjectKanbansSitemap(Sitemap):
 
 
 class ProjectIssuesSitemap(Sitemap):
+    model = "projects.Project"
+    project_lookup = "pk"
+
     def items(self):
         project_model = apps.get_model("projects", "Project")
 
@@ -135,6 +147,9 @@ class ProjectIssuesSitemap(Sitemap):
 
 
 class ProjectTeamsSitemap(Sitemap):
+    model = "projects.Project"
+    project_lookup = "pk"
+
     def items(self):
         project_model = apps.get_model("projects", "Project")
 
@@ -0,0 +1,266 @@
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Taiga Agile LLC <support@taiga.io>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Pre-generated sitemap files.
+
+Every section of the sitemap is stored in FRONT_SITEMAP_PATH as sharded files, each
+one with the items whose keys are in a range of FRONT_SITEMAP_SHARD_SIZE values. Every
+shard has a JSON file with the url info of its items, used to update it incrementally,
+and the XML file that is served. The files are updated from the signals of the models,
+in celery tasks, and can be rebuilt from scratch with the `rebuild_sitemaps` management
+command.
+"""
+
+from collections import defaultdict
+import os
+import threading
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.template import loader
+from django.utils.dateparse import parse_datetime
+
+from django_pglocks import advisory_lock
+
+from taiga.base.utils import json
+from taiga.base.utils.urls import reverse
+
+from . import sitemaps
+
+
+INDEX_FILENAME = "sitemap.xml"
+
+
+def get_shard(key):
+    return key // settings.FRONT_SITEMAP_SHARD_SIZE + 1
+
+
+def get_index_path():
+    return os.path.join(settings.FRONT_SITEMAP_PATH, INDEX_FILENAME)
+
+
+def get_shard_path(section, shard, extension="xml"):
+    return os.path.join(settings.FRONT_SITEMAP_PATH, section, "{}.{}".format(shard, extension))
+
+
+def _get_shards(section):
+    section_path = os.path.join(settings.FRONT_SITEMAP_PATH, section)
+    if not os.path.isdir(section_path):
+        return []
+
+    shards = [int(filename[:-4]) for filename in os.listdir(section_path)
+              if filename.endswith(".xml") and filename[:-4].isdigit()]
+    return sorted(shards)
+
+
+def _write_file(path, content):
+    # Written with a rename so the served files are never partially written
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+    with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+        tmp_file.write(content)
+    os.replace(tmp_path, path)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _serialize_url_info(url_info):
+    lastmod = url_info["lastmod"]
+    return {
+        "location": url_info["location"],
+        "lastmod": lastmod.isoformat() if lastmod is not None else None,
+        "changefreq": url_info["changefreq"],
+        "priority": url_info["priority"],
+    }
+
+
+def _read_shard(section, shard):
+    try:
+        with open(get_shard_path(section, shard, "json"), encoding="utf-8") as shard_file:
+            return json.loads(shard_file.read())
+    except FileNotFoundError:
+        return {}
+
+
+def _write_shard(section, shard, urls):
+    """Write the files of a shard, `urls` is a dict with the serialized url info of
+    its items by key. The files of an empty shard are removed."""
+    if not urls:
+        _remove_file(get_shard_path(section, shard))
+        _remove_file(get_shard_path(section, shard, "json"))
+        return
+
+    urlset = []
+    for key in sorted(urls, key=int):
+        url_info = dict(urls[key])
+        if url_info["lastmod"] is not None:
+            url_info["lastmod"] = parse_datetime(url_info["lastmod"])
+        urlset.append(url_info)
+
+    _write_file(get_shard_path(section, shard, "json"), json.dumps(urls))
+    _write_file(get_shard_path(section, shard), loader.render_to_string("sitemap.xml", {"urlset": urlset}))
+
+
+def write_index():
+    locations = [reverse("front-sitemap", kwargs={"section": section, "shard": shard})
+                 for section in sitemaps for shard in _get_shards(section)]
+
+    with advisory_lock("sitemaps"):
+        _write_file(get_index_path(), loader.render_to_string("sitemap_index.xml", {"sitemaps": locations}))
+
+
+def update_items(section, keys):
+    """Update the items of a sitemap section with the given keys: the visible ones are
+    added or updated and the rest are removed.
+
+    :param section: Name of the section.
+    :param keys: Keys of the items, they must be the primary keys of the section model.
+    """
+    sitemap = sitemaps[section]()
+    urls_by_shard = defaultdict(dict)
+    for key in keys:
+        urls_by_shard[get_shard(key)][str(key)] = None
+
+    for item in sitemap.items().filter(pk__in=keys):
+        key = sitemap.get_key(item)
+        urls_by_shard[get_shard(key)][str(key)] = _serialize_url_info(sitemap.get_url_info(item))
+
+    shards_changed = False
+    with advisory_lock("sitemaps:{}".format(section)):
+        for shard, shard_urls in urls_by_shard.items():
+            urls = _read_shard(section, shard)
+            new_urls = dict(urls)
+            for key, url_info in shard_urls.items():
+                if url_info is None:
+                    new_urls.pop(key, None)
+                else:
+                    new_urls[key] = url_info
+
+            if new_urls != urls:
+                _write_shard(section, shard, new_urls)
+                shards_changed = shards_changed or not urls or not new_urls
+
+    if shards_changed:
+        write_index()
+
+
+def update_project_items(project_id):
+    """Update the items of all the sections that depend on a project."""
+    for section, sitemap_class in sitemaps.items():
+        if sitemap_class.project_lookup is None:
+            continue
+
+        model = apps.get_model(sitemap_class.model)
+        keys = model.objects.filter(**{sitemap_class.project_lookup: project_id}).values_list("pk", flat=True)
+        update_items(section, list(keys))
+
+
+def rebuild_section(section):
+    """Generate again all the files of a sitemap section."""
+    sitemap = sitemaps[section]()
+    items = sitemap.items()
+    if hasattr(items, "iterator"):
+        items = items.order_by("pk").iterator()
+
+    with advisory_lock("sitemaps:{}".format(section)):
+        old_shards = set(_get_shards(section))
+        shard, urls = None, {}
+        for item in items:
+            key = sitemap.get_key(item)
+            if get_shard(key) != shard:
+                if shard is not None:
+                    _write_shard(section, shard, urls)
+                    old_shards.discard(shard)
+                shard, urls = get_shard(key), {}
+            urls[str(key)] = _serialize_url_info(sitemap.get_url_info(item))
+
+        if shard is not None:
+            _write_shard(section, shard, urls)
+            old_shards.discard(shard)
+
+        for old_shard in old_shards:
+            _write_shard(section, old_shard, {})
+
+
+def rebuild():
+    """Generate again all the sitemap files."""
+    for section in sitemaps:
+        rebuild_section(section)
+    write_index()
+
+
+####################################
+# Updates on commit
+####################################
+
+# Per thread, the callbacks run on the commit of the thread connection
+_pending = threading.local()
+
+
+def _get_pending_updates():
+    if not hasattr(_pending, "updates"):
+        _pending.updates = defaultdict(set)
+    return _pending.updates
+
+
+def _run_task(task, *args):
+    if settings.CELERY_ENABLED:
+        task.delay(*args)
+    else:
+        task(*args)
+
+
+def _run_pending_updates():
+    from taiga.front import tasks
+
+    # The updates read and write the files under a lock shared by all the
+    # servers, too much work for the request that commits the transaction.
+    pending_updates = _get_pending_updates()
+    while pending_updates:
+        section, keys = pending_updates.popitem()
+        if section == "projects:*":
+            for project_id in sorted(keys):
+                _run_task(tasks.update_project_sitemaps, project_id)
+        else:
+            keys_by_shard = defaultdict(list)
+            for key in sorted(keys):
+                keys_by_shard[get_shard(key)].append(key)
+            for shard_keys in keys_by_shard.values():
+                _run_task(tasks.update_sitemaps, section, shard_keys)
+
+
+def schedule_update(section, key):
+    """Update an item of a sitemap section when the current transaction is commited.
+
+    The updates of the same transaction are grouped, so every shard is written once.
+    """
+    _get_pending_updates()[section].add(key)
+    transaction.on_commit(_run_pending_updates)
+
+
+def schedule_project_update(project_id):
+    """Update all the items that depend on a project when the current transaction
+    is commited."""
+    schedule_update("projects:*", project_id)
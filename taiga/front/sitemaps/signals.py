@@ -0,0 +1,53 @@
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Taiga Agile LLC <support@taiga.io>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from . import services
+from . import sitemaps
+
+
+# Fields of the projects that change the visibility or the urls of the items of
+# the other sections
+PROJECT_FIELDS = ("slug", "is_private", "anon_permissions", "blocked_code", "is_wiki_activated")
+
+
+def _get_sections(model):
+    return [section for section, sitemap_class in sitemaps.items()
+            if sitemap_class.model == model._meta.label]
+
+
+def update_sitemaps(sender, instance, **kwargs):
+    for section in _get_sections(sender):
+        services.schedule_update(section, instance.pk)
+
+
+def store_previous_project_state(sender, instance, **kwargs):
+    if instance._state.adding:
+        instance._sitemaps_previous_state = None
+    else:
+        instance._sitemaps_previous_state = (sender.objects.filter(pk=instance.pk)
+                                                           .values_list(*PROJECT_FIELDS)
+                                                           .first())
+
+
+def update_project_sitemaps(sender, instance, created, **kwargs):
+    previous_state = getattr(instance, "_sitemaps_previous_state", None)
+    current_state = tuple(getattr(instance, field) for field in PROJECT_FIELDS)
+
+    if not created and previous_state is not None and tuple(previous_state) != current_state:
+        services.schedule_project_update(instance.pk)
+    else:
+        update_sitemaps(sender, instance)
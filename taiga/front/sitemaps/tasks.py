@@ -24,6 +24,9 @@ from .base import Sitemap
 
 
 class TasksSitemap(Sitemap):
+    model = "tasks.Task"
+    project_lookup = "project"
+
     def items(self):
         task_model = apps.get_model("tasks", "Task")
 
@@ -0,0 +1,32 @@
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Taiga Agile LLC <support@taiga.io>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.conf.urls import url
+
+from .views import index
+from .views import sitemap
+
+
+# The sitemap files are pre-generated (see taiga.front.sitemaps.services)
+urlpatterns = [
+    url(r"^front/sitemap\.xml$",
+        index,
+        name="front-sitemap-index"),
+    url(r"^front/sitemap-(?P<section>[\w-]+)-(?P<shard>\d+)\.xml$",
+        sitemap,
+        name="front-sitemap")
+]
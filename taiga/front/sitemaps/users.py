@@ -24,6 +24,8 @@ from .base import Sitemap
 
 
 class UsersSitemap(Sitemap):
+    model = "users.User"
+
     def items(self):
         user_model = get_user_model()
 
@@ -24,6 +24,9 @@ from .base import Sitemap
 
 
 class UserStoriesSitemap(Sitemap):
+    model = "userstories.UserStory"
+    project_lookup = "project"
+
     def items(self):
         us_model = apps.get_model("userstories", "UserStory")
 
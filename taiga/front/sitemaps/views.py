@@ -0,0 +1,46 @@
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Taiga Agile LLC <support@taiga.io>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_response_headers
+
+from . import services
+from . import sitemaps
+
+
+def _serve_file(path):
+    try:
+        with open(path, "rb") as sitemap_file:
+            content = sitemap_file.read()
+    except FileNotFoundError:
+        raise Http404
+
+    response = HttpResponse(content, content_type="application/xml")
+    patch_response_headers(response, settings.FRONT_SITEMAP_CACHE_TIMEOUT)
+    return response
+
+
+def index(request):
+    return _serve_file(services.get_index_path())
+
+
+def sitemap(request, section, shard):
+    if section not in sitemaps:
+        raise Http404
+
+    return _serve_file(services.get_shard_path(section, int(shard)))
@@ -24,6 +24,9 @@ from .base import Sitemap
 
 
 class WikiPagesSitemap(Sitemap):
+    model = "wiki.WikiPage"
+    project_lookup = "project"
+
     def items(self):
         wiki_page_model = apps.get_model("wiki", "WikiPage")
 
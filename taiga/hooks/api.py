@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from django.conf import settings
+from django.db import transaction
 from django.utils.translation import ugettext as _
 
 from taiga.base import exceptions as exc
@@ -24,6 +26,8 @@ from taiga.base.utils import json
 from taiga.projects.models import Project
 
 from .exceptions import ActionSyntaxException
+from . import services
+from . import tasks
 
 
 class BaseWebhookApiViewSet(GenericViewSet):
@@ -72,11 +76,23 @@ class BaseWebhookApiViewSet(GenericViewSet):
         payload = self._get_payload(request)
 
         event_hook_class = self.event_hook_classes.get(event_name, None)
-        if event_hook_class is not None:
-            event_hook = event_hook_class(project, payload)
-            try:
-                event_hook.process_event()
-            except ActionSyntaxException as e:
-                raise exc.BadRequest(e)
+        if event_hook_class is None:
+            return response.NoContent()
+
+        # The redelivered payloads are ignored if they have been processed yet
+        delivery = services.store_delivery(project, event_hook_class, request.body, payload)
+        if delivery is None:
+            return response.NoContent()
+
+        # Async mode
+        if settings.CELERY_ENABLED:
+            transaction.on_commit(lambda: tasks.process_hook_delivery.delay(delivery.id))
+            return response.NoContent()
+
+        # Sync mode
+        try:
+            services.process_delivery(delivery)
+        except ActionSyntaxException as e:
+            raise exc.BadRequest(e)
 
         return response.NoContent()
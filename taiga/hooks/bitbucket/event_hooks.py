@@ -20,7 +20,6 @@ import re
 from django.utils.translation import ugettext as _
 
 from taiga.base import exceptions as exc
-from taiga.projects.models import IssueStatus, TaskStatus, UserStoryStatus
 from taiga.projects.issues.models import Issue
 from taiga.projects.tasks.models import Task
 from taiga.projects.userstories.models import UserStory
@@ -38,55 +37,24 @@ class PushEventHook(BaseEventHook):
         if self.payload is None:
             return
 
-        changes = self.payload.get("push", {}).get('changes', [])
-        for change in filter(None, changes):
-            commits = change.get("commits", [])
-            if not commits:
-                continue
-
-            for commit in commits:
-                message = commit.get("message", None)
-                if not message:
-                    continue
-
-                self._process_message(message, None)
-
-    def _process_message(self, message, bitbucket_user):
-        """
-          The message we will be looking for seems like
-            TG-XX #yyyyyy
-          Where:
-            XX: is the ref for us, issue or task
-            yyyyyy: is the status slug we are setting
-        """
-        if message is None:
-            return
-
-        p = re.compile("tg-(\d+) +#([-\w]+)")
-        for m in p.finditer(message.lower()):
-            ref = m.group(1)
-            status_slug = m.group(2)
-            self._change_status(ref, status_slug, bitbucket_user)
+        # The messages we will be looking for seems like
+        #   TG-XX #yyyyyy
+        # Where:
+        #   XX: is the ref for us, issue or task
+        #   yyyyyy: is the status slug we are setting
+        messages = [commit.get("message", None)
+                    for change in filter(None, self.payload.get("push", {}).get('changes', []))
+                    for commit in change.get("commits", None) or []]
+        matches = [match for message in messages if message
+                         for match in self.process_message(message)]
+
+        self.load_elements([match["ref"] for match in matches])
+        for match in matches:
+            self._change_status(match["ref"], match["status_slug"], None)
 
     def _change_status(self, ref, status_slug, bitbucket_user):
-        if Issue.objects.filter(project=self.project, ref=ref).exists():
-            modelClass = Issue
-            statusClass = IssueStatus
-        elif Task.objects.filter(project=self.project, ref=ref).exists():
-            modelClass = Task
-            statusClass = TaskStatus
-        elif UserStory.objects.filter(project=self.project, ref=ref).exists():
-            modelClass = UserStory
-            statusClass = UserStoryStatus
-        else:
-            raise ActionSyntaxException(_("The referenced element doesn't exist"))
-
-        element = modelClass.objects.get(project=self.project, ref=ref)
-
-        try:
-            status = statusClass.objects.get(project=self.project, slug=status_slug)
-        except statusClass.DoesNotExist:
-            raise ActionSyntaxException(_("The status doesn't exist"))
+        element = self.get_element(ref)
+        status = self.get_status(element, status_slug)
 
         element.status = status
         element.save()
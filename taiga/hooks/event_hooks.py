@@ -17,6 +17,15 @@
 
 import re
 
+from django.utils.translation import ugettext as _
+
+from .exceptions import ActionSyntaxException
+from .services import get_elements_from_refs
+from .services import get_status_from_slug
+
+
+TG_REF_REGEX = re.compile(r"tg-(\d+) +#([-\w]+)")
+
 
 class BaseEventHook:
     messages = {
@@ -53,6 +62,8 @@ class BaseEventHook:
         self.project = project
         self.payload = payload
         self.user_info = self.get_user_info_from_payload()
+        self._elements = {}
+        self._statuses = {}
 
     def process_event(self):
         raise NotImplementedError("process_event must be overwritten")
@@ -74,10 +85,31 @@ class BaseEventHook:
             yyyyyy: is the status slug we are setting
         """
 
-        p = re.compile("tg-(\d+) +#([-\w]+)")
-
-        for match in p.finditer(message.lower()):
+        for match in TG_REF_REGEX.finditer(message.lower()):
             yield {
                 'ref': match.group(1),
                 'status_slug': match.group(2)
             }
+
+    def load_elements(self, refs):
+        """
+        Resolve all the refs of a payload at once, they are used later by
+        get_element.
+        """
+        self._elements.update(get_elements_from_refs(self.project, refs))
+
+    def get_element(self, ref):
+        element = self._elements.get(int(ref), None)
+        if element is None:
+            self.load_elements([ref])
+            element = self._elements.get(int(ref), None)
+
+        if element is None:
+            raise ActionSyntaxException(_("The referenced element doesn't exist"))
+        return element
+
+    def get_status(self, element, status_slug):
+        key = (element.__class__, status_slug)
+        if key not in self._statuses:
+            self._statuses[key] = get_status_from_slug(self.project, element, status_slug)
+        return self._statuses[key]
@@ -17,8 +17,6 @@
 
 from django.utils.translation import ugettext as _
 
-from taiga.projects.models import IssueStatus, TaskStatus, UserStoryStatus
-
 from taiga.projects.issues.models import Issue
 from taiga.projects.tasks.models import Task
 from taiga.projects.userstories.models import UserStory
@@ -39,48 +37,22 @@ class PushEventHook(BaseEventHook):
 
         github_user = self.payload.get('sender', {})
 
-        commits = self.payload.get("commits", [])
-        for commit in commits:
-            self._process_commit(commit, github_user)
-
-    def _process_commit(self, commit, github_user):
-        """
-          The message we will be looking for seems like
-            TG-XX #yyyyyy
-          Where:
-            XX: is the ref for us, issue or task
-            yyyyyy: is the status slug we are setting
-        """
-        message = commit.get("message", None)
-
-        if message is None:
-            return
-
-        p = re.compile("tg-(\d+) +#([-\w]+)")
-        for m in p.finditer(message.lower()):
-            ref = m.group(1)
-            status_slug = m.group(2)
+        # The message we will be looking for seems like
+        #   TG-XX #yyyyyy
+        # Where:
+        #   XX: is the ref for us, issue or task
+        #   yyyyyy: is the status slug we are setting
+        changes = [(match["ref"], match["status_slug"], commit)
+                   for commit in self.payload.get("commits", [])
+                   for match in self.process_message(commit.get("message", None) or "")]
+
+        self.load_elements([ref for ref, status_slug, commit in changes])
+        for ref, status_slug, commit in changes:
             self._change_status(ref, status_slug, github_user, commit)
 
     def _change_status(self, ref, status_slug, github_user, commit):
-        if Issue.objects.filter(project=self.project, ref=ref).exists():
-            modelClass = Issue
-            statusClass = IssueStatus
-        elif Task.objects.filter(project=self.project, ref=ref).exists():
-            modelClass = Task
-            statusClass = TaskStatus
-        elif UserStory.objects.filter(project=self.project, ref=ref).exists():
-            modelClass = UserStory
-            statusClass = UserStoryStatus
-        else:
-            raise ActionSyntaxException(_("The referenced element doesn't exist"))
-
-        element = modelClass.objects.get(project=self.project, ref=ref)
-
-        try:
-            status = statusClass.objects.get(project=self.project, slug=status_slug)
-        except statusClass.DoesNotExist:
-            raise ActionSyntaxException(_("The status doesn't exist"))
+        element = self.get_element(ref)
+        status = self.get_status(element, status_slug)
 
         element.status = status
         element.save()
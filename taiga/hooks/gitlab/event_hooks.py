@@ -29,7 +29,6 @@ from taiga.hooks.event_hooks import BaseEventHook
 from taiga.hooks.exceptions import ActionSyntaxException
 
 from .services import get_user_info_from_payload, get_gitlab_user
-from ..services import get_element_from_ref, get_status_from_slug
 
 
 class BaseGitlabEventHook(BaseEventHook):
@@ -48,14 +47,17 @@ class PushEventHook(BaseGitlabEventHook):
         if self.payload is None:
             return
 
-        commits = self.payload.get("commits", [])
-        for commit in commits:
-            for match in self.process_message(commit.get("message", None)):
-                self._process_commit(commit=commit, **match)
+        changes = [dict(commit=commit, **match)
+                   for commit in self.payload.get("commits", [])
+                   for match in self.process_message(commit.get("message", None))]
+
+        self.load_elements([change["ref"] for change in changes])
+        for change in changes:
+            self._process_commit(**change)
 
     def _process_commit(self, ref, status_slug, commit):
-        element = get_element_from_ref(self.project, ref)
-        status = get_status_from_slug(self.project, element, status_slug)
+        element = self.get_element(ref)
+        status = self.get_status(element, status_slug)
         element.status = status
         element.save()
 
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django.utils.timezone
+import django_pgjson.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0041_project_thumbnails'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HookDelivery',
+            fields=[
+                ('id', models.AutoField(serialize=False, verbose_name='ID', auto_created=True, primary_key=True)),
+                ('event_hook', models.CharField(max_length=255, verbose_name='event hook')),
+                ('delivery_key', models.CharField(max_length=40, verbose_name='delivery key')),
+                ('payload', django_pgjson.fields.JsonField(null=True, blank=True, verbose_name='payload')),
+                ('error', models.TextField(blank=True, default='', verbose_name='error')),
+                ('created_date', models.DateTimeField(default=django.utils.timezone.now, verbose_name='created date')),
+                ('processed_date', models.DateTimeField(null=True, blank=True, default=None, verbose_name='processed date')),
+                ('project', models.ForeignKey(related_name='hook_deliveries', to='projects.Project')),
+            ],
+            options={
+                'ordering': ['-created_date', '-id'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='hookdelivery',
+            unique_together=set([('project', 'delivery_key')]),
+        ),
+    ]
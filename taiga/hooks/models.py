@@ -0,0 +1,46 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from django_pgjson.fields import JsonField
+
+
+class HookDelivery(models.Model):
+    """
+    A payload received from a git service hook. It's stored before being processed
+    so the request can be answered at once, and the payloads delivered again are
+    detected by their key.
+    """
+    project = models.ForeignKey("projects.Project", null=False, blank=False,
+                                related_name="hook_deliveries")
+    event_hook = models.CharField(max_length=255, null=False, blank=False,
+                                  verbose_name=_("event hook"))
+    delivery_key = models.CharField(max_length=40, null=False, blank=False,
+                                    verbose_name=_("delivery key"))
+    payload = JsonField(null=True, blank=True, verbose_name=_("payload"))
+    error = models.TextField(null=False, blank=True, default="", verbose_name=_("error"))
+    created_date = models.DateTimeField(null=False, blank=False, default=timezone.now,
+                                        verbose_name=_("created date"))
+    processed_date = models.DateTimeField(null=True, blank=True, default=None,
+                                          verbose_name=_("processed date"))
+
+    class Meta:
+        ordering = ["-created_date", "-id"]
+        unique_together = ("project", "delivery_key")
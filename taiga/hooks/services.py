@@ -14,6 +14,14 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import defaultdict
+import hashlib
+
+from django.conf import settings
+from django.db import connection
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.utils.translation import ugettext as _
 
 from taiga.projects.models import IssueStatus, TaskStatus, UserStoryStatus
@@ -22,6 +30,8 @@ from taiga.projects.tasks.models import Task
 from taiga.projects.userstories.models import UserStory
 from taiga.hooks.exceptions import ActionSyntaxException
 
+from .models import HookDelivery
+
 
 def get_element_from_ref(project, ref):
     if Issue.objects.filter(project=project, ref=ref).exists():
@@ -50,3 +60,115 @@ def get_status_from_slug(project, element, status_slug):
         return status_class.objects.get(project=project, slug=status_slug)
     except status_class.DoesNotExist:
         raise ActionSyntaxException(_("The status doesn't exist"))
+
+
+# The refs are unique in a project, but if several elements had the same one
+# the first type of this list would be used
+REFERENCED_MODELS = (
+    ("issue", Issue),
+    ("task", Task),
+    ("userstory", UserStory),
+)
+
+
+def get_elements_from_refs(project, refs):
+    """Get the issues, tasks and user stories of a project referenced by any of the refs.
+
+    All the refs are resolved with one query and then the elements are loaded with one
+    query by type of element.
+
+    :return: A dict with the elements by ref.
+    """
+    refs = sorted({int(ref) for ref in refs})
+    if not refs:
+        return {}
+
+    sql = " UNION ALL ".join(
+        "SELECT {priority}, '{type}', id, ref FROM {table_name} "
+        "WHERE project_id = %(project_id)s AND ref = ANY(%(refs)s)".format(
+            priority=priority, type=type, table_name=model._meta.db_table)
+        for priority, (type, model) in enumerate(REFERENCED_MODELS))
+
+    cursor = connection.cursor()
+    cursor.execute(sql + " ORDER BY 1", {"project_id": project.id, "refs": refs})
+
+    refs_by_type = defaultdict(dict)
+    found_refs = set()
+    for priority, type, id, ref in cursor.fetchall():
+        if ref not in found_refs:
+            found_refs.add(ref)
+            refs_by_type[type][id] = ref
+
+    elements = {}
+    for type, model in REFERENCED_MODELS:
+        if type in refs_by_type:
+            for id, element in model.objects.in_bulk(list(refs_by_type[type])).items():
+                elements[refs_by_type[type][id]] = element
+
+    return elements
+
+
+####################################
+# Received hook payloads
+####################################
+
+def store_delivery(project, event_hook_class, body, payload):
+    """Store a payload received from a git service hook.
+
+    :param project: The project of the hook.
+    :param event_hook_class: The `BaseEventHook` class that will process the payload.
+    :param body: The raw body of the request, used to detect the redeliveries.
+    :param payload: The parsed payload.
+
+    :return: The `HookDelivery` to process or None if the payload was already received
+             and processed, or it's being processed.
+    """
+    event_hook = "{}.{}".format(event_hook_class.__module__, event_hook_class.__name__)
+    delivery_key = hashlib.sha1(event_hook.encode("utf-8") + b"\n" + body).hexdigest()
+
+    delivery, created = HookDelivery.objects.get_or_create(project=project,
+                                                           delivery_key=delivery_key,
+                                                           defaults={"event_hook": event_hook,
+                                                                     "payload": payload})
+    if created:
+        return delivery
+
+    # The payloads with errors are processed again
+    if delivery.error:
+        delivery.error = ""
+        delivery.processed_date = None
+        delivery.save(update_fields=["error", "processed_date"])
+        return delivery
+
+    return None
+
+
+def process_delivery(delivery):
+    """Process a stored hook payload, all its changes are done or none of them.
+
+    The errors are stored in the delivery, so it can be processed again if the
+    git service redelivers the payload, and raised again.
+    """
+    event_hook_class = import_string(delivery.event_hook)
+    try:
+        with transaction.atomic():
+            event_hook_class(delivery.project, delivery.payload).process_event()
+    except Exception as e:
+        delivery.error = str(e) or e.__class__.__name__
+        raise
+    else:
+        delivery.error = ""
+    finally:
+        delivery.processed_date = timezone.now()
+        delivery.save(update_fields=["error", "processed_date"])
+        prune_deliveries(delivery.project_id)
+
+
+def prune_deliveries(project_id):
+    """Remove the oldest processed payloads of a project, keeping HOOKS_DELIVERIES_KEPT."""
+    kept_ids = (HookDelivery.objects.filter(project_id=project_id)
+                                    .order_by("-created_date", "-id")
+                                    .values_list("id", flat=True)[:settings.HOOKS_DELIVERIES_KEPT])
+    (HookDelivery.objects.filter(project_id=project_id, processed_date__isnull=False)
+                         .exclude(id__in=list(kept_ids))
+                         .delete())
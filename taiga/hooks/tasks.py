@@ -0,0 +1,40 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+
+from taiga.celery import app
+
+from .exceptions import ActionSyntaxException
+from .models import HookDelivery
+from . import services
+
+logger = logging.getLogger("taiga.hooks")
+
+
+@app.task
+def process_hook_delivery(delivery_id):
+    try:
+        delivery = HookDelivery.objects.select_related("project").get(id=delivery_id)
+    except HookDelivery.DoesNotExist:
+        return
+
+    try:
+        services.process_delivery(delivery)
+    except ActionSyntaxException as e:
+        # The error is stored in the delivery, there is nothing else to do
+        logger.info("Invalid hook payload %s: %s", delivery_id, e)
@@ -83,6 +83,25 @@ def disconnect_us_status_signals():
 
 
 
+## Points Signals
+
+def connect_points_signals():
+    from . import signals as handlers
+    signals.post_save.connect(handlers.update_total_points_when_edit_points,
+                              sender=apps.get_model("projects", "Points"),
+                              dispatch_uid="update_total_points_when_edit_points")
+    signals.post_delete.connect(handlers.update_total_points_when_delete_points,
+                                sender=apps.get_model("projects", "Points"),
+                                dispatch_uid="update_total_points_when_delete_points")
+
+
+def disconnect_points_signals():
+    signals.post_save.disconnect(sender=apps.get_model("projects", "Points"),
+                                 dispatch_uid="update_total_points_when_edit_points")
+    signals.post_delete.disconnect(sender=apps.get_model("projects", "Points"),
+                                   dispatch_uid="update_total_points_when_delete_points")
+
+
 ## Tasks Statuses Signals
 
 def connect_task_status_signals():
@@ -90,11 +109,16 @@ def connect_task_status_signals():
     signals.post_save.connect(handlers.try_to_close_or_open_user_stories_when_edit_task_status,
                               sender=apps.get_model("projects", "TaskStatus"),
                               dispatch_uid="try_to_close_or_open_user_stories_when_edit_task_status")
+    signals.post_delete.connect(handlers.update_counters_when_delete_task_status,
+                                sender=apps.get_model("projects", "TaskStatus"),
+                                dispatch_uid="update_counters_when_delete_task_status")
 
 
 def disconnect_task_status_signals():
     signals.post_save.disconnect(sender=apps.get_model("projects", "TaskStatus"),
                                  dispatch_uid="try_to_close_or_open_user_stories_when_edit_task_status")
+    signals.post_delete.disconnect(sender=apps.get_model("projects", "TaskStatus"),
+                                   dispatch_uid="update_counters_when_delete_task_status")
 
 
 
@@ -106,4 +130,5 @@ class ProjectsAppConfig(AppConfig):
         connect_projects_signals()
         connect_memberships_signals()
         connect_us_status_signals()
+        connect_points_signals()
         connect_task_status_signals()
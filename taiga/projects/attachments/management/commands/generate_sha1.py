@@ -1,19 +1,156 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from optparse import make_option
+import os
+import time
+
+from django.conf import settings
+from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 
+from taiga.base.utils import json
+from taiga.base.utils.files import get_file_sha1
+from taiga.base.utils.processes import get_process_pool_executor
 from taiga.projects.attachments.models import Attachment
 
-import logging
-logger = logging.getLogger(__name__)
+BLOCKSIZE = 1024 * 1024
+
+
+def _hash_attachment_file(args):
+    # Executed in the workers, only the storage is used here
+    pk, file_name, stored_sha1 = args
+    try:
+        with default_storage.open(file_name) as attached_file:
+            sha1, size = get_file_sha1(attached_file, BLOCKSIZE)
+    except (IOError, OSError):
+        return pk, file_name, stored_sha1, None, 0
+    return pk, file_name, stored_sha1, sha1, size
+
+
+def _read_checkpoint(path, mode):
+    if not path or not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        checkpoint = json.loads(f.read())
+
+    if checkpoint.get("mode") != mode:
+        raise CommandError("The checkpoint {} was created in {} mode".format(path, checkpoint.get("mode")))
+    return checkpoint
+
+
+def _write_checkpoint(path, checkpoint):
+    tmp_path = "{}.tmp".format(path)
+    with open(tmp_path, "w") as f:
+        f.write(json.dumps(checkpoint))
+    os.replace(tmp_path, path)
 
 
 class Command(BaseCommand):
-    @transaction.atomic
+    help = ("Generate the sha1 of the attachment files, or verify them with --verify. "
+            "Use --checkpoint to resume an interrupted run.")
+    option_list = BaseCommand.option_list + (
+        make_option('--workers', '-w', type="int", default=settings.ATTACHMENTS_SHA1_WORKERS, dest='workers',
+            help='Number of processes used to hash the files'),
+        make_option('--all', '-a', action="store_true", default=False, dest='regenerate_all',
+            help='Hash all the files, not only the ones without sha1'),
+        make_option('--verify', action="store_true", default=False, dest='verify',
+            help='Report the missing files and the ones whose sha1 doesn\'t match, without changing anything'),
+        make_option('--checkpoint', '-c', default=None, dest='checkpoint',
+            help='File where the progress is saved, an interrupted run is resumed from it'),
+        make_option('--batch-size', '-b', type="int", default=500, dest='batch_size',
+            help='Number of files hashed between two checkpoints'),
+    )
+
     def handle(self, *args, **options):
-        total = rest = Attachment.objects.all().count()
+        workers = max(options["workers"], 1)
+        batch_size = max(options["batch_size"], 1)
+        verify = options["verify"]
+        checkpoint_path = options["checkpoint"]
+        mode = "verify" if verify else "generate"
+
+        qs = Attachment.objects.exclude(attached_file="").exclude(attached_file__isnull=True)
+        if not verify and not options["regenerate_all"]:
+            qs = qs.filter(sha1="")
+
+        checkpoint = _read_checkpoint(checkpoint_path, mode)
+        if checkpoint is None:
+            checkpoint = {"mode": mode, "last_id": 0, "files": 0, "bytes": 0, "updated": 0,
+                          "missing": 0, "mismatched": 0}
+        else:
+            print("-> Resuming from the attachment {}".format(checkpoint["last_id"]))
+
+        start_time = time.time()
+        start_files = checkpoint["files"]
+        start_bytes = checkpoint["bytes"]
+
+        executor = get_process_pool_executor(workers)
+        try:
+            while True:
+                batch = list(qs.filter(id__gt=checkpoint["last_id"])
+                               .order_by("id")
+                               .values_list("id", "attached_file", "sha1")[:batch_size])
+                if not batch:
+                    break
+
+                if executor is not None:
+                    results = executor.map(_hash_attachment_file, batch, chunksize=max(len(batch) // (workers * 4), 1))
+                else:
+                    results = map(_hash_attachment_file, batch)
+
+                for pk, file_name, stored_sha1, sha1, size in results:
+                    checkpoint["files"] += 1
+                    checkpoint["bytes"] += size
+
+                    if sha1 is None:
+                        checkpoint["missing"] += 1
+                        print("   Missing file of attachment {}: {}".format(pk, file_name))
+                    elif verify:
+                        if stored_sha1 and stored_sha1 != sha1:
+                            checkpoint["mismatched"] += 1
+                            print("   Mismatched sha1 of attachment {}: {} (stored {}, calculated {})".format(
+                                pk, file_name, stored_sha1, sha1))
+                    elif stored_sha1 != sha1:
+                        Attachment.objects.filter(id=pk).update(sha1=sha1)
+                        checkpoint["updated"] += 1
+
+                checkpoint["last_id"] = batch[-1][0]
+                if checkpoint_path:
+                    _write_checkpoint(checkpoint_path, checkpoint)
+
+                self._print_stats(checkpoint, start_time, start_files, start_bytes)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        print("-> {files} files hashed, {updated} sha1 updated, {missing} missing files, "
+              "{mismatched} mismatched files".format(**checkpoint))
 
-        for attachment in Attachment.objects.all().order_by("id"):
-            attachment.save()
+        if verify and (checkpoint["missing"] or checkpoint["mismatched"]):
+            raise CommandError("{missing} missing files and {mismatched} mismatched files".format(**checkpoint))
 
-            rest -= 1
-            logger.debug("[{} / {} remaining] - Generate sha1 for attach {}".format(rest, total, attachment.id))
+    def _print_stats(self, checkpoint, start_time, start_files, start_bytes):
+        elapsed = max(time.time() - start_time, 0.001)
+        files = checkpoint["files"] - start_files
+        megabytes = (checkpoint["bytes"] - start_bytes) / (1024 * 1024)
+        print("   {} files ({:.1f} MB) - {:.1f} files/s, {:.1f} MB/s - last attachment {}".format(
+            checkpoint["files"], checkpoint["bytes"] / (1024 * 1024),
+            files / elapsed, megabytes / elapsed, checkpoint["last_id"]))
@@ -15,8 +15,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import hashlib
-
 from django.db import models
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -25,7 +23,10 @@ from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 from django.utils.text import get_valid_filename
 
+from django_pgjson.fields import JsonField
+
 from taiga.base.utils.files import get_file_path
+from taiga.base.utils.files import get_file_sha1
 
 
 def get_attachment_file_path(instance, filename):
@@ -53,6 +54,8 @@ class Attachment(models.Model):
     attached_file = models.FileField(max_length=500, null=True, blank=True,
                                      upload_to=get_attachment_file_path,
                                      verbose_name=_("attached file"))
+    thumbnails = JsonField(null=True, blank=True, default=None, editable=False,
+                           verbose_name=_("thumbnails"))
 
     sha1 = models.CharField(default="", max_length=40, verbose_name=_("sha1"), blank=True)
 
@@ -75,20 +78,21 @@ class Attachment(models.Model):
         self._orig_attached_file = self.attached_file
 
     def _generate_sha1(self, blocksize=65536):
-        hasher = hashlib.sha1()
-        while True:
-            buff = self.attached_file.file.read(blocksize)
-            if not buff:
-                break
-            hasher.update(buff)
-        self.sha1 = hasher.hexdigest()
+        self.sha1, _size = get_file_sha1(self.attached_file.file, blocksize)
 
-    def save(self, *args, **kwargs):
+    def prepare_for_insert(self):
+        """
+        Set the fields computed on save. `bulk_create()` doesn't call save()
+        so the importer calls it directly.
+        """
         if not self._importing or not self.modified_date:
             self.modified_date = timezone.now()
         if self.attached_file:
             if not self.sha1 or self.attached_file != self._orig_attached_file:
                 self._generate_sha1()
+
+    def save(self, *args, **kwargs):
+        self.prepare_for_insert()
         save = super().save(*args, **kwargs)
         self._orig_attached_file = self.attached_file
         if self.attached_file:
@@ -14,16 +14,18 @@
 
 from django.conf import settings
 
-from taiga.base.utils.thumbnails import get_thumbnail_url
+from taiga.base.utils.thumbnails import get_stored_thumbnail_url
 
 
 def get_timeline_image_thumbnail_url(attachment):
     if attachment.attached_file:
-        return get_thumbnail_url(attachment.attached_file, settings.THN_ATTACHMENT_TIMELINE)
+        return get_stored_thumbnail_url(attachment.thumbnails, attachment.attached_file,
+                                        settings.THN_ATTACHMENT_TIMELINE)
     return None
 
 
 def get_card_image_thumbnail_url(attachment):
     if attachment.attached_file:
-        return get_thumbnail_url(attachment.attached_file, settings.THN_ATTACHMENT_CARD)
+        return get_stored_thumbnail_url(attachment.thumbnails, attachment.attached_file,
+                                        settings.THN_ATTACHMENT_CARD)
     return None
@@ -0,0 +1,40 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Anler Hernández <hello@anler.me>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+def attach_custom_attributes_values_to_queryset(queryset, as_field="custom_attributes_values_data"):
+    """Attach the custom attributes values dict to each object of the queryset.
+
+    Objects without a custom attributes values row get an empty dict.
+
+    :param queryset: A Django queryset object.
+    :param as_field: Attach the values as an attribute with this name.
+
+    :return: Queryset object with the additional `as_field` field.
+    """
+    model = queryset.model
+    rel = model._meta.get_field("custom_attributes_values")
+    sql = """SELECT coalesce((SELECT {values_tbl}.attributes_values
+                                FROM {values_tbl}
+                               WHERE {values_tbl}.{fk_column} = {tbl}.id), '{{}}'::json)"""
+
+    sql = sql.format(values_tbl=rel.related_model._meta.db_table,
+                     fk_column=rel.field.column,
+                     tbl=model._meta.db_table)
+    qs = queryset.extra(select={as_field: sql})
+    return qs
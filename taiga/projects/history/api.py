@@ -50,9 +50,11 @@ class HistoryViewSet(ReadOnlyListViewSet):
         # Switch between paginated or standard style responses
         page = self.paginate_queryset(queryset)
         if page is not None:
+            services.attach_owners_to_history_entries(page.object_list)
             serializer = self.get_pagination_serializer(page)
         else:
-            serializer = self.get_serializer(queryset, many=True)
+            entries = services.attach_owners_to_history_entries(queryset)
+            serializer = self.get_serializer(entries, many=True)
 
         return response.Ok(serializer.data)
 
@@ -33,6 +33,7 @@ from functools import wraps
 from functools import lru_cache
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.paginator import Paginator, InvalidPage
 from django.apps import apps
@@ -332,7 +333,11 @@ def take_snapshot(obj:object, *, comment:str="", user=None, delete:bool=False):
             "is_snapshot": need_real_snapshot,
         }
         
-        return entry_model.objects.create(**kwargs)
+        entry = entry_model(**kwargs)
+        # The user is known, the timeline and the notifications don't need to fetch it again
+        entry.__dict__["owner"] = user if user_id is not None else None
+        entry.save(force_insert=True)
+        return entry
 
 
 # High level query api
@@ -352,6 +357,28 @@ def get_history_queryset_by_model_instance(obj:object, types=(HistoryType.change
     return qs.order_by("created_at")
 
 
+def attach_owners_to_history_entries(entries):
+    """
+    Load the users of all the history entries with one query
+    and set them as the `owner` of each entry. As in
+    `HistoryEntry.owner`, the owner of the entries whose user
+    doesn't exist anymore is None.
+
+    Returns the list of entries.
+    """
+    entries = [entry for entry in entries]
+    pending_entries = [entry for entry in entries
+                       if entry.user is not None and "owner" not in entry.__dict__]
+
+    user_ids = {entry.user.get("pk", None) for entry in pending_entries} - {None}
+    users = get_user_model().objects.in_bulk(list(user_ids)) if user_ids else {}
+
+    for entry in pending_entries:
+        entry.__dict__["owner"] = users.get(entry.user.get("pk", None), None)
+
+    return entries
+
+
 # Freeze implementatitions
 from .freeze_impl import project_freezer
 from .freeze_impl import milestone_freezer
@@ -16,7 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from django.utils.translation import ugettext as _
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 
 from taiga.base import filters
 from taiga.base import exceptions as exc
@@ -24,6 +24,7 @@ from taiga.base import response
 from taiga.base.decorators import list_route
 from taiga.base.api import ModelCrudViewSet, ModelListViewSet
 from taiga.base.api.mixins import BlockedByProjectMixin
+from taiga.base.serialized_cache import SerializedCacheResourceMixin
 from taiga.base.api.utils import get_object_or_404
 
 from taiga.projects.notifications.mixins import WatchedResourceMixin, WatchersViewSetMixin
@@ -39,8 +40,8 @@ from . import permissions
 from . import serializers
 
 
-class IssueViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin, WatchedResourceMixin,
-                   BlockedByProjectMixin, ModelCrudViewSet):
+class IssueViewSet(SerializedCacheResourceMixin, OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin,
+                   WatchedResourceMixin, BlockedByProjectMixin, ModelCrudViewSet):
     queryset = models.Issue.objects.all()
     permission_classes = (permissions.IssuePermission, )
     filter_backends = (filters.CanViewIssuesFilterBackend,
@@ -217,8 +218,8 @@ class IssueViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin, W
 
         project = get_object_or_404(Project, issues_csv_uuid=uuid)
         queryset = project.issues.all().order_by('ref')
-        data = services.issues_to_csv(project, queryset)
-        csv_response = HttpResponse(data.getvalue(), content_type='application/csv; charset=utf-8')
+        data = services.issues_to_csv_stream(project, queryset)
+        csv_response = StreamingHttpResponse(data, content_type='application/csv; charset=utf-8')
         csv_response['Content-Disposition'] = 'attachment; filename="issues.csv"'
         return csv_response
 
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import djorm_pgarray.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('notifications', '0006_auto_20151103_0954'),
+        ('votes', '0002_auto_20150805_1600'),
+        ('issues', '0006_remove_issue_watchers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='total_voters',
+            field=models.IntegerField(editable=False, default=0, verbose_name='total voters'),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='total_watchers',
+            field=models.IntegerField(editable=False, default=0, verbose_name='total watchers'),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='watchers_ids',
+            field=djorm_pgarray.fields.IntegerArrayField(editable=False, default=list, dbtype='int', verbose_name='watchers ids', blank=True),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE issues_issue
+               SET total_voters = coalesce((SELECT votes_votes.count
+                                              FROM votes_votes
+                                        INNER JOIN django_content_type ON django_content_type.id = votes_votes.content_type_id
+                                             WHERE django_content_type.app_label = 'issues'
+                                               AND django_content_type.model = 'issue'
+                                               AND votes_votes.object_id = issues_issue.id), 0),
+                   total_watchers = (SELECT count(*)
+                                       FROM notifications_watched
+                                 INNER JOIN django_content_type ON django_content_type.id = notifications_watched.content_type_id
+                                      WHERE django_content_type.app_label = 'issues'
+                                        AND django_content_type.model = 'issue'
+                                        AND notifications_watched.object_id = issues_issue.id),
+                   watchers_ids = array(SELECT notifications_watched.user_id
+                                          FROM notifications_watched
+                                    INNER JOIN django_content_type ON django_content_type.id = notifications_watched.content_type_id
+                                         WHERE django_content_type.app_label = 'issues'
+                                           AND django_content_type.model = 'issue'
+                                           AND notifications_watched.object_id = issues_issue.id);
+            """,
+            reverse_sql=migrations.RunSQL.noop
+        ),
+    ]
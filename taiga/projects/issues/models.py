@@ -26,13 +26,17 @@ from djorm_pgarray.fields import TextArrayField
 
 from taiga.projects.occ import OCCModelMixin
 from taiga.projects.notifications.mixins import WatchedModelMixin
+from taiga.projects.notifications.models import WatchedCountersMixin
+from taiga.projects.votes.models import VotedCountersMixin
 from taiga.projects.mixins.blocked import BlockedMixin
 from taiga.base.tags import TaggedMixin
+from taiga.base.utils import db
 
 from taiga.projects.services.tags_colors import update_project_tags_colors_handler, remove_unused_tags
 
 
-class Issue(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.Model):
+class Issue(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, VotedCountersMixin,
+            WatchedCountersMixin, models.Model):
     ref = models.BigIntegerField(db_index=True, null=True, blank=True, default=None,
                                  verbose_name=_("ref"))
     owner = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, default=None,
@@ -65,6 +69,9 @@ class Issue(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.
                                     verbose_name=_("assigned to"))
     attachments = GenericRelation("attachments.Attachment")
     external_reference = TextArrayField(default=None, verbose_name=_("external reference"))
+
+    DENORMALIZED_FIELDS = VotedCountersMixin.VOTES_COUNTERS_FIELDS + WatchedCountersMixin.WATCHERS_COUNTERS_FIELDS
+
     _importing = None
 
     class Meta:
@@ -91,6 +98,7 @@ class Issue(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.
         if not self.priority_id:
             self.priority = self.project.default_priority
 
+        db.exclude_fields_on_save(self, self.DENORMALIZED_FIELDS, kwargs)
         return super().save(*args, **kwargs)
 
     def __str__(self):
@@ -19,6 +19,7 @@ from taiga.base.api import serializers
 from taiga.base.fields import TagsField
 from taiga.base.fields import PgArrayField
 from taiga.base.neighbors import NeighborsSerializerMixin
+from taiga.base.serialized_cache import CachedSerializerMixin
 
 from taiga.mdrender.service import render as mdrender
 from taiga.projects.validators import ProjectExistsValidator
@@ -47,6 +48,7 @@ class IssueSerializer(WatchersValidator, VoteResourceSerializerMixin, EditableWa
     class Meta:
         model = models.Issue
         read_only_fields = ('id', 'ref', 'created_date', 'modified_date', 'owner')
+        exclude = ("watchers_ids",)
 
     def get_comment(self, obj):
         # NOTE: This method and field is necessary to historical comments work
@@ -70,14 +72,19 @@ class IssueListSerializer(IssueSerializer):
     class Meta:
         model = models.Issue
         read_only_fields = ('id', 'ref', 'created_date', 'modified_date')
-        exclude=("description", "description_html")
+        exclude=("description", "description_html", "watchers_ids")
 
 
-class IssueListSerializer(IssueSerializer):
+class IssueListSerializer(CachedSerializerMixin, IssueSerializer):
+    serialized_cache_fresh_fields = ("is_voter", "total_voters", "is_watcher", "total_watchers", "watchers",
+                                     "milestone", "status", "status_extra_info", "is_closed",
+                                     "finished_date", "generated_user_stories", "modified_date", "tags",
+                                     "owner_extra_info", "assigned_to_extra_info")
+
     class Meta:
         model = models.Issue
         read_only_fields = ('id', 'ref', 'created_date', 'modified_date')
-        exclude=("description", "description_html")
+        exclude=("description", "description_html", "watchers_ids")
 
 
 class IssueNeighborsSerializer(NeighborsSerializerMixin, IssueSerializer):
@@ -16,7 +16,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import io
-import csv
 from collections import OrderedDict
 from operator import itemgetter
 from contextlib import closing
@@ -24,12 +23,15 @@ from contextlib import closing
 from django.db import connection
 from django.utils.translation import ugettext as _
 
-from taiga.base.utils import db, text
+from taiga.base.utils import db, iterators, text
+from taiga.base.utils.streaming import iter_csv
 from taiga.projects.issues.apps import (
     connect_issues_signals,
     disconnect_issues_signals)
 from taiga.projects.votes.utils import attach_total_voters_to_queryset
 from taiga.projects.notifications.utils import attach_watchers_to_queryset
+from taiga.projects.attachments.utils import attach_total_attachments_to_queryset
+from taiga.projects.custom_attributes.utils import attach_custom_attributes_values_to_queryset
 
 from . import models
 
@@ -57,6 +59,10 @@ def create_issues_in_bulk(bulk_data, callback=None, precall=None, **additional_f
     """
     issues = get_issues_from_bulk(bulk_data, **additional_fields)
 
+    # Allocate all the refs with a single call to the sequence
+    from taiga.projects.references.models import reserve_references
+    reserve_references(issues)
+
     disconnect_issues_signals()
 
     try:
@@ -84,62 +90,69 @@ def update_issues_order_in_bulk(bulk_data):
 
 def issues_to_csv(project, queryset):
     csv_data = io.StringIO()
+    csv_data.writelines(issues_to_csv_stream(project, queryset))
+    return csv_data
+
+
+def issues_to_csv_stream(project, queryset, chunk_size=500):
     fieldnames = ["ref", "subject", "description", "sprint", "sprint_estimated_start",
                   "sprint_estimated_finish", "owner", "owner_full_name", "assigned_to",
                   "assigned_to_full_name", "status", "severity", "priority", "type",
                   "is_closed", "attachments", "external_reference", "tags", "watchers",
                   "voters", "created_date", "modified_date", "finished_date"]
 
-    custom_attrs = project.issuecustomattributes.all()
+    custom_attrs = list(project.issuecustomattributes.all())
     for custom_attr in custom_attrs:
         fieldnames.append(custom_attr.name)
 
-    queryset = queryset.prefetch_related("attachments",
-                                         "generated_user_stories",
-                                         "custom_attributes_values")
-    queryset = queryset.select_related("owner",
+    queryset = queryset.select_related("milestone",
+                                       "owner",
                                        "assigned_to",
                                        "status",
+                                       "severity",
+                                       "priority",
+                                       "type",
                                        "project")
     queryset = attach_total_voters_to_queryset(queryset)
     queryset = attach_watchers_to_queryset(queryset)
-
-    writer = csv.DictWriter(csv_data, fieldnames=fieldnames)
-    writer.writeheader()
-    for issue in queryset:
-        issue_data = {
-            "ref": issue.ref,
-            "subject": issue.subject,
-            "description": issue.description,
-            "sprint": issue.milestone.name if issue.milestone else None,
-            "sprint_estimated_start": issue.milestone.estimated_start if issue.milestone else None,
-            "sprint_estimated_finish": issue.milestone.estimated_finish if issue.milestone else None,
-            "owner": issue.owner.username if issue.owner else None,
-            "owner_full_name": issue.owner.get_full_name() if issue.owner else None,
-            "assigned_to": issue.assigned_to.username if issue.assigned_to else None,
-            "assigned_to_full_name": issue.assigned_to.get_full_name() if issue.assigned_to else None,
-            "status": issue.status.name if issue.status else None,
-            "severity": issue.severity.name,
-            "priority": issue.priority.name,
-            "type": issue.type.name,
-            "is_closed": issue.is_closed,
-            "attachments": issue.attachments.count(),
-            "external_reference": issue.external_reference,
-            "tags": ",".join(issue.tags or []),
-            "watchers": issue.watchers,
-            "voters": issue.total_voters,
-            "created_date": issue.created_date,
-            "modified_date": issue.modified_date,
-            "finished_date": issue.finished_date,
-        }
-
-        for custom_attr in custom_attrs:
-            value = issue.custom_attributes_values.attributes_values.get(str(custom_attr.id), None)
-            issue_data[custom_attr.name] = value
-
-        writer.writerow(issue_data)
-
-    return csv_data
+    queryset = attach_total_attachments_to_queryset(queryset)
+    queryset = attach_custom_attributes_values_to_queryset(queryset)
+
+    def rows():
+        for issue in iterators.iter_queryset_by_chunks(queryset, chunk_size):
+            issue_data = {
+                "ref": issue.ref,
+                "subject": issue.subject,
+                "description": issue.description,
+                "sprint": issue.milestone.name if issue.milestone else None,
+                "sprint_estimated_start": issue.milestone.estimated_start if issue.milestone else None,
+                "sprint_estimated_finish": issue.milestone.estimated_finish if issue.milestone else None,
+                "owner": issue.owner.username if issue.owner else None,
+                "owner_full_name": issue.owner.get_full_name() if issue.owner else None,
+                "assigned_to": issue.assigned_to.username if issue.assigned_to else None,
+                "assigned_to_full_name": issue.assigned_to.get_full_name() if issue.assigned_to else None,
+                "status": issue.status.name if issue.status else None,
+                "severity": issue.severity.name,
+                "priority": issue.priority.name,
+                "type": issue.type.name,
+                "is_closed": issue.is_closed,
+                "attachments": issue.total_attachments,
+                "external_reference": issue.external_reference,
+                "tags": ",".join(issue.tags or []),
+                "watchers": issue.watchers,
+                "voters": issue.total_voters,
+                "created_date": issue.created_date,
+                "modified_date": issue.modified_date,
+                "finished_date": issue.finished_date,
+            }
+
+            for custom_attr in custom_attrs:
+                value = issue.custom_attributes_values_data.get(str(custom_attr.id), None)
+                issue_data[custom_attr.name] = value
+
+            yield issue_data
+
+    return iter_csv(fieldnames, rows())
 
 
 def _get_issues_statuses(project, queryset):
@@ -0,0 +1,76 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Sum
+
+from taiga.projects.models import Project
+from taiga.projects.services.stats import get_stats_for_project
+
+
+class Command(BaseCommand):
+    help = "Measure the computation of the total points of the user stories of a project"
+    option_list = BaseCommand.option_list + (
+        make_option('--project', '-p', default=None, dest='project',
+            help='Slug of the project (the one with more user stories by default)'),
+        make_option('--repeat', '-n', type="int", default=10, dest='repeat',
+            help='Number of repetitions of every measure'),
+    )
+
+    def _measure(self, name, func, repeat):
+        # Warm up
+        func()
+
+        start = time.perf_counter()
+        for i in range(repeat):
+            func()
+        elapsed = time.perf_counter() - start
+
+        print("{:<40} {:>10.2f} ms".format(name, elapsed * 1000 / repeat))
+
+    def handle(self, *args, **options):
+        projects = Project.objects.annotate(num_user_stories=Count("user_stories"))
+        if options["project"]:
+            projects = projects.filter(slug=options["project"])
+        project = projects.order_by("-num_user_stories").first()
+        if project is None:
+            raise CommandError("There is no project")
+
+        print("Project {} with {} user stories".format(project.slug, project.num_user_stories))
+        repeat = options["repeat"]
+
+        def python_total_points():
+            user_stories = project.user_stories.prefetch_related("role_points", "role_points__points")
+            return sum(us.get_total_points() or 0 for us in user_stories)
+
+        def stored_total_points():
+            return sum(points or 0 for points in project.user_stories.values_list("total_points", flat=True))
+
+        def sql_total_points():
+            return project.user_stories.aggregate(points=Sum("total_points"))["points"] or 0
+
+        self._measure("Total points computed in python", python_total_points, repeat)
+        self._measure("Total points stored", stored_total_points, repeat)
+        self._measure("Total points summed in the database", sql_total_points, repeat)
+        self._measure("Project stats", lambda: get_stats_for_project(project), repeat)
+
+        if abs(python_total_points() - stored_total_points()) > 1e-6:
+            raise CommandError("The stored total points are outdated")
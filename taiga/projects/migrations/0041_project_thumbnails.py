@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django_pgjson.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0040_remove_memberships_of_cancelled_users_acounts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='thumbnails',
+            field=django_pgjson.fields.JsonField(default=None, null=True, blank=True, editable=False, verbose_name='thumbnails'),
+            preserve_default=True,
+        ),
+    ]
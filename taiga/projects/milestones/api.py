@@ -34,6 +34,7 @@ from taiga.projects.notifications.utils import attach_watchers_to_queryset, atta
 from . import serializers
 from . import models
 from . import permissions
+from .utils import attach_total_points_to_queryset, attach_closed_points_to_queryset
 
 import datetime
 
@@ -93,6 +94,8 @@ class MilestoneViewSet(HistoryResourceMixin, WatchedResourceMixin,
         # Milestones prefetching
         qs = qs.select_related("project", "owner")
         qs = self.attach_watchers_attrs_to_queryset(qs)
+        qs = attach_total_points_to_queryset(qs)
+        qs = attach_closed_points_to_queryset(qs)
 
         qs = qs.order_by("-estimated_start")
         return qs
@@ -116,10 +119,10 @@ class MilestoneViewSet(HistoryResourceMixin, WatchedResourceMixin,
             'estimated_finish': milestone.estimated_finish,
             'total_points': total_points,
             'completed_points': milestone.closed_points.values(),
-            'total_userstories': milestone.cached_user_stories.count(),
-            'completed_userstories': milestone.cached_user_stories.filter(is_closed=True).count(),
-            'total_tasks': milestone.tasks.count(),
-            'completed_tasks': milestone.tasks.filter(status__is_closed=True).count(),
+            'total_userstories': milestone.total_user_stories,
+            'completed_userstories': milestone.closed_user_stories,
+            'total_tasks': milestone.total_tasks,
+            'completed_tasks': milestone.closed_tasks,
             'iocaine_doses': milestone.tasks.filter(is_iocaine=True).count(),
             'days': []
         }
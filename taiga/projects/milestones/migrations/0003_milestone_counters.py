@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('milestones', '0002_remove_milestone_watchers'),
+        ('tasks', '0009_auto_20151104_1131'),
+        ('userstories', '0012_userstory_tasks_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='milestone',
+            name='total_user_stories',
+            field=models.IntegerField(editable=False, default=0, verbose_name='total user stories'),
+        ),
+        migrations.AddField(
+            model_name='milestone',
+            name='closed_user_stories',
+            field=models.IntegerField(editable=False, default=0, verbose_name='closed user stories'),
+        ),
+        migrations.AddField(
+            model_name='milestone',
+            name='total_tasks',
+            field=models.IntegerField(editable=False, default=0, verbose_name='total tasks'),
+        ),
+        migrations.AddField(
+            model_name='milestone',
+            name='closed_tasks',
+            field=models.IntegerField(editable=False, default=0, verbose_name='closed tasks'),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE milestones_milestone
+               SET total_user_stories = (SELECT count(*)
+                                           FROM userstories_userstory
+                                          WHERE userstories_userstory.milestone_id = milestones_milestone.id),
+                   closed_user_stories = (SELECT count(*)
+                                            FROM userstories_userstory
+                                           WHERE userstories_userstory.milestone_id = milestones_milestone.id AND
+                                                 userstories_userstory.is_closed = true),
+                   total_tasks = (SELECT count(*)
+                                    FROM tasks_task
+                                   WHERE tasks_task.milestone_id = milestones_milestone.id),
+                   closed_tasks = (SELECT count(*)
+                                     FROM tasks_task
+                               INNER JOIN projects_taskstatus ON projects_taskstatus.id = tasks_task.status_id
+                                    WHERE tasks_task.milestone_id = milestones_milestone.id AND
+                                          projects_taskstatus.is_closed = true);
+            """,
+            reverse_sql=migrations.RunSQL.noop
+        ),
+    ]
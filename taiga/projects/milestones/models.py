@@ -25,6 +25,7 @@ from django.core.exceptions import ValidationError
 from django.utils.functional import cached_property
 
 from taiga.base.utils.slug import slugify_uniquely
+from taiga.base.utils import db
 from taiga.base.utils.dicts import dict_sum
 from taiga.projects.notifications.mixins import WatchedModelMixin
 from taiga.projects.userstories.models import UserStory
@@ -56,6 +57,17 @@ class Milestone(WatchedModelMixin, models.Model):
                                       verbose_name=_("disponibility"))
     order = models.PositiveSmallIntegerField(default=1, null=False, blank=False,
                                              verbose_name=_("order"))
+
+    # Maintained by the user stories and tasks signals with relative updates
+    total_user_stories = models.IntegerField(default=0, editable=False,
+                                             verbose_name=_("total user stories"))
+    closed_user_stories = models.IntegerField(default=0, editable=False,
+                                              verbose_name=_("closed user stories"))
+    total_tasks = models.IntegerField(default=0, editable=False, verbose_name=_("total tasks"))
+    closed_tasks = models.IntegerField(default=0, editable=False, verbose_name=_("closed tasks"))
+
+    COUNTERS_FIELDS = ("total_user_stories", "closed_user_stories", "total_tasks", "closed_tasks")
+
     _importing = None
     _total_closed_points_by_date = None
 
@@ -85,6 +97,7 @@ class Milestone(WatchedModelMixin, models.Model):
         if not self.slug:
             self.slug = slugify_uniquely(self.name, self.__class__)
 
+        db.exclude_fields_on_save(self, self.COUNTERS_FIELDS, kwargs)
         super().save(*args, **kwargs)
 
     @cached_property
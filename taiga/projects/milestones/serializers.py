@@ -34,9 +34,20 @@ class MilestoneSerializer(WatchersValidator, WatchedResourceModelSerializer, Val
     class Meta:
         model = models.Milestone
         read_only_fields = ("id", "created_date", "modified_date")
+        exclude = ("total_user_stories", "closed_user_stories", "total_tasks", "closed_tasks")
 
     def get_total_points(self, obj):
+        # The "total_points_value" attribute can be attached in the get_queryset method of the viewset.
+        total_points = getattr(obj, "total_points_value", None)
+        if total_points is not None:
+            return total_points
+
         return sum(obj.total_points.values())
 
     def get_closed_points(self, obj):
+        # The "closed_points_value" attribute can be attached in the get_queryset method of the viewset.
+        closed_points = getattr(obj, "closed_points_value", None)
+        if closed_points is not None:
+            return closed_points
+
         return sum(obj.closed_points.values())
@@ -15,16 +15,84 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from contextlib import closing
+
+from django.db import connection
+from django.db.models import F
 from django.utils import timezone
 
 from . import models
 
 
+def update_user_stories_counters(milestone_id, total=0, closed=0):
+    """
+    Add `total` and `closed` to the user stories counters of a milestone with
+    a relative update, so concurrent changes are not lost.
+    """
+    if milestone_id is None or (total == 0 and closed == 0):
+        return
+
+    models.Milestone.objects.filter(id=milestone_id).update(
+        total_user_stories=F("total_user_stories") + total,
+        closed_user_stories=F("closed_user_stories") + closed)
+
+
+def update_tasks_counters(milestone_id, total=0, closed=0):
+    """
+    Add `total` and `closed` to the tasks counters of a milestone with a
+    relative update, so concurrent changes are not lost.
+    """
+    if milestone_id is None or (total == 0 and closed == 0):
+        return
+
+    models.Milestone.objects.filter(id=milestone_id).update(total_tasks=F("total_tasks") + total,
+                                                            closed_tasks=F("closed_tasks") + closed)
+
+
+def recalculate_counters(milestone_ids=None, project_id=None):
+    """
+    Recalculate from scratch the user stories and tasks counters of some
+    milestones (by ids or all the milestones of a project). Used when the
+    user stories or the tasks change without sending signals.
+    """
+    if milestone_ids is not None:
+        where, params = "milestones_milestone.id = ANY(%s)", [[id for id in milestone_ids if id]]
+        if not params[0]:
+            return
+    else:
+        where, params = "milestones_milestone.project_id = %s", [project_id]
+
+    sql = """
+    UPDATE milestones_milestone
+       SET total_user_stories = (SELECT count(*)
+                                   FROM userstories_userstory
+                                  WHERE userstories_userstory.milestone_id = milestones_milestone.id),
+           closed_user_stories = (SELECT count(*)
+                                    FROM userstories_userstory
+                                   WHERE userstories_userstory.milestone_id = milestones_milestone.id AND
+                                         userstories_userstory.is_closed = true),
+           total_tasks = (SELECT count(*)
+                            FROM tasks_task
+                           WHERE tasks_task.milestone_id = milestones_milestone.id),
+           closed_tasks = (SELECT count(*)
+                             FROM tasks_task
+                       INNER JOIN projects_taskstatus ON projects_taskstatus.id = tasks_task.status_id
+                            WHERE tasks_task.milestone_id = milestones_milestone.id AND
+                                  projects_taskstatus.is_closed = true)
+     WHERE {where};
+    """.format(where=where)
+
+    with closing(connection.cursor()) as cursor:
+        cursor.execute(sql, params)
+
 
 def calculate_milestone_is_closed(milestone):
-    return (milestone.user_stories.all().count() > 0 and
-            all([task.status is not None and task.status.is_closed for task in milestone.tasks.all()]) and
-            all([user_story.is_closed for user_story in milestone.user_stories.all()]))
+    # The counters are updated in the database, the instance could be outdated
+    milestone.refresh_from_db(fields=models.Milestone.COUNTERS_FIELDS)
+
+    return (milestone.total_user_stories > 0 and
+            milestone.closed_tasks == milestone.total_tasks and
+            milestone.closed_user_stories == milestone.total_user_stories)
 
 
 def close_milestone(milestone):
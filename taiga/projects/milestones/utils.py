@@ -0,0 +1,54 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+def attach_total_points_to_queryset(queryset, as_field="total_points_value"):
+    """Attach the sum of the total points of the user stories to each milestone
+    of the queryset.
+
+    :param queryset: A Django queryset object.
+    :param as_field: Attach the total points as an attribute with this name.
+
+    :return: Queryset object with the additional `as_field` field.
+    """
+    model = queryset.model
+    sql = """SELECT COALESCE(SUM(userstories_userstory.total_points), 0)
+               FROM userstories_userstory
+              WHERE userstories_userstory.milestone_id = {tbl}.id"""
+
+    sql = sql.format(tbl=model._meta.db_table)
+    qs = queryset.extra(select={as_field: sql})
+    return qs
+
+
+def attach_closed_points_to_queryset(queryset, as_field="closed_points_value"):
+    """Attach the sum of the total points of the closed user stories to each
+    milestone of the queryset.
+
+    :param queryset: A Django queryset object.
+    :param as_field: Attach the closed points as an attribute with this name.
+
+    :return: Queryset object with the additional `as_field` field.
+    """
+    model = queryset.model
+    sql = """SELECT COALESCE(SUM(userstories_userstory.total_points), 0)
+               FROM userstories_userstory
+              WHERE userstories_userstory.milestone_id = {tbl}.id AND
+                    userstories_userstory.is_closed = true"""
+
+    sql = sql.format(tbl=model._meta.db_table)
+    qs = queryset.extra(select={as_field: sql})
+    return qs
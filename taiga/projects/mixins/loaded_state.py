@@ -0,0 +1,103 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+
+from django.db import models
+from django.dispatch import receiver
+
+
+class LoadedStateMixin(models.Model):
+    """
+    Model mixin that keeps the field values of an instance as they were
+    loaded from (or last saved to) the database.
+
+    This lets the pre/post save handlers know the previous state of an
+    instance without fetching its row again.
+    """
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.update_loaded_state(field_names)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self.update_loaded_state(fields)
+
+    def update_loaded_state(self, fields=None):
+        """
+        Mark the current values of `fields` (all the concrete fields by default)
+        as the stored ones.
+        """
+        loaded_state = self.__dict__.setdefault("_loaded_state", {})
+        if fields is not None:
+            fields = set(fields)
+
+        for field in self._meta.concrete_fields:
+            if fields is not None and field.name not in fields and field.attname not in fields:
+                continue
+
+            value = self.__dict__.get(field.attname, None)
+            if field.attname not in self.__dict__ or hasattr(value, "resolve_expression"):
+                # Deferred fields and expressions (like F() updates) have an unknown value
+                loaded_state.pop(field.attname, None)
+            elif isinstance(value, (list, dict)):
+                loaded_state[field.attname] = copy.copy(value)
+            else:
+                loaded_state[field.attname] = value
+
+    def get_loaded_state(self):
+        """
+        Return a dict with the stored values of the known fields (by attname).
+        It's empty for new instances.
+        """
+        return self.__dict__.get("_loaded_state", {})
+
+    def get_loaded_instance(self):
+        """
+        Return an instance with the stored values of all the fields, or None if
+        some of them are unknown. The cached related objects of the current
+        instance are reused when they are still the same.
+        """
+        loaded_state = self.get_loaded_state()
+        fields = self._meta.concrete_fields
+        if any(field.attname not in loaded_state for field in fields):
+            return None
+
+        instance = self.__class__(**loaded_state)
+        instance._state.adding = False
+        instance._state.db = self._state.db
+
+        for field in fields:
+            cache_name = field.get_cache_name() if field.is_relation else None
+            if (cache_name and cache_name in self.__dict__ and
+                    getattr(self, field.attname) == loaded_state[field.attname]):
+                setattr(instance, cache_name, self.__dict__[cache_name])
+
+        return instance
+
+
+# This receiver is connected when the models are loaded, before the ones of the
+# apps, so the nested saves of their handlers already see the stored state.
+@receiver(models.signals.post_save, dispatch_uid="loaded_state_post_save")
+def loaded_state_post_save(sender, instance, update_fields=None, **kwargs):
+    if isinstance(instance, LoadedStateMixin):
+        instance.update_loaded_state(update_fields)
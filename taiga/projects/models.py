@@ -152,6 +152,8 @@ class Project(ProjectDefaults, TaggedMixin, models.Model):
     logo = models.FileField(upload_to=get_project_logo_file_path,
                              max_length=500, null=True, blank=True,
                              verbose_name=_("logo"))
+    thumbnails = JsonField(null=True, blank=True, default=None, editable=False,
+                           verbose_name=_("thumbnails"))
 
     created_date = models.DateTimeField(null=False, blank=False,
                                         verbose_name=_("created date"),
@@ -390,8 +392,15 @@ class Project(ProjectDefaults, TaggedMixin, models.Model):
         # Now remove rolepoints associated with not existing roles.
         rp_query = RolePoints.objects.filter(user_story__in=self.user_stories.all())
         rp_query = rp_query.exclude(role__id__in=roles.values_list("id", flat=True))
+        changed_user_story_ids = set(rp_query.values_list("user_story_id", flat=True))
         rp_query.delete()
 
+        # The new role points have a null value, only the removed ones change
+        # the total points of the user stories
+        if changed_user_story_ids:
+            from taiga.projects.userstories.services import recalculate_total_points
+            recalculate_total_points(user_story_ids=changed_user_story_ids)
+
     @property
     def project(self):
         return self
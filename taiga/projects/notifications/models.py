@@ -22,6 +22,8 @@ from django.db import models
 from django.utils.translation import ugettext_lazy as _
 from django.utils import timezone
 
+from djorm_pgarray.fields import IntegerArrayField
+
 from taiga.projects.history.choices import HISTORY_TYPE_CHOICES
 
 from .choices import NOTIFY_LEVEL_CHOICES, NotifyLevel
@@ -92,3 +94,15 @@ class Watched(models.Model):
         verbose_name = _("Watched")
         verbose_name_plural = _("Watched")
         unique_together = ("content_type", "object_id", "user", "project")
+
+
+class WatchedCountersMixin(models.Model):
+    # Maintained by the watched signals with relative updates
+    total_watchers = models.IntegerField(default=0, editable=False, verbose_name=_("total watchers"))
+    watchers_ids = IntegerArrayField(null=False, blank=True, default=list, editable=False,
+                                     verbose_name=_("watchers ids"))
+
+    WATCHERS_COUNTERS_FIELDS = ("total_watchers", "watchers_ids")
+
+    class Meta:
+        abstract = True
@@ -20,7 +20,7 @@ import datetime
 from functools import partial
 
 from django.apps import apps
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, transaction, connection
 from django.db.models import Q
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth import get_user_model
@@ -37,7 +37,7 @@ from taiga.projects.history.services import (make_key_from_model_object,
                                              get_model_from_key)
 from taiga.permissions.service import user_has_perm
 
-from .models import HistoryChangeNotification, Watched
+from .models import HistoryChangeNotification, Watched, WatchedCountersMixin
 
 
 def notify_policy_exists(project, user) -> bool:
@@ -419,6 +419,36 @@ def remove_watcher(obj, user):
     qs.delete()
 
 
+def update_watchers_counters(content_type_id, object_id, user_id, *, added:bool):
+    """Update the stored watchers of an object after adding or removing a watcher.
+
+    Only the models with the `WatchedCountersMixin` store them, the rest of them
+    are ignored.
+
+    :param content_type_id: Content type id of the watched object.
+    :param object_id: Id of the watched object.
+    :param user_id: Id of the added or removed watcher.
+    :param added: True if the watcher was added, False if it was removed.
+    """
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    if model is None or not issubclass(model, WatchedCountersMixin):
+        return
+
+    if added:
+        sql = """UPDATE {tbl}
+                    SET total_watchers = total_watchers + 1,
+                        watchers_ids = array_append(watchers_ids, %s)
+                  WHERE id = %s"""
+    else:
+        sql = """UPDATE {tbl}
+                    SET total_watchers = total_watchers - 1,
+                        watchers_ids = array_remove(watchers_ids, %s)
+                  WHERE id = %s"""
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql.format(tbl=model._meta.db_table), [user_id, object_id])
+
+
 def set_notify_policy_level(notify_policy, notify_level):
     """
     Set notification level for specified policy.
@@ -0,0 +1,33 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from . import services
+
+
+####################################
+# Signals for the watchers counters
+####################################
+
+def update_watchers_counters_when_create_watched(sender, instance, created, **kwargs):
+    if created:
+        services.update_watchers_counters(instance.content_type_id, instance.object_id,
+                                          instance.user_id, added=True)
+
+
+def update_watchers_counters_when_delete_watched(sender, instance, **kwargs):
+    services.update_watchers_counters(instance.content_type_id, instance.object_id,
+                                      instance.user_id, added=False)
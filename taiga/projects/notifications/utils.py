@@ -18,6 +18,7 @@
 
 from django.apps import apps
 from .choices import NotifyLevel
+from .models import WatchedCountersMixin
 from taiga.base.utils.text import strip_lines
 
 def attach_watchers_to_queryset(queryset, as_field="watchers"):
@@ -29,6 +30,11 @@ def attach_watchers_to_queryset(queryset, as_field="watchers"):
     :return: Queryset object with the additional `as_field` field.
     """
     model = queryset.model
+    if issubclass(model, WatchedCountersMixin):
+        # The watchers are stored in the model
+        sql = "{tbl}.watchers_ids".format(tbl=model._meta.db_table)
+        return queryset.extra(select={as_field: sql})
+
     type = apps.get_model("contenttypes", "ContentType").objects.get_for_model(model)
 
     sql = ("""SELECT array(SELECT user_id
@@ -51,6 +57,11 @@ def attach_is_watcher_to_queryset(queryset, user, as_field="is_watcher"):
     :return: Queryset object with the additional `as_field` field.
     """
     model = queryset.model
+    if issubclass(model, WatchedCountersMixin):
+        # The watchers are stored in the model
+        sql = "{user_id} = ANY({tbl}.watchers_ids)".format(tbl=model._meta.db_table, user_id=user.id)
+        return queryset.extra(select={as_field: sql})
+
     type = apps.get_model("contenttypes", "ContentType").objects.get_for_model(model)
     sql = ("""SELECT CASE WHEN (SELECT count(*)
                                   FROM notifications_watched
@@ -75,6 +86,14 @@ def attach_total_watchers_to_queryset(queryset, as_field="total_watchers"):
     :return: Queryset object with the additional `as_field` field.
     """
     model = queryset.model
+    if issubclass(model, WatchedCountersMixin):
+        # The total is stored in the model
+        if as_field == "total_watchers":
+            return queryset
+
+        sql = "{tbl}.total_watchers".format(tbl=model._meta.db_table)
+        return queryset.extra(select={as_field: sql})
+
     type = apps.get_model("contenttypes", "ContentType").objects.get_for_model(model)
     sql = ("""SELECT count(*)
                 FROM notifications_watched
@@ -21,6 +21,7 @@ from django.utils.translation import ugettext_lazy as _
 from taiga.base import exceptions as exc
 from taiga.base.utils import db
 from taiga.projects.history.services import get_modified_fields
+from taiga.projects.mixins.loaded_state import LoadedStateMixin
 
 
 class OCCResourceMixin(object):
@@ -51,7 +52,11 @@ class OCCResourceMixin(object):
     def _validate_and_update_version(self, obj):
         current_version = None
         if obj.id:
-            current_version = type(obj).objects.model.objects.get(id=obj.id).version
+            # Use the version loaded with the object if it's known
+            if isinstance(obj, LoadedStateMixin) and "version" in obj.get_loaded_state():
+                current_version = obj.get_loaded_state()["version"]
+            else:
+                current_version = type(obj).objects.model.objects.get(id=obj.id).version
 
             # Extract param version
             param_version = self._extract_param_version()
@@ -84,9 +89,11 @@ class OCCResourceMixin(object):
         super().post_save(obj, created)
         if not created:
             obj.version = db.reload_attribute(obj, 'version')
+            if isinstance(obj, LoadedStateMixin):
+                obj.update_loaded_state(["version"])
 
 
-class OCCModelMixin(models.Model):
+class OCCModelMixin(LoadedStateMixin, models.Model):
     """
     Generic model mixin that makes model compatible
     with concurrency control system.
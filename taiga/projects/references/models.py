@@ -56,6 +56,32 @@ def make_unique_reference_id(project, *, create=False):
     return seq.next_value(seqname)
 
 
+def make_unique_reference_ids(project, count, *, create=False):
+    seqname = make_sequence_name(project)
+    if create and not seq.exists(seqname):
+        seq.create(seqname)
+    return seq.next_values(seqname, count)
+
+
+def reserve_references(instances):
+    """
+    Allocate the refs of some new user stories, tasks or issues with a single
+    call to the sequence of each project. The references are created when
+    they are saved.
+    """
+    instances_by_project = {}
+    for instance in instances:
+        if instance.project_id is None:
+            continue
+        instances_by_project.setdefault(instance.project_id, []).append(instance)
+
+    for project_instances in instances_by_project.values():
+        refvals = make_unique_reference_ids(project_instances[0].project, len(project_instances))
+        for instance, refval in zip(project_instances, refvals):
+            instance.ref = refval
+            instance._reserved_ref = refval
+
+
 def make_reference(instance, project, create=False):
     refval = make_unique_reference_id(project, create=create)
     ct = ContentType.objects.get_for_model(instance.__class__)
@@ -82,30 +108,52 @@ def delete_sequence(sender, instance, **kwargs):
 
 
 def store_previous_project(sender, instance, **kwargs):
-    try:
-        prev_instance = sender.objects.get(pk=instance.pk)
-        instance.prev_project = prev_instance.project
-    except sender.DoesNotExist:
-        instance.prev_project = None
+    instance.prev_project_id = None
+    if instance._state.adding:
+        return
 
+    loaded_state = instance.get_loaded_state()
+    if "project_id" in loaded_state:
+        instance.prev_project_id = loaded_state["project_id"]
+    else:
+        prev_project_ids = sender.objects.filter(pk=instance.pk).values_list("project_id", flat=True)
+        instance.prev_project_id = next(iter(prev_project_ids), None)
 
-def attach_sequence(sender, instance, created, **kwargs):
+
+def allocate_sequence(sender, instance, **kwargs):
     if not instance._importing:
-        if created or instance.prev_project != instance.project:
-            # Create a reference object. This operation should be
-            # used in transaction context, otherwise it can
-            # create a lot of phantom reference objects.
-            refval, _ = make_reference(instance, instance.project)
+        if instance._state.adding or instance.prev_project_id != instance.project_id:
+            # Allocate the ref before saving, so the instance is written only
+            # once. It can be reserved before (see `reserve_references`)
+            refval = getattr(instance, "_reserved_ref", None)
+            if refval is None or instance.prev_project_id is not None:
+                refval = make_unique_reference_id(instance.project)
 
-            # Additionally, attach sequence number to instance as ref
             instance.ref = refval
-            instance.save(update_fields=['ref'])
+            instance._reserved_ref = None
+            instance._pending_reference = True
+
+
+def attach_sequence(sender, instance, created, **kwargs):
+    if getattr(instance, "_pending_reference", False):
+        # Create a reference object. This operation should be
+        # used in transaction context, otherwise it can
+        # create a lot of phantom reference objects.
+        ct = ContentType.objects.get_for_model(instance.__class__)
+        Reference.objects.create(content_type=ct,
+                                 object_id=instance.pk,
+                                 ref=instance.ref,
+                                 project=instance.project)
+        instance._pending_reference = False
 
 
 models.signals.post_save.connect(create_sequence, sender=Project, dispatch_uid="refproj")
 models.signals.pre_save.connect(store_previous_project, sender=UserStory, dispatch_uid="refus")
 models.signals.pre_save.connect(store_previous_project, sender=Issue, dispatch_uid="refissue")
 models.signals.pre_save.connect(store_previous_project, sender=Task, dispatch_uid="reftask")
+models.signals.pre_save.connect(allocate_sequence, sender=UserStory, dispatch_uid="refallocus")
+models.signals.pre_save.connect(allocate_sequence, sender=Issue, dispatch_uid="refallocissue")
+models.signals.pre_save.connect(allocate_sequence, sender=Task, dispatch_uid="refalloctask")
 models.signals.post_save.connect(attach_sequence, sender=UserStory, dispatch_uid="refus")
 models.signals.post_save.connect(attach_sequence, sender=Issue, dispatch_uid="refissue")
 models.signals.post_save.connect(attach_sequence, sender=Task, dispatch_uid="reftask")
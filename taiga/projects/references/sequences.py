@@ -58,6 +58,17 @@ def next_value(seqname):
         result = cursor.fetchone()
         return result[0]
 
+def next_values(seqname, count:int) -> list:
+    """
+    Reserve `count` values of the sequence with a single query. The values
+    are consecutive unless other values are requested concurrently, but they
+    are always unique and increasing.
+    """
+    sql = "SELECT nextval(%s) FROM generate_series(1, %s);"
+    with closing(connection.cursor()) as cursor:
+        cursor.execute(sql, [seqname, count])
+        return sorted(row[0] for row in cursor.fetchall())
+
 def set_max(seqname, new_value):
     sql = "SELECT setval(%s, GREATEST(nextval(%s), %s));"
     with closing(connection.cursor()) as cursor:
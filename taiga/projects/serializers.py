@@ -27,6 +27,7 @@ from taiga.base.fields import TagsColorsField
 
 from taiga.projects.notifications.choices import NotifyLevel
 from taiga.users.services import get_photo_or_gravatar_url
+from taiga.users.services import get_photos_or_gravatars_urls
 from taiga.users.serializers import UserSerializer
 from taiga.users.serializers import UserBasicInfoSerializer
 from taiga.users.serializers import ProjectRoleSerializer
@@ -236,6 +237,9 @@ class ProjectMemberSerializer(serializers.ModelSerializer):
                    "user_order")
 
     def get_photo(self, membership):
+        photos = self.context.get("users_photos", None)
+        if photos is not None and membership.user_id in photos:
+            return photos[membership.user_id]
         return get_photo_or_gravatar_url(membership.user)
 
 
@@ -269,7 +273,7 @@ class ProjectSerializer(FanResourceSerializerMixin, WatchedResourceModelSerializ
         read_only_fields = ("created_date", "modified_date", "slug", "blocked_code")
         exclude = ("logo", "last_us_ref", "last_task_ref", "last_issue_ref",
                    "issues_csv_uuid", "tasks_csv_uuid", "userstories_csv_uuid",
-                   "transfer_token")
+                   "transfer_token", "thumbnails")
 
     def get_my_permissions(self, obj):
         if "request" in self.context:
@@ -351,7 +355,9 @@ class ProjectDetailSerializer(ProjectSerializer):
         qs = qs.extra(select={"complete_user_name":"concat(full_name, username)"})
         qs = qs.order_by("complete_user_name")
         qs = qs.select_related("role", "user")
-        serializer = ProjectMemberSerializer(qs, many=True)
+        memberships = list(qs)
+        users_photos = get_photos_or_gravatars_urls(m.user for m in memberships)
+        serializer = ProjectMemberSerializer(memberships, many=True, context={"users_photos": users_photos})
         return serializer.data
 
     def get_total_memberships(self, obj):
@@ -368,7 +374,7 @@ class ProjectDetailAdminSerializer(ProjectDetailSerializer):
     class Meta:
         model = models.Project
         read_only_fields = ("created_date", "modified_date", "slug", "blocked_code")
-        exclude = ("logo", "last_us_ref", "last_task_ref", "last_issue_ref")
+        exclude = ("logo", "last_us_ref", "last_task_ref", "last_issue_ref", "thumbnails")
 
     def get_is_private_extra_info(self, obj):
         return services.check_if_project_privacity_can_be_changed(obj)
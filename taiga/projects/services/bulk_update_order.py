@@ -17,7 +17,11 @@
 
 from django.db import transaction, connection
 from django.core.exceptions import ObjectDoesNotExist
+from django.utils.translation import ugettext as _
 
+from taiga.base import exceptions as exc
+from taiga.base.utils.db import get_typename_for_model_class
+from taiga.events import events
 from taiga.projects import models
 
 from contextlib import suppress
@@ -44,126 +48,79 @@ def update_projects_order_in_bulk(bulk_data:list, field:str, user):
     db.update_in_bulk_with_ids(membership_ids, new_order_values, model=models.Membership)
 
 
-@transaction.atomic
-def bulk_update_userstory_status_order(project, user, data):
-    cursor = connection.cursor()
-
-    sql = """
-    prepare bulk_update_order as update projects_userstorystatus set "order" = $1
-        where projects_userstorystatus.id = $2 and
-              projects_userstorystatus.project_id = $3;
-    """
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
-    cursor.close()
+def _parse_order_pairs(data):
+    ids = []
+    orders = []
+    try:
+        for id, order in data:
+            ids.append(int(id))
+            orders.append(int(order))
+    except (TypeError, ValueError):
+        raise exc.WrongArguments(_("Invalid order data, expected a list of (id, order) pairs"))
+    return ids, orders
 
 
 @transaction.atomic
-def bulk_update_points_order(project, user, data):
-    cursor = connection.cursor()
-
-    sql = """
-    prepare bulk_update_order as update projects_points set "order" = $1
-        where projects_points.id = $2 and
-              projects_points.project_id = $3;
+def bulk_update_order(model, project, data, *, field:str="order"):
     """
+    Update the `field` of some objects of `model` that belongs to `project`
+    with a single query. `data` should be a list of pairs with the
+    following format:
 
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
-    cursor.close()
-
+    [(<object id>, <new order>), ...]
 
-@transaction.atomic
-def bulk_update_task_status_order(project, user, data):
-    cursor = connection.cursor()
+    Pairs with ids that don't belong to the project are ignored. A single
+    change event is emited with the ids of all the updated objects.
+    """
+    ids, orders = _parse_order_pairs(data)
+    if not ids:
+        return []
 
+    table = model._meta.db_table
     sql = """
-    prepare bulk_update_order as update projects_taskstatus set "order" = $1
-        where projects_taskstatus.id = $2 and
-              projects_taskstatus.project_id = $3;
-    """
+    UPDATE {table} SET "{field}" = tmp.new_order
+      FROM unnest(%s::int[], %s::int[]) AS tmp(id, new_order)
+     WHERE {table}.id = tmp.id AND
+           {table}.project_id = %s
+    RETURNING {table}.id;
+    """.format(table=table, field=field)
 
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
+    cursor = connection.cursor()
+    cursor.execute(sql, (ids, orders, project.id))
+    updated_ids = [row[0] for row in cursor.fetchall()]
     cursor.close()
 
+    if updated_ids:
+        content_type = get_typename_for_model_class(model)
+        connection.on_commit(lambda: events.emit_event_for_ids(ids=updated_ids,
+                                                               content_type=content_type,
+                                                               projectid=project.pk))
+    return updated_ids
 
-@transaction.atomic
-def bulk_update_issue_status_order(project, user, data):
-    cursor = connection.cursor()
-
-    sql = """
-    prepare bulk_update_order as update projects_issuestatus set "order" = $1
-        where projects_issuestatus.id = $2 and
-              projects_issuestatus.project_id = $3;
-    """
 
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
-    cursor.close()
+def bulk_update_userstory_status_order(project, user, data):
+    return bulk_update_order(models.UserStoryStatus, project, data)
 
 
-@transaction.atomic
-def bulk_update_issue_type_order(project, user, data):
-    cursor = connection.cursor()
+def bulk_update_points_order(project, user, data):
+    return bulk_update_order(models.Points, project, data)
 
-    sql = """
-    prepare bulk_update_order as update projects_issuetype set "order" = $1
-        where projects_issuetype.id = $2 and
-              projects_issuetype.project_id = $3;
-    """
 
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
-    cursor.close()
+def bulk_update_task_status_order(project, user, data):
+    return bulk_update_order(models.TaskStatus, project, data)
 
 
-@transaction.atomic
-def bulk_update_priority_order(project, user, data):
-    cursor = connection.cursor()
+def bulk_update_issue_status_order(project, user, data):
+    return bulk_update_order(models.IssueStatus, project, data)
 
-    sql = """
-    prepare bulk_update_order as update projects_priority set "order" = $1
-        where projects_priority.id = $2 and
-              projects_priority.project_id = $3;
-    """
 
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
-    cursor.close()
+def bulk_update_issue_type_order(project, user, data):
+    return bulk_update_order(models.IssueType, project, data)
 
 
-@transaction.atomic
-def bulk_update_severity_order(project, user, data):
-    cursor = connection.cursor()
+def bulk_update_priority_order(project, user, data):
+    return bulk_update_order(models.Priority, project, data)
 
-    sql = """
-    prepare bulk_update_order as update projects_severity set "order" = $1
-        where projects_severity.id = $2 and
-              projects_severity.project_id = $3;
-    """
 
-    cursor.execute(sql)
-    for id, order in data:
-        cursor.execute("EXECUTE bulk_update_order (%s, %s, %s);",
-                       (order, id, project.id))
-    cursor.execute("DEALLOCATE bulk_update_order")
-    cursor.close()
+def bulk_update_severity_order(project, user, data):
+    return bulk_update_order(models.Severity, project, data)
@@ -16,7 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from django.utils.translation import ugettext as _
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Sum
 from django.apps import apps
 import datetime
 import copy
@@ -224,27 +224,29 @@ def _get_milestones_stats_for_backlog(project, milestones):
 
 
 def get_stats_for_project(project):
-    # Let's fetch all the estimations related to a project with all the necesary
-    # related data
+    # Let's aggregate all the estimations related to a project in the database
     RolePoints = apps.get_model('userstories', 'RolePoints')
-    role_points = RolePoints.objects.filter(
-        user_story__project = project,
-    ).prefetch_related(
-        "user_story",
-        "user_story__assigned_to",
-        "user_story__milestone",
-        "user_story__status",
-        "role",
-        "points")
-
-    # Data inicialization
-    project._closed_points = 0
-    project._closed_points_per_role = {}
-    project._closed_points_from_closed_milestones = 0
-    project._defined_points = 0
-    project._defined_points_per_role = {}
-    project._assigned_points = 0
-    project._assigned_points_per_role = {}
+    role_points = RolePoints.objects.filter(user_story__project=project,
+                                            points__value__isnull=False).order_by()
+
+    def _sum_points(queryset):
+        return queryset.aggregate(points=Sum("points__value"))["points"] or 0
+
+    def _sum_points_per_role(queryset):
+        queryset = queryset.values("role").annotate(points=Sum("points__value"))
+        return {rp["role"]: rp["points"] for rp in queryset}
+
+    closed_role_points = role_points.filter(user_story__is_closed=True)
+    assigned_role_points = role_points.filter(user_story__milestone__isnull=False)
+
+    project._defined_points = _sum_points(role_points)
+    project._defined_points_per_role = _sum_points_per_role(role_points)
+    project._closed_points = _sum_points(closed_role_points)
+    project._closed_points_per_role = _sum_points_per_role(closed_role_points)
+    project._closed_points_from_closed_milestones = _sum_points(
+        role_points.filter(user_story__milestone__closed=True))
+    project._assigned_points = _sum_points(assigned_role_points)
+    project._assigned_points_per_role = _sum_points_per_role(assigned_role_points)
     project._future_team_increment = 0
     project._future_client_increment = 0
 
@@ -256,12 +258,16 @@ def get_stats_for_project(project):
         milestone._client_increment_points = 0
         milestones[milestone.id] = milestone
 
-    def _find_milestone_for_userstory(user_story):
-        for m in milestones.values():
-            if m.estimated_finish > user_story.created_date.date() and\
-               m.estimated_start <= user_story.created_date.date():
+    closed_points_per_milestone = (closed_role_points.filter(user_story__milestone__isnull=False)
+                                                     .values("user_story__milestone")
+                                                     .annotate(points=Sum("points__value")))
+    for rp in closed_points_per_milestone:
+        milestones[rp["user_story__milestone"]]._closed_points = rp["points"]
 
-              return m
+    def _find_milestone_for_date(date):
+        for m in milestones.values():
+            if m.estimated_finish > date and m.estimated_start <= date:
+                return m
 
         return None
 
@@ -277,48 +283,16 @@ def get_stats_for_project(project):
         else:
             project._future_client_increment += value
 
-    # Iterate over all the project estimations and update our stats
-    for role_point in role_points:
-        role_id = role_point.role.id
-        points_value = role_point.points.value
-        milestone = role_point.user_story.milestone
-        is_team_requirement = role_point.user_story.team_requirement
-        is_client_requirement = role_point.user_story.client_requirement
-        us_milestone = _find_milestone_for_userstory(role_point.user_story)
-
-        # None estimations doesn't affect to project stats
-        if points_value is None:
-            continue
-
-        # Total defined points
-        project._defined_points += points_value
-
-        # Defined points per role
-        project._defined_points_for_role = project._defined_points_per_role.get(role_id, 0)
-        project._defined_points_for_role += points_value
-        project._defined_points_per_role[role_id] = project._defined_points_for_role
-
-        # Closed points
-        if role_point.user_story.is_closed:
-            project._closed_points += points_value
-            closed_points_for_role = project._closed_points_per_role.get(role_id, 0)
-            closed_points_for_role += points_value
-            project._closed_points_per_role[role_id] = closed_points_for_role
-
-            if milestone is not None:
-                milestones[milestone.id]._closed_points += points_value
-
-        if milestone is not None and milestone.closed:
-            project._closed_points_from_closed_milestones += points_value
-
-        # Assigned to milestone points
-        if role_point.user_story.milestone is not None:
-            project._assigned_points += points_value
-            assigned_points_for_role = project._assigned_points_per_role.get(role_id, 0)
-            assigned_points_for_role += points_value
-            project._assigned_points_per_role[role_id] = assigned_points_for_role
-
-        # Extra requirements
+    # Extra requirements
+    requirements = (role_points.filter(Q(user_story__team_requirement=True) |
+                                       Q(user_story__client_requirement=True))
+                               .values_list("user_story__created_date",
+                                            "user_story__team_requirement",
+                                            "user_story__client_requirement")
+                               .annotate(points=Sum("points__value")))
+    for created_date, is_team_requirement, is_client_requirement, points_value in requirements:
+        us_milestone = _find_milestone_for_date(created_date.date())
+
         if is_team_requirement and is_client_requirement:
             _update_team_increment(us_milestone, points_value/2)
             _update_client_increment(us_milestone, points_value/2)
@@ -100,15 +100,55 @@ def try_to_close_or_open_user_stories_when_edit_us_status(sender, instance, crea
             services.open_userstory(user_story)
 
 
+## Points
+
+def update_total_points_when_edit_points(sender, instance, created, **kwargs):
+    from taiga.projects.userstories import services
+
+    if created:
+        return
+
+    services.recalculate_total_points(points_id=instance.id)
+
+
+def update_total_points_when_delete_points(sender, instance, **kwargs):
+    from taiga.projects.userstories import services
+
+    # The role points of the points could be moved to another one without signals
+    services.recalculate_total_points(project_id=instance.project_id)
+
+
 ## Task statuses
 
 def try_to_close_or_open_user_stories_when_edit_task_status(sender, instance, created, **kwargs):
     from taiga.projects.userstories import services
+    from taiga.projects.milestones import services as milestone_services
+
+    if created:
+        return
 
     UserStory = apps.get_model("userstories", "UserStory")
+    Task = apps.get_model("tasks", "Task")
+
+    # The status could be closed or reopened, recalculate the counters of
+    # the affected user stories and milestones
+    tasks = Task.objects.filter(status=instance).order_by()
+    services.recalculate_tasks_counters(
+        user_story_ids=tasks.values_list("user_story_id", flat=True).distinct())
+    milestone_services.recalculate_counters(
+        milestone_ids=tasks.values_list("milestone_id", flat=True).distinct())
 
     for user_story in UserStory.objects.filter(tasks__status=instance).distinct():
         if services.calculate_userstory_is_closed(user_story):
             services.close_userstory(user_story)
         else:
             services.open_userstory(user_story)
+
+
+def update_counters_when_delete_task_status(sender, instance, **kwargs):
+    from taiga.projects.userstories import services
+    from taiga.projects.milestones import services as milestone_services
+
+    # The tasks of the status could be moved to another one without signals
+    services.recalculate_tasks_counters(project_id=instance.project_id)
+    milestone_services.recalculate_counters(project_id=instance.project_id)
@@ -23,8 +23,9 @@ from taiga.base import exceptions as exc
 from taiga.base.decorators import list_route
 from taiga.base.api import ModelCrudViewSet, ModelListViewSet
 from taiga.base.api.mixins import BlockedByProjectMixin
+from taiga.base.serialized_cache import SerializedCacheResourceMixin
 from taiga.projects.models import Project, TaskStatus
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 
 from taiga.projects.notifications.mixins import WatchedResourceMixin, WatchersViewSetMixin
 from taiga.projects.history.mixins import HistoryResourceMixin
@@ -38,8 +39,8 @@ from . import serializers
 from . import services
 
 
-class TaskViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin, WatchedResourceMixin,
-                  BlockedByProjectMixin, ModelCrudViewSet):
+class TaskViewSet(SerializedCacheResourceMixin, OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin,
+                  WatchedResourceMixin, BlockedByProjectMixin, ModelCrudViewSet):
     queryset = models.Task.objects.all()
     permission_classes = (permissions.TaskPermission,)
     filter_backends = (filters.CanViewTasksFilterBackend, filters.WatchersFilter)
@@ -136,8 +137,8 @@ class TaskViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin, Wa
 
         project = get_object_or_404(Project, tasks_csv_uuid=uuid)
         queryset = project.tasks.all().order_by('ref')
-        data = services.tasks_to_csv(project, queryset)
-        csv_response = HttpResponse(data.getvalue(), content_type='application/csv; charset=utf-8')
+        data = services.tasks_to_csv_stream(project, queryset)
+        csv_response = StreamingHttpResponse(data, content_type='application/csv; charset=utf-8')
         csv_response['Content-Disposition'] = 'attachment; filename="tasks.csv"'
         return csv_response
 
@@ -25,11 +25,15 @@ from djorm_pgarray.fields import TextArrayField
 
 from taiga.projects.occ import OCCModelMixin
 from taiga.projects.notifications.mixins import WatchedModelMixin
+from taiga.projects.notifications.models import WatchedCountersMixin
+from taiga.projects.votes.models import VotedCountersMixin
 from taiga.projects.mixins.blocked import BlockedMixin
 from taiga.base.tags import TaggedMixin
+from taiga.base.utils import db
 
 
-class Task(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.Model):
+class Task(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, VotedCountersMixin,
+           WatchedCountersMixin, models.Model):
     user_story = models.ForeignKey("userstories.UserStory", null=True, blank=True,
                                    related_name="tasks", verbose_name=_("user story"))
     ref = models.BigIntegerField(db_index=True, null=True, blank=True, default=None,
@@ -66,6 +70,9 @@ class Task(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.M
     is_iocaine = models.BooleanField(default=False, null=False, blank=True,
                                      verbose_name=_("is iocaine"))
     external_reference = TextArrayField(default=None, verbose_name=_("external reference"))
+
+    DENORMALIZED_FIELDS = VotedCountersMixin.VOTES_COUNTERS_FIELDS + WatchedCountersMixin.WATCHERS_COUNTERS_FIELDS
+
     _importing = None
 
     class Meta:
@@ -84,6 +91,7 @@ class Task(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.M
         if not self.status:
             self.status = self.project.default_task_status
 
+        db.exclude_fields_on_save(self, self.DENORMALIZED_FIELDS, kwargs)
         return super().save(*args, **kwargs)
 
     def __str__(self):
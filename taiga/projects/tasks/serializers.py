@@ -21,6 +21,7 @@ from taiga.base.fields import TagsField
 from taiga.base.fields import PgArrayField
 
 from taiga.base.neighbors import NeighborsSerializerMixin
+from taiga.base.serialized_cache import CachedSerializerMixin
 
 from taiga.mdrender.service import render as mdrender
 from taiga.projects.validators import ProjectExistsValidator
@@ -51,6 +52,7 @@ class TaskSerializer(WatchersValidator, VoteResourceSerializerMixin, EditableWat
     class Meta:
         model = models.Task
         read_only_fields = ('id', 'ref', 'created_date', 'modified_date', 'owner')
+        exclude = ("watchers_ids",)
 
     def get_comment(self, obj):
         return ""
@@ -71,11 +73,17 @@ class TaskSerializer(WatchersValidator, VoteResourceSerializerMixin, EditableWat
         return obj.status is not None and obj.status.is_closed
 
 
-class TaskListSerializer(TaskSerializer):
+class TaskListSerializer(CachedSerializerMixin, TaskSerializer):
+    serialized_cache_fresh_fields = ("is_voter", "total_voters", "is_watcher", "total_watchers", "watchers",
+                                     "us_order", "taskboard_order", "user_story", "milestone",
+                                     "milestone_slug", "status", "status_extra_info", "is_closed",
+                                     "finished_date", "modified_date", "tags", "owner_extra_info",
+                                     "assigned_to_extra_info")
+
     class Meta:
         model = models.Task
         read_only_fields = ('id', 'ref', 'created_date', 'modified_date')
-        exclude=("description", "description_html")
+        exclude=("description", "description_html", "watchers_ids")
 
 
 class TaskNeighborsSerializer(NeighborsSerializerMixin, TaskSerializer):
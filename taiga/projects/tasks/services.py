@@ -16,9 +16,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import io
-import csv
 
-from taiga.base.utils import db, text
+from taiga.base.utils import db, iterators, text
+from taiga.base.utils.streaming import iter_csv
 from taiga.projects.history.services import take_snapshot
 from taiga.projects.tasks.apps import (
     connect_tasks_signals,
@@ -26,6 +26,8 @@ from taiga.projects.tasks.apps import (
 from taiga.events import events
 from taiga.projects.votes.utils import attach_total_voters_to_queryset
 from taiga.projects.notifications.utils import attach_watchers_to_queryset
+from taiga.projects.attachments.utils import attach_total_attachments_to_queryset
+from taiga.projects.custom_attributes.utils import attach_custom_attributes_values_to_queryset
 
 from . import models
 
@@ -53,6 +55,10 @@ def create_tasks_in_bulk(bulk_data, callback=None, precall=None, **additional_fi
     """
     tasks = get_tasks_from_bulk(bulk_data, **additional_fields)
 
+    # Allocate all the refs with a single call to the sequence
+    from taiga.projects.references.models import reserve_references
+    reserve_references(tasks)
+
     disconnect_tasks_signals()
 
     try:
@@ -95,18 +101,22 @@ def snapshot_tasks_in_bulk(bulk_data, user):
 
 def tasks_to_csv(project, queryset):
     csv_data = io.StringIO()
+    csv_data.writelines(tasks_to_csv_stream(project, queryset))
+    return csv_data
+
+
+def tasks_to_csv_stream(project, queryset, chunk_size=500):
     fieldnames = ["ref", "subject", "description", "user_story", "sprint", "sprint_estimated_start",
                   "sprint_estimated_finish", "owner", "owner_full_name", "assigned_to",
                   "assigned_to_full_name", "status", "is_iocaine", "is_closed", "us_order",
                   "taskboard_order", "attachments", "external_reference", "tags", "watchers", "voters"]
 
-    custom_attrs = project.taskcustomattributes.all()
+    custom_attrs = list(project.taskcustomattributes.all())
     for custom_attr in custom_attrs:
         fieldnames.append(custom_attr.name)
 
-    queryset = queryset.prefetch_related("attachments",
-                                         "custom_attributes_values")
     queryset = queryset.select_related("milestone",
+                                       "user_story",
                                        "owner",
                                        "assigned_to",
                                        "status",
@@ -114,37 +124,38 @@ def tasks_to_csv(project, queryset):
 
     queryset = attach_total_voters_to_queryset(queryset)
     queryset = attach_watchers_to_queryset(queryset)
-
-    writer = csv.DictWriter(csv_data, fieldnames=fieldnames)
-    writer.writeheader()
-    for task in queryset:
-        task_data = {
-            "ref": task.ref,
-            "subject": task.subject,
-            "description": task.description,
-            "user_story": task.user_story.ref if task.user_story else None,
-            "sprint": task.milestone.name if task.milestone else None,
-            "sprint_estimated_start": task.milestone.estimated_start if task.milestone else None,
-            "sprint_estimated_finish": task.milestone.estimated_finish if task.milestone else None,
-            "owner": task.owner.username if task.owner else None,
-            "owner_full_name": task.owner.get_full_name() if task.owner else None,
-            "assigned_to": task.assigned_to.username if task.assigned_to else None,
-            "assigned_to_full_name": task.assigned_to.get_full_name() if task.assigned_to else None,
-            "status": task.status.name if task.status else None,
-            "is_iocaine": task.is_iocaine,
-            "is_closed": task.status is not None and task.status.is_closed,
-            "us_order": task.us_order,
-            "taskboard_order": task.taskboard_order,
-            "attachments": task.attachments.count(),
-            "external_reference": task.external_reference,
-            "tags": ",".join(task.tags or []),
-            "watchers": task.watchers,
-            "voters": task.total_voters,
-        }
-        for custom_attr in custom_attrs:
-            value = task.custom_attributes_values.attributes_values.get(str(custom_attr.id), None)
-            task_data[custom_attr.name] = value
-
-        writer.writerow(task_data)
-
-    return csv_data
+    queryset = attach_total_attachments_to_queryset(queryset)
+    queryset = attach_custom_attributes_values_to_queryset(queryset)
+
+    def rows():
+        for task in iterators.iter_queryset_by_chunks(queryset, chunk_size):
+            task_data = {
+                "ref": task.ref,
+                "subject": task.subject,
+                "description": task.description,
+                "user_story": task.user_story.ref if task.user_story else None,
+                "sprint": task.milestone.name if task.milestone else None,
+                "sprint_estimated_start": task.milestone.estimated_start if task.milestone else None,
+                "sprint_estimated_finish": task.milestone.estimated_finish if task.milestone else None,
+                "owner": task.owner.username if task.owner else None,
+                "owner_full_name": task.owner.get_full_name() if task.owner else None,
+                "assigned_to": task.assigned_to.username if task.assigned_to else None,
+                "assigned_to_full_name": task.assigned_to.get_full_name() if task.assigned_to else None,
+                "status": task.status.name if task.status else None,
+                "is_iocaine": task.is_iocaine,
+                "is_closed": task.status is not None and task.status.is_closed,
+                "us_order": task.us_order,
+                "taskboard_order": task.taskboard_order,
+                "attachments": task.total_attachments,
+                "external_reference": task.external_reference,
+                "tags": ",".join(task.tags or []),
+                "watchers": task.watchers,
+                "voters": task.total_voters,
+            }
+            for custom_attr in custom_attrs:
+                value = task.custom_attributes_values_data.get(str(custom_attr.id), None)
+                task_data[custom_attr.name] = value
+
+            yield task_data
+
+    return iter_csv(fieldnames, rows())
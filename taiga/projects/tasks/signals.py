@@ -23,11 +23,13 @@ from django.utils import timezone
 # Signals for cached prev task
 ####################################
 
-# Define the previous version of the task for use it on the post_save handler
+# Define the previous version of the task for use it on the post_save handler.
+# It's built from the state loaded with the instance, so the row is fetched again
+# only if that state is unknown.
 def cached_prev_task(sender, instance, **kwargs):
     instance.prev = None
     if instance.id:
-        instance.prev = sender.objects.get(id=instance.id)
+        instance.prev = instance.get_loaded_instance() or sender.objects.get(id=instance.id)
 
 
 ####################################
@@ -35,14 +37,56 @@ def cached_prev_task(sender, instance, **kwargs):
 ####################################
 
 def try_to_close_or_open_us_and_milestone_when_create_or_edit_task(sender, instance, created, **kwargs):
+    _update_us_and_milestone_counters_when_create_or_edit_task(instance)
     _try_to_close_or_open_us_when_create_or_edit_task(instance)
     _try_to_close_or_open_milestone_when_create_or_edit_task(instance)
 
 def try_to_close_or_open_us_and_milestone_when_delete_task(sender, instance, **kwargs):
+    _update_us_and_milestone_counters_when_delete_task(instance)
     _try_to_close_or_open_us_when_delete_task(instance)
     _try_to_close_milestone_when_delete_task(instance)
 
 
+# Counters
+def _is_closed_task(task):
+    with suppress(ObjectDoesNotExist):
+        return task.status_id is not None and task.status.is_closed
+    return False
+
+
+def _update_counters_delta(update_counters, prev_parent_id, parent_id, was_closed, is_closed):
+    if prev_parent_id == parent_id:
+        update_counters(parent_id, closed=int(is_closed) - int(was_closed))
+    else:
+        update_counters(prev_parent_id, total=-1, closed=-int(was_closed))
+        update_counters(parent_id, total=1, closed=int(is_closed))
+
+
+def _update_us_and_milestone_counters_when_create_or_edit_task(instance):
+    from taiga.projects.userstories import services as us_service
+    from taiga.projects.milestones import services as milestone_service
+
+    prev = instance.prev
+    was_closed = prev is not None and _is_closed_task(prev)
+    is_closed = _is_closed_task(instance)
+
+    _update_counters_delta(us_service.update_tasks_counters,
+                           prev.user_story_id if prev else None, instance.user_story_id,
+                           was_closed, is_closed)
+    _update_counters_delta(milestone_service.update_tasks_counters,
+                           prev.milestone_id if prev else None, instance.milestone_id,
+                           was_closed, is_closed)
+
+
+def _update_us_and_milestone_counters_when_delete_task(instance):
+    from taiga.projects.userstories import services as us_service
+    from taiga.projects.milestones import services as milestone_service
+
+    is_closed = _is_closed_task(instance)
+    us_service.update_tasks_counters(instance.user_story_id, total=-1, closed=-int(is_closed))
+    milestone_service.update_tasks_counters(instance.milestone_id, total=-1, closed=-int(is_closed))
+
+
 # US
 def _try_to_close_or_open_us_when_create_or_edit_task(instance):
     from taiga.projects.userstories import services as us_service
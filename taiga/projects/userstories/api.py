@@ -22,7 +22,7 @@ from django.apps import apps
 from django.db import transaction
 from django.utils.translation import ugettext as _
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 
 from taiga.base import filters
 from taiga.base import exceptions as exc
@@ -30,8 +30,10 @@ from taiga.base import response
 from taiga.base import status
 from taiga.base.decorators import list_route
 from taiga.base.api.mixins import BlockedByProjectMixin
+from taiga.base.serialized_cache import SerializedCacheResourceMixin
 from taiga.base.api import ModelCrudViewSet, ModelListViewSet
 from taiga.base.api.utils import get_object_or_404
+from taiga.base.utils import db
 
 from taiga.projects.notifications.mixins import WatchedResourceMixin, WatchersViewSetMixin
 from taiga.projects.history.mixins import HistoryResourceMixin
@@ -46,8 +48,8 @@ from . import serializers
 from . import services
 
 
-class UserStoryViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin, WatchedResourceMixin,
-                       BlockedByProjectMixin, ModelCrudViewSet):
+class UserStoryViewSet(SerializedCacheResourceMixin, OCCResourceMixin, VotedResourceMixin, HistoryResourceMixin,
+                       WatchedResourceMixin, BlockedByProjectMixin, ModelCrudViewSet):
     queryset = models.UserStory.objects.all()
     permission_classes = (permissions.UserStoryPermission,)
     filter_backends = (filters.CanViewUsFilterBackend,
@@ -154,6 +156,9 @@ class UserStoryViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixi
                     role_points.points = Points.objects.get(id=points_id, project_id=obj.project_id)
                     role_points.save()
 
+            # The total points are updated in the database
+            obj.total_points = db.reload_attribute(obj, "total_points")
+
         super().post_save(obj, created)
 
     def pre_conditions_on_save(self, obj):
@@ -202,8 +207,8 @@ class UserStoryViewSet(OCCResourceMixin, VotedResourceMixin, HistoryResourceMixi
 
         project = get_object_or_404(Project, userstories_csv_uuid=uuid)
         queryset = project.user_stories.all().order_by('ref')
-        data = services.userstories_to_csv(project, queryset)
-        csv_response = HttpResponse(data.getvalue(), content_type='application/csv; charset=utf-8')
+        data = services.userstories_to_csv_stream(project, queryset)
+        csv_response = StreamingHttpResponse(data, content_type='application/csv; charset=utf-8')
         csv_response['Content-Disposition'] = 'attachment; filename="userstories.csv"'
         return csv_response
 
@@ -43,6 +43,9 @@ def connect_userstories_signals():
     signals.post_save.connect(handlers.update_role_points_when_create_or_edit_us,
                               sender=apps.get_model("userstories", "UserStory"),
                               dispatch_uid="update_role_points_when_create_or_edit_us")
+    signals.post_save.connect(handlers.update_total_points_when_create_or_edit_role_points,
+                              sender=apps.get_model("userstories", "RolePoints"),
+                              dispatch_uid="update_total_points_when_create_or_edit_role_points")
 
     # Tasks
     signals.post_save.connect(handlers.update_milestone_of_tasks_when_edit_us,
@@ -84,6 +87,7 @@ def connect_all_userstories_signals():
 def disconnect_userstories_signals():
     signals.pre_save.disconnect(sender=apps.get_model("userstories", "UserStory"), dispatch_uid="cached_prev_us")
     signals.post_save.disconnect(sender=apps.get_model("userstories", "UserStory"), dispatch_uid="update_role_points_when_create_or_edit_us")
+    signals.post_save.disconnect(sender=apps.get_model("userstories", "RolePoints"), dispatch_uid="update_total_points_when_create_or_edit_role_points")
     signals.post_save.disconnect(sender=apps.get_model("userstories", "UserStory"), dispatch_uid="update_milestone_of_tasks_when_edit_us")
     signals.post_save.disconnect(sender=apps.get_model("userstories", "UserStory"), dispatch_uid="try_to_close_or_open_us_and_milestone_when_create_or_edit_us")
     signals.post_delete.disconnect(sender=apps.get_model("userstories", "UserStory"), dispatch_uid="try_to_close_milestone_when_delete_us")
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userstories', '0011_userstory_tribe_gig'),
+        ('tasks', '0009_auto_20151104_1131'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstory',
+            name='total_tasks',
+            field=models.IntegerField(editable=False, default=0, verbose_name='total tasks'),
+        ),
+        migrations.AddField(
+            model_name='userstory',
+            name='closed_tasks',
+            field=models.IntegerField(editable=False, default=0, verbose_name='closed tasks'),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE userstories_userstory
+               SET total_tasks = (SELECT count(*)
+                                    FROM tasks_task
+                                   WHERE tasks_task.user_story_id = userstories_userstory.id),
+                   closed_tasks = (SELECT count(*)
+                                     FROM tasks_task
+                               INNER JOIN projects_taskstatus ON projects_taskstatus.id = tasks_task.status_id
+                                    WHERE tasks_task.user_story_id = userstories_userstory.id AND
+                                          projects_taskstatus.is_closed = true);
+            """,
+            reverse_sql=migrations.RunSQL.noop
+        ),
+    ]
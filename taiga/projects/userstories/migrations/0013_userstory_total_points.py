@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userstories', '0012_userstory_tasks_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstory',
+            name='total_points',
+            field=models.FloatField(editable=False, null=True, default=None, verbose_name='total points', blank=True),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE userstories_userstory
+               SET total_points = (SELECT SUM(projects_points.value)
+                                     FROM userstories_rolepoints
+                               INNER JOIN projects_points ON projects_points.id = userstories_rolepoints.points_id
+                                    WHERE userstories_rolepoints.user_story_id = userstories_userstory.id);
+            """,
+            reverse_sql=migrations.RunSQL.noop
+        ),
+    ]
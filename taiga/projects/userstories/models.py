@@ -25,8 +25,11 @@ from djorm_pgarray.fields import TextArrayField
 from picklefield.fields import PickledObjectField
 
 from taiga.base.tags import TaggedMixin
+from taiga.base.utils import db
 from taiga.projects.occ import OCCModelMixin
 from taiga.projects.notifications.mixins import WatchedModelMixin
+from taiga.projects.notifications.models import WatchedCountersMixin
+from taiga.projects.votes.models import VotedCountersMixin
 from taiga.projects.mixins.blocked import BlockedMixin
 
 
@@ -54,7 +57,8 @@ class RolePoints(models.Model):
     def project(self):
         return self.user_story.project
 
-class UserStory(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, models.Model):
+class UserStory(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, VotedCountersMixin,
+                WatchedCountersMixin, models.Model):
     ref = models.BigIntegerField(db_index=True, null=True, blank=True, default=None,
                                  verbose_name=_("ref"))
     milestone = models.ForeignKey("milestones.Milestone", null=True, blank=True,
@@ -107,6 +111,18 @@ class UserStory(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, mod
     tribe_gig = PickledObjectField(null=True, blank=True, default=None,
                                    verbose_name="taiga tribe gig")
 
+    # Maintained by the tasks signals with relative updates
+    total_tasks = models.IntegerField(default=0, editable=False, verbose_name=_("total tasks"))
+    closed_tasks = models.IntegerField(default=0, editable=False, verbose_name=_("closed tasks"))
+
+    # Maintained by the role points and points signals with SQL updates
+    total_points = models.FloatField(null=True, blank=True, default=None, editable=False,
+                                     verbose_name=_("total points"))
+
+    COUNTERS_FIELDS = ("total_tasks", "closed_tasks")
+    DENORMALIZED_FIELDS = (COUNTERS_FIELDS + ("total_points",) + VotedCountersMixin.VOTES_COUNTERS_FIELDS +
+                           WatchedCountersMixin.WATCHERS_COUNTERS_FIELDS)
+
     _importing = None
 
     class Meta:
@@ -121,6 +137,7 @@ class UserStory(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, mod
         if not self.status:
             self.status = self.project.default_us_status
 
+        db.exclude_fields_on_save(self, self.DENORMALIZED_FIELDS, kwargs)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -133,6 +150,8 @@ class UserStory(OCCModelMixin, WatchedModelMixin, BlockedMixin, TaggedMixin, mod
         return self.role_points
 
     def get_total_points(self):
+        # The `total_points` field stores this same value (see
+        # `services.recalculate_total_points`)
         not_null_role_points = [rp for rp in self.role_points.all() if rp.points.value is not None]
 
         #If we only have None values the sum should be None
@@ -21,6 +21,7 @@ from taiga.base.fields import TagsField
 from taiga.base.fields import PickledObjectField
 from taiga.base.fields import PgArrayField
 from taiga.base.neighbors import NeighborsSerializerMixin
+from taiga.base.serialized_cache import CachedSerializerMixin
 from taiga.base.utils import json
 
 from taiga.mdrender.service import render as mdrender
@@ -68,9 +69,10 @@ class UserStorySerializer(WatchersValidator, VoteResourceSerializerMixin, Editab
         model = models.UserStory
         depth = 0
         read_only_fields = ('created_date', 'modified_date', 'owner')
+        exclude = ("total_tasks", "closed_tasks", "watchers_ids")
 
     def get_total_points(self, obj):
-        return obj.get_total_points()
+        return obj.total_points
 
     def get_comment(self, obj):
         # NOTE: This method and field is necessary to historical comments work
@@ -104,12 +106,18 @@ class UserStorySerializer(WatchersValidator, VoteResourceSerializerMixin, Editab
         return mdrender(obj.project, obj.description)
 
 
-class UserStoryListSerializer(UserStorySerializer):
+class UserStoryListSerializer(CachedSerializerMixin, UserStorySerializer):
+    serialized_cache_fresh_fields = ("is_voter", "total_voters", "is_watcher", "total_watchers", "watchers",
+                                     "backlog_order", "sprint_order", "kanban_order", "milestone",
+                                     "milestone_slug", "milestone_name", "status", "status_extra_info",
+                                     "is_closed", "finish_date", "modified_date", "total_points", "points",
+                                     "tags", "owner_extra_info", "assigned_to_extra_info", "origin_issue")
+
     class Meta:
         model = models.UserStory
         depth = 0
         read_only_fields = ('created_date', 'modified_date')
-        exclude=("description", "description_html")
+        exclude=("description", "description_html", "total_tasks", "closed_tasks", "watchers_ids")
 
 
 class UserStoryNeighborsSerializer(NeighborsSerializerMixin, UserStorySerializer):
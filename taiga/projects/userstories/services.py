@@ -15,17 +15,18 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import csv
 import io
 from collections import OrderedDict
 from operator import itemgetter
 from contextlib import closing
 
 from django.db import connection
+from django.db.models import F
 from django.utils import timezone
 from django.utils.translation import ugettext as _
 
-from taiga.base.utils import db, text
+from taiga.base.utils import db, iterators, text
+from taiga.base.utils.streaming import iter_csv
 from taiga.projects.history.services import take_snapshot
 from taiga.projects.userstories.apps import (
     connect_userstories_signals,
@@ -34,6 +35,8 @@ from taiga.projects.userstories.apps import (
 from taiga.events import events
 from taiga.projects.votes.utils import attach_total_voters_to_queryset
 from taiga.projects.notifications.utils import attach_watchers_to_queryset
+from taiga.projects.attachments.utils import attach_total_attachments_to_queryset
+from taiga.projects.custom_attributes.utils import attach_custom_attributes_values_to_queryset
 
 from . import models
 
@@ -61,6 +64,10 @@ def create_userstories_in_bulk(bulk_data, callback=None, precall=None, **additio
     """
     userstories = get_userstories_from_bulk(bulk_data, **additional_fields)
 
+    # Allocate all the refs with a single call to the sequence
+    from taiga.projects.references.models import reserve_references
+    reserve_references(userstories)
+
     disconnect_userstories_signals()
 
     try:
@@ -101,17 +108,91 @@ def snapshot_userstories_in_bulk(bulk_data, user):
             pass
 
 
+def update_tasks_counters(user_story_id, total=0, closed=0):
+    """
+    Add `total` and `closed` to the tasks counters of a user story with a
+    relative update, so concurrent changes are not lost.
+    """
+    if user_story_id is None or (total == 0 and closed == 0):
+        return
+
+    models.UserStory.objects.filter(id=user_story_id).update(total_tasks=F("total_tasks") + total,
+                                                             closed_tasks=F("closed_tasks") + closed)
+
+
+def recalculate_tasks_counters(user_story_ids=None, project_id=None):
+    """
+    Recalculate from scratch the tasks counters of some user stories (by ids or
+    all the user stories of a project). Used when the tasks change without
+    sending signals, like when a task status is edited or removed.
+    """
+    if user_story_ids is not None:
+        where, params = "userstories_userstory.id = ANY(%s)", [[id for id in user_story_ids if id]]
+        if not params[0]:
+            return
+    else:
+        where, params = "userstories_userstory.project_id = %s", [project_id]
+
+    sql = """
+    UPDATE userstories_userstory
+       SET total_tasks = (SELECT count(*)
+                            FROM tasks_task
+                           WHERE tasks_task.user_story_id = userstories_userstory.id),
+           closed_tasks = (SELECT count(*)
+                             FROM tasks_task
+                       INNER JOIN projects_taskstatus ON projects_taskstatus.id = tasks_task.status_id
+                            WHERE tasks_task.user_story_id = userstories_userstory.id AND
+                                  projects_taskstatus.is_closed = true)
+     WHERE {where};
+    """.format(where=where)
+
+    with closing(connection.cursor()) as cursor:
+        cursor.execute(sql, params)
+
+
+def recalculate_total_points(user_story_ids=None, project_id=None, points_id=None):
+    """
+    Update the stored total points of some user stories (by ids, all the user
+    stories of a project or the ones estimated with some points) with a single
+    query. It's the sum of the not null values of their role points, or None
+    if there are not any.
+    """
+    if user_story_ids is not None:
+        where, params = "userstories_userstory.id = ANY(%s)", [[id for id in user_story_ids if id]]
+        if not params[0]:
+            return
+    elif points_id is not None:
+        where = """userstories_userstory.id IN (SELECT userstories_rolepoints.user_story_id
+                                                  FROM userstories_rolepoints
+                                                 WHERE userstories_rolepoints.points_id = %s)"""
+        params = [points_id]
+    else:
+        where, params = "userstories_userstory.project_id = %s", [project_id]
+
+    sql = """
+    UPDATE userstories_userstory
+       SET total_points = (SELECT SUM(projects_points.value)
+                             FROM userstories_rolepoints
+                       INNER JOIN projects_points ON projects_points.id = userstories_rolepoints.points_id
+                            WHERE userstories_rolepoints.user_story_id = userstories_userstory.id)
+     WHERE {where};
+    """.format(where=where)
+
+    with closing(connection.cursor()) as cursor:
+        cursor.execute(sql, params)
+
+
 def calculate_userstory_is_closed(user_story):
     if user_story.status is None:
         return False
 
-    if user_story.tasks.count() == 0:
-        return user_story.status is not None and user_story.status.is_closed
+    # The counters are updated in the database, the instance could be outdated
+    user_story.refresh_from_db(fields=models.UserStory.COUNTERS_FIELDS)
 
-    if all([task.status is not None and task.status.is_closed for task in user_story.tasks.all()]):
-        return True
+    if user_story.total_tasks == 0:
+        return user_story.status.is_closed
 
-    return False
+    return user_story.closed_tasks == user_story.total_tasks
 
 
 def close_userstory(us):
@@ -128,13 +209,18 @@ def open_userstory(us):
         us.save(update_fields=["is_closed", "finish_date"])
 
 
-def userstories_to_csv(project,queryset):
+def userstories_to_csv(project, queryset):
     csv_data = io.StringIO()
+    csv_data.writelines(userstories_to_csv_stream(project, queryset))
+    return csv_data
+
+
+def userstories_to_csv_stream(project, queryset, chunk_size=500):
     fieldnames = ["ref", "subject", "description", "sprint", "sprint_estimated_start",
                   "sprint_estimated_finish", "owner", "owner_full_name", "assigned_to",
                   "assigned_to_full_name", "status", "is_closed"]
 
-    roles = project.roles.filter(computable=True).order_by('slug')
+    roles = list(project.roles.filter(computable=True).order_by('slug'))
     for role in roles:
         fieldnames.append("{}-points".format(role.slug))
 
@@ -146,16 +232,13 @@ def userstories_to_csv(project,queryset):
                    "generated_from_issue", "external_reference", "tasks",
                    "tags","watchers", "voters"]
 
-    custom_attrs = project.userstorycustomattributes.all()
+    custom_attrs = list(project.userstorycustomattributes.all())
     for custom_attr in custom_attrs:
         fieldnames.append(custom_attr.name)
 
     queryset = queryset.prefetch_related("role_points",
                                          "role_points__points",
-                                         "role_points__role",
-                                         "tasks",
-                                         "attachments",
-                                         "custom_attributes_values")
+                                         "tasks")
     queryset = queryset.select_related("milestone",
                                        "project",
                                        "status",
@@ -165,53 +248,54 @@ def userstories_to_csv(project,queryset):
 
     queryset = attach_total_voters_to_queryset(queryset)
     queryset = attach_watchers_to_queryset(queryset)
-
-    writer = csv.DictWriter(csv_data, fieldnames=fieldnames)
-    writer.writeheader()
-    for us in queryset:
-        row = {
-            "ref": us.ref,
-            "subject": us.subject,
-            "description": us.description,
-            "sprint": us.milestone.name if us.milestone else None,
-            "sprint_estimated_start": us.milestone.estimated_start if us.milestone else None,
-            "sprint_estimated_finish": us.milestone.estimated_finish if us.milestone else None,
-            "owner": us.owner.username if us.owner else None,
-            "owner_full_name": us.owner.get_full_name() if us.owner else None,
-            "assigned_to": us.assigned_to.username if us.assigned_to else None,
-            "assigned_to_full_name": us.assigned_to.get_full_name() if us.assigned_to else None,
-            "status": us.status.name if us.status else None,
-            "is_closed": us.is_closed,
-            "backlog_order": us.backlog_order,
-            "sprint_order": us.sprint_order,
-            "kanban_order": us.kanban_order,
-            "created_date": us.created_date,
-            "modified_date": us.modified_date,
-            "finish_date": us.finish_date,
-            "client_requirement": us.client_requirement,
-            "team_requirement": us.team_requirement,
-            "attachments": us.attachments.count(),
-            "generated_from_issue": us.generated_from_issue.ref if us.generated_from_issue else None,
-            "external_reference": us.external_reference,
-            "tasks": ",".join([str(task.ref) for task in us.tasks.all()]),
-            "tags": ",".join(us.tags or []),
-            "watchers": us.watchers,
-            "voters": us.total_voters,
-        }
-
-        us_role_points_by_role_id = {us_rp.role.id: us_rp.points.value for us_rp in us.role_points.all()}
-        for role in roles:
-            row["{}-points".format(role.slug)] = us_role_points_by_role_id.get(role.id, 0)
-
-        row['total-points'] = us.get_total_points()
-
-        for custom_attr in custom_attrs:
-            value = us.custom_attributes_values.attributes_values.get(str(custom_attr.id), None)
-            row[custom_attr.name] = value
-
-        writer.writerow(row)
-
-    return csv_data
+    queryset = attach_total_attachments_to_queryset(queryset)
+    queryset = attach_custom_attributes_values_to_queryset(queryset)
+
+    def rows():
+        for us in iterators.iter_queryset_by_chunks(queryset, chunk_size):
+            row = {
+                "ref": us.ref,
+                "subject": us.subject,
+                "description": us.description,
+                "sprint": us.milestone.name if us.milestone else None,
+                "sprint_estimated_start": us.milestone.estimated_start if us.milestone else None,
+                "sprint_estimated_finish": us.milestone.estimated_finish if us.milestone else None,
+                "owner": us.owner.username if us.owner else None,
+                "owner_full_name": us.owner.get_full_name() if us.owner else None,
+                "assigned_to": us.assigned_to.username if us.assigned_to else None,
+                "assigned_to_full_name": us.assigned_to.get_full_name() if us.assigned_to else None,
+                "status": us.status.name if us.status else None,
+                "is_closed": us.is_closed,
+                "backlog_order": us.backlog_order,
+                "sprint_order": us.sprint_order,
+                "kanban_order": us.kanban_order,
+                "created_date": us.created_date,
+                "modified_date": us.modified_date,
+                "finish_date": us.finish_date,
+                "client_requirement": us.client_requirement,
+                "team_requirement": us.team_requirement,
+                "attachments": us.total_attachments,
+                "generated_from_issue": us.generated_from_issue.ref if us.generated_from_issue else None,
+                "external_reference": us.external_reference,
+                "tasks": ",".join([str(task.ref) for task in us.tasks.all()]),
+                "tags": ",".join(us.tags or []),
+                "watchers": us.watchers,
+                "voters": us.total_voters,
+            }
+
+            us_role_points_by_role_id = {us_rp.role_id: us_rp.points.value for us_rp in us.role_points.all()}
+            for role in roles:
+                row["{}-points".format(role.slug)] = us_role_points_by_role_id.get(role.id, 0)
+
+            row['total-points'] = us.total_points
+
+            for custom_attr in custom_attrs:
+                value = us.custom_attributes_values_data.get(str(custom_attr.id), None)
+                row[custom_attr.name] = value
+
+            yield row
+
+    return iter_csv(fieldnames, rows())
 
 
 def _get_userstories_statuses(project, queryset):
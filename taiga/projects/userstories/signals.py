@@ -17,6 +17,7 @@
 
 from contextlib import suppress
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count
 from taiga.projects.history.services import take_snapshot
 from taiga.projects.tasks.apps import connect_all_tasks_signals, disconnect_all_tasks_signals
 
@@ -34,11 +35,13 @@ def disable_task_signals(sender, instance, **kwargs):
 # Signals for cached prev US
 ####################################
 
-# Define the previous version of the US for use it on the post_save handler
+# Define the previous version of the US for use it on the post_save handler.
+# It's built from the state loaded with the instance, so the row is fetched again
+# only if that state is unknown.
 def cached_prev_us(sender, instance, **kwargs):
     instance.prev = None
     if instance.id:
-        instance.prev = sender.objects.get(id=instance.id)
+        instance.prev = instance.get_loaded_instance() or sender.objects.get(id=instance.id)
 
 
 ####################################
@@ -52,13 +55,36 @@ def update_role_points_when_create_or_edit_us(sender, instance, **kwargs):
     instance.project.update_role_points(user_stories=[instance])
 
 
+def update_total_points_when_create_or_edit_role_points(sender, instance, **kwargs):
+    from . import services
+
+    services.recalculate_total_points(user_story_ids=[instance.user_story_id])
+
+
 ####################################
 # Signals for update milestone of tasks
 ####################################
 
 def update_milestone_of_tasks_when_edit_us(sender, instance, created, **kwargs):
     if not created:
+        from taiga.projects.milestones import services as milestone_service
+
+        # The tasks are moved without signals, so the milestones counters are
+        # updated here with the number of moved tasks
+        moved_tasks = (instance.tasks.exclude(milestone_id=instance.milestone_id)
+                                     .values_list("milestone_id", "status__is_closed")
+                                     .annotate(count=Count("id"))
+                                     .order_by())
+        total, closed = 0, 0
+        for milestone_id, is_closed, count in moved_tasks:
+            milestone_service.update_tasks_counters(milestone_id, total=-count,
+                                                    closed=-count if is_closed else 0)
+            total += count
+            closed += count if is_closed else 0
+
         instance.tasks.update(milestone=instance.milestone)
+        milestone_service.update_tasks_counters(instance.milestone_id, total=total, closed=closed)
+
         for task in instance.tasks.all():
             take_snapshot(task)
 
@@ -68,6 +94,8 @@ def update_milestone_of_tasks_when_edit_us(sender, instance, created, **kwargs):
 ####################################
 
 def try_to_close_or_open_us_and_milestone_when_create_or_edit_us(sender, instance, created, **kwargs):
+    _update_milestone_counters_when_create_or_edit_us(instance)
+
     if instance._importing:
         return
 
@@ -75,12 +103,39 @@ def try_to_close_or_open_us_and_milestone_when_create_or_edit_us(sender, instanc
     _try_to_close_or_open_milestone_when_create_or_edit_us(instance)
 
 def try_to_close_milestone_when_delete_us(sender, instance, **kwargs):
+    _update_milestone_counters_when_delete_us(instance)
+
     if instance._importing:
         return
 
     _try_to_close_milestone_when_delete_us(instance)
 
 
+# Counters
+def _update_milestone_counters_when_create_or_edit_us(instance):
+    from taiga.projects.milestones import services as milestone_service
+
+    prev = instance.prev
+    prev_milestone_id = prev.milestone_id if prev else None
+    was_closed = prev is not None and prev.is_closed
+
+    if prev_milestone_id == instance.milestone_id:
+        milestone_service.update_user_stories_counters(instance.milestone_id,
+                                                       closed=int(instance.is_closed) - int(was_closed))
+    else:
+        milestone_service.update_user_stories_counters(prev_milestone_id, total=-1, closed=-int(was_closed))
+        milestone_service.update_user_stories_counters(instance.milestone_id, total=1,
+                                                       closed=int(instance.is_closed))
+
+
+def _update_milestone_counters_when_delete_us(instance):
+    from taiga.projects.milestones import services as milestone_service
+
+    # The tasks of the user story are deleted without signals too
+    if instance.milestone_id:
+        milestone_service.recalculate_counters(milestone_ids=[instance.milestone_id])
+
+
 # US
 def _try_to_close_or_open_us_when_create_or_edit_us(instance):
     if instance._importing:
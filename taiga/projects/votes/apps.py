@@ -0,0 +1,45 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.apps import AppConfig
+from django.apps import apps
+from django.db.models import signals
+
+
+def connect_votes_signals():
+    from . import signals as handlers
+    signals.post_save.connect(handlers.update_total_voters_when_create_vote,
+                              sender=apps.get_model("votes", "Vote"),
+                              dispatch_uid="update_total_voters_when_create_vote")
+    signals.post_delete.connect(handlers.update_total_voters_when_delete_vote,
+                                sender=apps.get_model("votes", "Vote"),
+                                dispatch_uid="update_total_voters_when_delete_vote")
+
+
+def disconnect_votes_signals():
+    signals.post_save.disconnect(sender=apps.get_model("votes", "Vote"),
+                                 dispatch_uid="update_total_voters_when_create_vote")
+    signals.post_delete.disconnect(sender=apps.get_model("votes", "Vote"),
+                                   dispatch_uid="update_total_voters_when_delete_vote")
+
+
+class VotesAppConfig(AppConfig):
+    name = "taiga.projects.votes"
+    verbose_name = "Votes"
+
+    def ready(self):
+        connect_votes_signals()
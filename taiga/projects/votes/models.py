@@ -65,3 +65,13 @@ class Vote(models.Model):
 
     def __str__(self):
         return self.user.get_full_name()
+
+
+class VotedCountersMixin(models.Model):
+    # Maintained by the votes signals with relative updates
+    total_voters = models.IntegerField(default=0, editable=False, verbose_name=_("total voters"))
+
+    VOTES_COUNTERS_FIELDS = ("total_voters",)
+
+    class Meta:
+        abstract = True
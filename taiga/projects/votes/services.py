@@ -21,7 +21,7 @@ from django.db.transaction import atomic
 from django.apps import apps
 from django.contrib.auth import get_user_model
 
-from .models import Votes, Vote
+from .models import Votes, Vote, VotedCountersMixin
 
 
 def add_vote(obj, user):
@@ -67,6 +67,23 @@ def remove_vote(obj, user):
         votes.save()
 
 
+def update_total_voters(content_type_id, object_id, delta:int):
+    """Update the stored total of voters of an object.
+
+    Only the models with the `VotedCountersMixin` store it, the rest of them
+    are ignored.
+
+    :param content_type_id: Content type id of the voted object.
+    :param object_id: Id of the voted object.
+    :param delta: Number of added (or removed, if negative) votes.
+    """
+    model = apps.get_model("contenttypes", "ContentType").objects.get_for_id(content_type_id).model_class()
+    if model is None or not issubclass(model, VotedCountersMixin):
+        return
+
+    model.objects.filter(id=object_id).update(total_voters=F("total_voters") + delta)
+
+
 def get_voters(obj):
     """Get the voters of an object.
 
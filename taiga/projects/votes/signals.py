@@ -0,0 +1,31 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from . import services
+
+
+####################################
+# Signals for the voters counters
+####################################
+
+def update_total_voters_when_create_vote(sender, instance, created, **kwargs):
+    if created:
+        services.update_total_voters(instance.content_type_id, instance.object_id, 1)
+
+
+def update_total_voters_when_delete_vote(sender, instance, **kwargs):
+    services.update_total_voters(instance.content_type_id, instance.object_id, -1)
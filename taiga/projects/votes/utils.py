@@ -18,6 +18,8 @@
 
 from django.apps import apps
 
+from .models import VotedCountersMixin
+
 
 def attach_total_voters_to_queryset(queryset, as_field="total_voters"):
     """Attach votes count to each object of the queryset.
@@ -34,6 +36,14 @@ def attach_total_voters_to_queryset(queryset, as_field="total_voters"):
     :return: Queryset object with the additional `as_field` field.
     """
     model = queryset.model
+    if issubclass(model, VotedCountersMixin):
+        # The total is stored in the model
+        if as_field == "total_voters":
+            return queryset
+
+        sql = "{tbl}.total_voters".format(tbl=model._meta.db_table)
+        return queryset.extra(select={as_field: sql})
+
     type = apps.get_model("contenttypes", "ContentType").objects.get_for_model(model)
     sql = """SELECT coalesce(SUM(total_voters), 0) FROM (
                 SELECT coalesce(votes_votes.count, 0) total_voters
@@ -22,6 +22,7 @@ from django.apps import apps
 from taiga.base import response
 from taiga.base.api.utils import get_object_or_404
 from taiga.base.api import ReadOnlyListViewSet
+from taiga.users.services import get_photos_or_gravatars_urls
 
 from . import serializers
 from . import service
@@ -53,9 +54,13 @@ class TimelineViewSet(ReadOnlyListViewSet):
             User = get_user_model()
             users = {u.id: u for u in User.objects.filter(id__in=user_ids)}
 
+            photos = get_photos_or_gravatars_urls(users.values())
+            big_photos = get_photos_or_gravatars_urls(users.values(), big=True)
+
             for obj in page.object_list:
                 user_id = obj.data.get("user", {}).get("id", None)
                 obj._prefetched_user = users.get(user_id, None)
+                obj._prefetched_user_photos = (photos.get(user_id, None), big_photos.get(user_id, None))
 
             serializer = self.get_pagination_serializer(page)
         else:
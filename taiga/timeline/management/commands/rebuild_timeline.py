@@ -28,12 +28,14 @@ from django.test.utils import override_settings
 
 from taiga.projects.models import Project
 from taiga.projects.history.models import HistoryEntry
+from taiga.projects.history.services import attach_owners_to_history_entries
 from taiga.timeline.models import Timeline
 from taiga.timeline.service import _get_impl_key_from_model,_timeline_impl_map, extract_user_info
 from taiga.timeline.signals import on_new_history_entry, _push_to_timelines
 
 from unittest.mock import patch
 from optparse import make_option
+from itertools import islice
 
 import gc
 
@@ -57,6 +59,14 @@ class BulkCreator(object):
 bulk_creator = BulkCreator()
 
 
+def _iter_by_chunks(iterator, chunk_size):
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def custom_add_to_object_timeline(obj:object, instance:object, event_type:str, created_datetime:object, namespace:str="default", extra_data:dict={}):
     assert isinstance(obj, Model), "obj must be a instance of Model"
     assert isinstance(instance, Model), "instance must be a instance of Model"
@@ -123,12 +133,14 @@ def generate_timeline(initial_date, final_date, project_id):
             _push_to_timelines(project, project.owner, project, "create", project.created_date, extra_data=extra_data)
             del extra_data
 
-        for historyEntry in history_entries.iterator():
-            print("History entry:", historyEntry.created_at)
-            try:
-                on_new_history_entry(None, historyEntry, None)
-            except ObjectDoesNotExist as e:
-                print("Ignoring")
+        for historyEntries in _iter_by_chunks(history_entries.iterator(), 1000):
+            # The users of every chunk are loaded with one query
+            for historyEntry in attach_owners_to_history_entries(historyEntries):
+                print("History entry:", historyEntry.created_at)
+                try:
+                    on_new_history_entry(None, historyEntry, None)
+                except ObjectDoesNotExist as e:
+                    print("Ignoring")
 
     bulk_creator.flush()
 
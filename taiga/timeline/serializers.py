@@ -46,11 +46,16 @@ class TimelineSerializer(serializers.ModelSerializer):
                 user = None
 
         if user is not None:
+            if hasattr(obj, "_prefetched_user_photos"):
+                photo, big_photo = obj._prefetched_user_photos
+            else:
+                photo, big_photo = get_photo_or_gravatar_url(user), get_big_photo_or_gravatar_url(user)
+
             obj.data["user"] = {
                 "id": user.pk,
                 "name": user.get_full_name(),
-                "photo": get_photo_or_gravatar_url(user),
-                "big_photo": get_big_photo_or_gravatar_url(user),
+                "photo": photo,
+                "big_photo": big_photo,
                 "username": user.username,
                 "is_profile_visible": user.is_active and not user.is_system,
                 "date_joined": user.date_joined
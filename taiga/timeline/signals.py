@@ -91,7 +91,9 @@ def on_new_history_entry(sender, instance, created, **kwargs):
     elif instance.type == HistoryType.delete:
         event_type = "delete"
 
-    user = get_user_model().objects.get(id=instance.user["pk"])
+    user = instance.owner
+    if user is None:
+        raise get_user_model().DoesNotExist("The user of the history entry doesn't exist")
     values_diff = instance.values_diff
     _clean_description_fields(values_diff)
 
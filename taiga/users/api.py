@@ -33,6 +33,7 @@ from taiga.base.decorators import detail_route
 from taiga.base.api import ModelCrudViewSet
 from taiga.base.api.mixins import BlockedByProjectMixin
 from taiga.base.filters import PermissionBasedFilterBackend
+from taiga.base.api.templatetags.api import replace_query_param
 from taiga.base.api.utils import get_object_or_404
 from taiga.base.filters import MembersFilterBackend
 from taiga.base.mails import mail_builder
@@ -320,6 +321,34 @@ class UsersViewSet(ModelCrudViewSet):
         self.check_permissions(request, "stats", user)
         return response.Ok(services.get_stats_for_user(user, request.user))
 
+    def _get_activity_page(self, get_list, for_user, from_user, filters):
+        # With the `before` param the lists use keyset pagination: the index is read only
+        # up to the requested page and the next one is pointed by the last element.
+        if "before" not in self.request.QUERY_PARAMS:
+            self.object_list = get_list(for_user, from_user, **filters)
+            page = self.paginate_queryset(self.object_list)
+            return page.object_list if page is not None else self.object_list
+
+        before = self.request.QUERY_PARAMS.get("before")
+        if before:
+            filters["before"] = services.parse_user_activity_cursor(before)
+
+        page_size = self.get_paginate_by()
+        if page_size:
+            filters["limit"] = page_size + 1
+
+        elements = get_list(for_user, from_user, **filters)
+        if page_size:
+            self.headers["x-paginated"] = "true"
+            self.headers["x-paginated-by"] = page_size
+            if len(elements) > page_size:
+                elements = elements[:page_size]
+                cursor = services.get_user_activity_cursor(elements[-1])
+                url = replace_query_param(self.request.build_absolute_uri(), "before", cursor)
+                self.headers["X-Pagination-Next"] = url
+
+        return elements
+
     @detail_route(methods=["GET"])
     def watched(self, request, *args, **kwargs):
         for_user = get_object_or_404(models.User, **kwargs)
@@ -330,9 +359,7 @@ class UsersViewSet(ModelCrudViewSet):
             "q": request.GET.get("q", None),
         }
 
-        self.object_list = services.get_watched_list(for_user, from_user, **filters)
-        page = self.paginate_queryset(self.object_list)
-        elements = page.object_list if page is not None else self.object_list
+        elements = self._get_activity_page(services.get_watched_list, for_user, from_user, filters)
 
         extra_args_liked = {
             "user_watching": services.get_watched_content_for_user(request.user),
@@ -364,9 +391,7 @@ class UsersViewSet(ModelCrudViewSet):
             "q": request.GET.get("q", None),
         }
 
-        self.object_list = services.get_liked_list(for_user, from_user, **filters)
-        page = self.paginate_queryset(self.object_list)
-        elements = page.object_list if page is not None else self.object_list
+        elements = self._get_activity_page(services.get_liked_list, for_user, from_user, filters)
 
         extra_args = {
             "user_watching": services.get_watched_content_for_user(request.user),
@@ -387,9 +412,7 @@ class UsersViewSet(ModelCrudViewSet):
             "q": request.GET.get("q", None),
         }
 
-        self.object_list = services.get_voted_list(for_user, from_user, **filters)
-        page = self.paginate_queryset(self.object_list)
-        elements = page.object_list if page is not None else self.object_list
+        elements = self._get_activity_page(services.get_voted_list, for_user, from_user, filters)
 
         extra_args = {
             "user_watching": services.get_watched_content_for_user(request.user),
@@ -0,0 +1,100 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.apps import AppConfig
+from django.apps import apps
+from django.db.models import signals
+
+
+# The objects that can be watched, liked or voted
+ACTIVITY_OBJECT_MODELS = (
+    ("projects", "Project"),
+    ("userstories", "UserStory"),
+    ("tasks", "Task"),
+    ("issues", "Issue"),
+)
+
+
+def connect_activity_signals():
+    from . import signals as handlers
+    signals.post_save.connect(handlers.add_activity_when_create_watched,
+                              sender=apps.get_model("notifications", "Watched"),
+                              dispatch_uid="add_activity_when_create_watched")
+    signals.post_delete.connect(handlers.remove_activity_when_delete_watched,
+                                sender=apps.get_model("notifications", "Watched"),
+                                dispatch_uid="remove_activity_when_delete_watched")
+    signals.post_save.connect(handlers.update_activity_when_save_notify_policy,
+                              sender=apps.get_model("notifications", "NotifyPolicy"),
+                              dispatch_uid="update_activity_when_save_notify_policy")
+    signals.post_delete.connect(handlers.remove_activity_when_delete_notify_policy,
+                                sender=apps.get_model("notifications", "NotifyPolicy"),
+                                dispatch_uid="remove_activity_when_delete_notify_policy")
+    signals.post_save.connect(handlers.add_activity_when_create_like,
+                              sender=apps.get_model("likes", "Like"),
+                              dispatch_uid="add_activity_when_create_like")
+    signals.post_delete.connect(handlers.remove_activity_when_delete_like,
+                                sender=apps.get_model("likes", "Like"),
+                                dispatch_uid="remove_activity_when_delete_like")
+    signals.post_save.connect(handlers.add_activity_when_create_vote,
+                              sender=apps.get_model("votes", "Vote"),
+                              dispatch_uid="add_activity_when_create_vote")
+    signals.post_delete.connect(handlers.remove_activity_when_delete_vote,
+                                sender=apps.get_model("votes", "Vote"),
+                                dispatch_uid="remove_activity_when_delete_vote")
+
+    for app_label, model_name in ACTIVITY_OBJECT_MODELS:
+        model = apps.get_model(app_label, model_name)
+        signals.post_save.connect(handlers.update_activities_when_save_object,
+                                  sender=model,
+                                  dispatch_uid="update_activities_when_save_{}".format(model_name))
+        signals.post_delete.connect(handlers.remove_activities_when_delete_object,
+                                    sender=model,
+                                    dispatch_uid="remove_activities_when_delete_{}".format(model_name))
+
+
+def disconnect_activity_signals():
+    signals.post_save.disconnect(sender=apps.get_model("notifications", "Watched"),
+                                 dispatch_uid="add_activity_when_create_watched")
+    signals.post_delete.disconnect(sender=apps.get_model("notifications", "Watched"),
+                                   dispatch_uid="remove_activity_when_delete_watched")
+    signals.post_save.disconnect(sender=apps.get_model("notifications", "NotifyPolicy"),
+                                 dispatch_uid="update_activity_when_save_notify_policy")
+    signals.post_delete.disconnect(sender=apps.get_model("notifications", "NotifyPolicy"),
+                                   dispatch_uid="remove_activity_when_delete_notify_policy")
+    signals.post_save.disconnect(sender=apps.get_model("likes", "Like"),
+                                 dispatch_uid="add_activity_when_create_like")
+    signals.post_delete.disconnect(sender=apps.get_model("likes", "Like"),
+                                   dispatch_uid="remove_activity_when_delete_like")
+    signals.post_save.disconnect(sender=apps.get_model("votes", "Vote"),
+                                 dispatch_uid="add_activity_when_create_vote")
+    signals.post_delete.disconnect(sender=apps.get_model("votes", "Vote"),
+                                   dispatch_uid="remove_activity_when_delete_vote")
+
+    for app_label, model_name in ACTIVITY_OBJECT_MODELS:
+        model = apps.get_model(app_label, model_name)
+        signals.post_save.disconnect(sender=model,
+                                     dispatch_uid="update_activities_when_save_{}".format(model_name))
+        signals.post_delete.disconnect(sender=model,
+                                       dispatch_uid="remove_activities_when_delete_{}".format(model_name))
+
+
+class UsersAppConfig(AppConfig):
+    name = "taiga.users"
+    verbose_name = "Users"
+
+    def ready(self):
+        connect_activity_signals()
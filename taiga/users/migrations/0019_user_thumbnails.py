@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django_pgjson.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0018_remove_vote_issues_in_roles_permissions_field'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='thumbnails',
+            field=django_pgjson.fields.JsonField(default=None, null=True, blank=True, editable=False, verbose_name='thumbnails'),
+            preserve_default=True,
+        ),
+    ]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('users', '0019_user_thumbnails'),
+        ('projects', '0041_project_thumbnails'),
+        ('notifications', '0006_auto_20151103_0954'),
+        ('likes', '0002_auto_20151130_2230'),
+        ('votes', '0002_auto_20150805_1600'),
+        ('userstories', '0014_userstory_votes_and_watchers_counters'),
+        ('tasks', '0010_task_votes_and_watchers_counters'),
+        ('issues', '0007_issue_votes_and_watchers_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivity',
+            fields=[
+                ('id', models.AutoField(serialize=False, primary_key=True, auto_created=True, verbose_name='ID')),
+                ('action', models.CharField(max_length=8, verbose_name='action', choices=[('watch', 'watch'), ('like', 'like'), ('vote', 'vote')])),
+                ('object_id', models.PositiveIntegerField()),
+                ('ref', models.BigIntegerField(null=True, blank=True, default=None, verbose_name='ref')),
+                ('title', models.TextField(blank=True, default='', verbose_name='title')),
+                ('created_date', models.DateTimeField(default=django.utils.timezone.now, verbose_name='created date')),
+                ('content_type', models.ForeignKey(to='contenttypes.ContentType')),
+                ('project', models.ForeignKey(related_name='+', verbose_name='project', to='projects.Project')),
+                ('user', models.ForeignKey(related_name='activities', verbose_name='user', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'user activity',
+                'verbose_name_plural': 'user activities',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='useractivity',
+            unique_together=set([('user', 'action', 'content_type', 'object_id')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='useractivity',
+            index_together=set([('user', 'action', 'created_date', 'id'), ('content_type', 'object_id')]),
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO users_useractivity (user_id, action, content_type_id, object_id,
+                                            project_id, ref, title, created_date)
+                 SELECT activity.user_id, activity.action, activity.content_type_id, activity.object_id,
+                        activity.project_id, activity.ref, activity.title, activity.created_date
+                   FROM (SELECT DISTINCT ON (user_id, action, content_type_id, object_id) *
+                           FROM (
+                       -- Watched user stories, tasks and issues
+                       SELECT notifications_watched.user_id, 'watch' AS action,
+                              notifications_watched.content_type_id, notifications_watched.object_id,
+                              objects.project_id, objects.ref, objects.title,
+                              notifications_watched.created_date
+                         FROM notifications_watched
+                   INNER JOIN django_content_type ON django_content_type.id = notifications_watched.content_type_id
+                   INNER JOIN (SELECT 'userstories' AS app_label, 'userstory' AS model, id, project_id, ref, subject AS title FROM userstories_userstory
+                               UNION ALL
+                               SELECT 'tasks', 'task', id, project_id, ref, subject FROM tasks_task
+                               UNION ALL
+                               SELECT 'issues', 'issue', id, project_id, ref, subject FROM issues_issue) objects
+                           ON objects.app_label = django_content_type.app_label
+                          AND objects.model = django_content_type.model
+                          AND objects.id = notifications_watched.object_id
+
+                       UNION ALL
+
+                       -- Voted user stories, tasks and issues
+                       SELECT votes_vote.user_id, 'vote' AS action,
+                              votes_vote.content_type_id, votes_vote.object_id,
+                              objects.project_id, objects.ref, objects.title,
+                              votes_vote.created_date
+                         FROM votes_vote
+                   INNER JOIN django_content_type ON django_content_type.id = votes_vote.content_type_id
+                   INNER JOIN (SELECT 'userstories' AS app_label, 'userstory' AS model, id, project_id, ref, subject AS title FROM userstories_userstory
+                               UNION ALL
+                               SELECT 'tasks', 'task', id, project_id, ref, subject FROM tasks_task
+                               UNION ALL
+                               SELECT 'issues', 'issue', id, project_id, ref, subject FROM issues_issue) objects
+                           ON objects.app_label = django_content_type.app_label
+                          AND objects.model = django_content_type.model
+                          AND objects.id = votes_vote.object_id
+
+                       UNION ALL
+
+                       -- Watched projects
+                       SELECT notifications_notifypolicy.user_id, 'watch' AS action,
+                              django_content_type.id, projects_project.id,
+                              projects_project.id, NULL, projects_project.name,
+                              notifications_notifypolicy.created_at
+                         FROM notifications_notifypolicy
+                   INNER JOIN projects_project ON projects_project.id = notifications_notifypolicy.project_id
+                   INNER JOIN django_content_type ON django_content_type.app_label = 'projects'
+                                                 AND django_content_type.model = 'project'
+                        WHERE notifications_notifypolicy.notify_level != 3
+
+                       UNION ALL
+
+                       -- Liked projects
+                       SELECT likes_like.user_id, 'like' AS action,
+                              likes_like.content_type_id, likes_like.object_id,
+                              projects_project.id, NULL, projects_project.name,
+                              likes_like.created_date
+                         FROM likes_like
+                   INNER JOIN django_content_type ON django_content_type.id = likes_like.content_type_id
+                                                 AND django_content_type.app_label = 'projects'
+                                                 AND django_content_type.model = 'project'
+                   INNER JOIN projects_project ON projects_project.id = likes_like.object_id
+                           ) all_activity
+                       ORDER BY user_id, action, content_type_id, object_id, created_date
+                   ) activity
+               ORDER BY activity.created_date, activity.user_id, activity.object_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop
+        ),
+    ]
@@ -36,6 +36,8 @@ from django_pgjson.fields import JsonField
 from djorm_pgarray.fields import TextArrayField
 
 from taiga.auth.tokens import get_token_for_user
+from taiga.auth.tokens import invalidate_cached_user
+from taiga.base.signals import thumbnails_updated
 from taiga.base.utils.slug import slugify_uniquely
 from taiga.base.utils.files import get_file_path
 from taiga.permissions.permissions import MEMBERS_PERMISSIONS
@@ -142,6 +144,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     photo = models.FileField(upload_to=get_user_file_path,
                              max_length=500, null=True, blank=True,
                              verbose_name=_("photo"))
+    thumbnails = JsonField(null=True, blank=True, default=None, editable=False,
+                           verbose_name=_("thumbnails"))
     date_joined = models.DateTimeField(_("date joined"), default=timezone.now)
     lang = models.CharField(max_length=20, null=True, blank=True, default="",
                             verbose_name=_("default language"))
@@ -331,6 +335,57 @@ class AuthData(models.Model):
         unique_together = ["key", "value"]
 
 
+ACTIVITY_ACTION_WATCH = "watch"
+ACTIVITY_ACTION_LIKE = "like"
+ACTIVITY_ACTION_VOTE = "vote"
+
+ACTIVITY_ACTION_CHOICES = (
+    (ACTIVITY_ACTION_WATCH, _("watch")),
+    (ACTIVITY_ACTION_LIKE, _("like")),
+    (ACTIVITY_ACTION_VOTE, _("vote")),
+)
+
+
+class UserActivity(models.Model):
+    """
+    Index of the objects watched, liked or voted by a user, used to list them
+    in the user profile. It's maintained by the signals of the watched, likes
+    and votes models and of the indexed objects themselves.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, null=False, blank=False,
+                             related_name="activities", verbose_name=_("user"))
+    action = models.CharField(max_length=8, null=False, blank=False,
+                              choices=ACTIVITY_ACTION_CHOICES, verbose_name=_("action"))
+    content_type = models.ForeignKey("contenttypes.ContentType")
+    object_id = models.PositiveIntegerField()
+    project = models.ForeignKey("projects.Project", null=False, blank=False,
+                                related_name="+", verbose_name=_("project"))
+    # Only used to filter by text, the listed values are read from the objects
+    ref = models.BigIntegerField(null=True, blank=True, default=None, verbose_name=_("ref"))
+    title = models.TextField(null=False, blank=True, default="", verbose_name=_("title"))
+    created_date = models.DateTimeField(null=False, blank=False, default=timezone.now,
+                                        verbose_name=_("created date"))
+
+    class Meta:
+        verbose_name = "user activity"
+        verbose_name_plural = "user activities"
+        unique_together = ("user", "action", "content_type", "object_id")
+        index_together = [("user", "action", "created_date", "id"),
+                          ("content_type", "object_id")]
+
+
+# The users cached for the authentication must be refreshed on every
+# change (password, cancelled account...)
+@receiver(models.signals.post_save, sender=User,
+          dispatch_uid="user_invalidate_cached_user_on_save")
+@receiver(models.signals.post_delete, sender=User,
+          dispatch_uid="user_invalidate_cached_user_on_delete")
+@receiver(thumbnails_updated, sender=User,
+          dispatch_uid="user_invalidate_cached_user_on_thumbnails_updated")
+def user_invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
+
+
 # On Role object is changed, update all membership
 # related to current role.
 @receiver(models.signals.post_save, sender=Role,
@@ -341,3 +396,12 @@ def role_post_save(sender, instance, created, **kwargs):
         return
 
     instance.project.update_role_points()
+
+
+# The role points of a removed role are removed too, so the total points of
+# the user stories of the project must be updated.
+@receiver(models.signals.post_delete, sender=Role,
+          dispatch_uid="role_post_delete")
+def role_post_delete(sender, instance, **kwargs):
+    from taiga.projects.userstories.services import recalculate_total_points
+    recalculate_total_points(project_id=instance.project_id)
@@ -22,7 +22,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from taiga.base.api import serializers
 from taiga.base.fields import PgArrayField, TagsField
-from taiga.base.utils.thumbnails import get_thumbnail_url
+from taiga.base.utils.thumbnails import get_stored_thumbnail_url
 
 from taiga.projects.models import Project
 from .models import User, Role
@@ -249,7 +249,7 @@ class HighLightedContentSerializer(serializers.Serializer):
     def get_logo_small_url(self, obj):
         logo = self._none_if_not_project(obj, "logo")
         if logo:
-            return get_thumbnail_url(logo, settings.THN_LOGO_SMALL)
+            return get_stored_thumbnail_url(obj.get("logo_thumbnails"), logo, settings.THN_LOGO_SMALL)
         return None
 
     def get_photo(self, obj):
@@ -257,8 +257,9 @@ class HighLightedContentSerializer(serializers.Serializer):
         if type == "project":
             return None
 
-        UserData = namedtuple("UserData", ["photo", "email"])
-        user_data = UserData(photo=obj["assigned_to_photo"], email=obj.get("assigned_to_email") or "")
+        UserData = namedtuple("UserData", ["photo", "thumbnails", "email"])
+        user_data = UserData(photo=obj["assigned_to_photo"], thumbnails=obj.get("assigned_to_thumbnails"),
+                             email=obj.get("assigned_to_email") or "")
         return get_photo_or_gravatar_url(user_data)
 
     def get_tags_color(self, obj):
@@ -19,12 +19,15 @@
 This model contains a domain logic for users application.
 """
 
+from functools import lru_cache
+
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.db.models import Q
 from django.db import connection
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.utils.dateparse import parse_datetime
 from django.utils.translation import ugettext as _
 
 from easy_thumbnails.files import get_thumbnailer
@@ -32,11 +35,13 @@ from easy_thumbnails.exceptions import InvalidImageFormatError
 
 from taiga.base import exceptions as exc
 from taiga.base.utils.db import to_tsquery
+from taiga.base.utils.thumbnails import are_thumbnails_fresh
 from taiga.base.utils.urls import get_absolute_url
 from taiga.projects.notifications.choices import NotifyLevel
 from taiga.projects.notifications.services import get_projects_watched
 
 from .gravatar import get_gravatar_url
+from .models import ACTIVITY_ACTION_WATCH, ACTIVITY_ACTION_LIKE, ACTIVITY_ACTION_VOTE
 
 
 
@@ -72,29 +77,45 @@ def get_and_validate_user(*, username:str, password:str) -> bool:
     return user
 
 
-def get_photo_url(photo):
-    """Get a photo absolute url and the photo automatically cropped."""
+@lru_cache(maxsize=settings.AVATAR_URLS_CACHE_SIZE)
+def _get_photo_thumbnail_path(photo_name, thumbnailer_size):
+    # The thumbnail of a photo only depends on its name and a new avatar
+    # always gets a new name, so the cached paths never get outdated.
     try:
-        url = get_thumbnailer(photo)[settings.THN_AVATAR_SMALL].url
-        return get_absolute_url(url)
-    except InvalidImageFormatError as e:
+        return get_thumbnailer(photo_name)[thumbnailer_size].url
+    except InvalidImageFormatError:
         return None
 
 
+_get_gravatar_url = lru_cache(maxsize=settings.AVATAR_URLS_CACHE_SIZE)(get_gravatar_url)
+
+
+def _get_photo_url(photo, thumbnails, thumbnailer_size):
+    if are_thumbnails_fresh(thumbnails, photo) and thumbnailer_size in thumbnails:
+        path = thumbnails[thumbnailer_size]
+    else:
+        path = _get_photo_thumbnail_path(getattr(photo, "name", photo), thumbnailer_size)
+
+    return get_absolute_url(path) if path else None
+
+
+def get_photo_url(photo, thumbnails=None):
+    """Get a photo absolute url and the photo automatically cropped."""
+    return _get_photo_url(photo, thumbnails, settings.THN_AVATAR_SMALL)
+
+
 def get_photo_or_gravatar_url(user):
     """Get the user's photo/gravatar url."""
     if user:
-        return get_photo_url(user.photo) if user.photo else get_gravatar_url(user.email)
+        if user.photo:
+            return get_photo_url(user.photo, getattr(user, "thumbnails", None))
+        return _get_gravatar_url(user.email)
     return settings.GRAVATAR_DEFAULT_AVATAR
 
 
-def get_big_photo_url(photo):
+def get_big_photo_url(photo, thumbnails=None):
     """Get a big photo absolute url and the photo automatically cropped."""
-    try:
-        url = get_thumbnailer(photo)[settings.THN_AVATAR_BIG].url
-        return get_absolute_url(url)
-    except InvalidImageFormatError as e:
-        return None
+    return _get_photo_url(photo, thumbnails, settings.THN_AVATAR_BIG)
 
 
 def get_big_photo_or_gravatar_url(user):
@@ -103,9 +124,22 @@ def get_big_photo_or_gravatar_url(user):
         return ""
 
     if user.photo:
-        return get_big_photo_url(user.photo)
+        return get_big_photo_url(user.photo, getattr(user, "thumbnails", None))
     else:
-        return get_gravatar_url(user.email, size=settings.THN_AVATAR_BIG_SIZE)
+        return _get_gravatar_url(user.email, size=settings.THN_AVATAR_BIG_SIZE)
+
+
+def get_photos_or_gravatars_urls(users, big=False):
+    """
+    Get the photo/gravatar url of many users at once. Return a dict with
+    the format {<user id>: <url>}, every user is resolved only once.
+    """
+    get_url = get_big_photo_or_gravatar_url if big else get_photo_or_gravatar_url
+    urls = {}
+    for user in users:
+        if user is not None and user.id not in urls:
+            urls[user.id] = get_url(user)
+    return urls
 
 
 def get_visible_project_ids(from_user, by_user):
@@ -220,244 +254,242 @@ def get_watched_content_for_user(user):
     return user_watches
 
 
-def _build_watched_sql_for_projects(for_user):
-    sql = """
-	SELECT projects_project.id AS id, null::integer AS ref, 'project'::text AS type,
-        tags, notifications_notifypolicy.project_id AS object_id, projects_project.id AS project,
-        slug, projects_project.name, null::text AS subject,
-        notifications_notifypolicy.created_at as created_date,
-        coalesce(watchers, 0) AS total_watchers, projects_project.total_fans AS total_fans, null::integer AS total_voters,
-        null::integer AS assigned_to, null::text as status, null::text as status_color
-	    FROM notifications_notifypolicy
-	    INNER JOIN projects_project
-		      ON (projects_project.id = notifications_notifypolicy.project_id)
-	    LEFT JOIN (SELECT project_id, count(*) watchers
-                   FROM notifications_notifypolicy
-                   WHERE notifications_notifypolicy.notify_level != {none_notify_level}
-                   GROUP BY project_id
-                ) type_watchers
-		      ON projects_project.id = type_watchers.project_id
-	    WHERE
-              notifications_notifypolicy.user_id = {for_user_id}
-              AND notifications_notifypolicy.notify_level != {none_notify_level}
-    """
-    sql = sql.format(
-        for_user_id=for_user.id,
-        none_notify_level=NotifyLevel.none,
-        project_content_type_id=ContentType.objects.get(app_label="projects", model="project").id)
-    return sql
+# The objects that can be in the activity index of the users, by type name: its app label,
+# its table and the columns with its project, its ref and its title.
+_ACTIVITY_SOURCES = {
+    "project": ("projects", "projects_project", "id", "NULL", "name"),
+    "userstory": ("userstories", "userstories_userstory", "project_id", "ref", "subject"),
+    "task": ("tasks", "tasks_task", "project_id", "ref", "subject"),
+    "issue": ("issues", "issues_issue", "project_id", "ref", "subject"),
+}
 
 
-def _build_liked_sql_for_projects(for_user):
-    sql = """
-	SELECT projects_project.id AS id, null::integer AS ref, 'project'::text AS type,
-        tags, likes_like.object_id AS object_id, projects_project.id AS project,
-        slug, projects_project.name, null::text AS subject,
-        likes_like.created_date,
-        coalesce(watchers, 0) AS total_watchers, projects_project.total_fans AS total_fans,
-        null::integer AS assigned_to, null::text as status, null::text as status_color
-	    FROM likes_like
-	    INNER JOIN projects_project
-		      ON (projects_project.id = likes_like.object_id)
-	    LEFT JOIN (SELECT project_id, count(*) watchers
-                   FROM notifications_notifypolicy
-                   WHERE notifications_notifypolicy.notify_level != {none_notify_level}
-                   GROUP BY project_id
-                ) type_watchers
-		      ON projects_project.id = type_watchers.project_id
-	    WHERE likes_like.user_id = {for_user_id} AND {project_content_type_id} = likes_like.content_type_id
-    """
-    sql = sql.format(
-        for_user_id=for_user.id,
-        none_notify_level=NotifyLevel.none,
-        project_content_type_id=ContentType.objects.get(app_label="projects", model="project").id)
+def _get_activity_source(content_type):
+    source = _ACTIVITY_SOURCES.get(content_type.model, None)
+    if source is None or source[0] != content_type.app_label:
+        return None
+    return source
 
-    return sql
 
+def add_user_activity(user_id, action, content_type, object_id, created_date):
+    """Add an object to the activity index of a user, if it isn't already in it.
 
-def _build_sql_for_type(for_user, type, table_name, action_table, ref_column="ref",
-                              project_column="project_id", assigned_to_column="assigned_to_id",
-                              slug_column="slug", subject_column="subject"):
-    sql = """
-	SELECT {table_name}.id AS id, {ref_column} AS ref, '{type}' AS type,
-        tags, {action_table}.object_id AS object_id, {table_name}.{project_column} AS project,
-        {slug_column} AS slug, null AS name, {subject_column} AS subject,
-        {action_table}.created_date,
-        coalesce(watchers, 0) AS total_watchers, null::integer AS total_fans, coalesce(votes_votes.count, 0) AS total_voters,
-        {assigned_to_column}  AS assigned_to, projects_{type}status.name as status, projects_{type}status.color as status_color
-	    FROM {action_table}
-	    INNER JOIN django_content_type
-		      ON ({action_table}.content_type_id = django_content_type.id AND django_content_type.model = '{type}')
-	    INNER JOIN {table_name}
-		      ON ({table_name}.id = {action_table}.object_id)
-        INNER JOIN projects_{type}status
-		      ON (projects_{type}status.id = {table_name}.status_id)
-	    LEFT JOIN (SELECT object_id, content_type_id, count(*) watchers FROM notifications_watched GROUP BY object_id, content_type_id) type_watchers
-		      ON {table_name}.id = type_watchers.object_id AND django_content_type.id = type_watchers.content_type_id
-	    LEFT JOIN votes_votes
-		      ON ({table_name}.id = votes_votes.object_id AND django_content_type.id = votes_votes.content_type_id)
-	    WHERE {action_table}.user_id = {for_user_id}
+    :param user_id: Id of the user.
+    :param action: One of the `taiga.users.models.ACTIVITY_ACTION_CHOICES`.
+    :param content_type: Content type of the object.
+    :param object_id: Id of the object.
+    :param created_date: Date of the action.
     """
-    sql = sql.format(for_user_id=for_user.id, type=type, table_name=table_name,
-                      action_table=action_table, ref_column = ref_column,
-                      project_column=project_column, assigned_to_column=assigned_to_column,
-                      slug_column=slug_column, subject_column=subject_column)
+    source = _get_activity_source(content_type)
+    if source is None:
+        return
 
-    return sql
+    _, table_name, project_column, ref_column, title_column = source
+    sql = """
+        INSERT INTO users_useractivity (user_id, action, content_type_id, object_id,
+                                        project_id, ref, title, created_date)
+             SELECT %(user_id)s, %(action)s, %(content_type_id)s, {table_name}.id,
+                    {table_name}.{project_column}, {ref_column}, coalesce({title_column}, ''),
+                    %(created_date)s
+               FROM {table_name}
+              WHERE {table_name}.id = %(object_id)s
+                AND NOT EXISTS (SELECT 1
+                                  FROM users_useractivity
+                                 WHERE users_useractivity.user_id = %(user_id)s
+                                   AND users_useractivity.action = %(action)s
+                                   AND users_useractivity.content_type_id = %(content_type_id)s
+                                   AND users_useractivity.object_id = %(object_id)s)
+    """.format(table_name=table_name, project_column=project_column,
+               ref_column=ref_column, title_column=title_column)
 
+    cursor = connection.cursor()
+    cursor.execute(sql, {
+        "user_id": user_id,
+        "action": action,
+        "content_type_id": content_type.id,
+        "object_id": object_id,
+        "created_date": created_date,
+    })
 
-def get_watched_list(for_user, from_user, type=None, q=None):
-    filters_sql = ""
-    and_needed = False
 
-    if type:
-        filters_sql += " AND type = %(type)s "
+def remove_user_activity(user_id, action, content_type_id, object_id):
+    """Remove an object from the activity index of a user."""
+    model = apps.get_model("users", "UserActivity")
+    model.objects.filter(user_id=user_id, action=action, content_type_id=content_type_id,
+                         object_id=object_id).delete()
 
-    if q:
-        filters_sql += """ AND (
-            to_tsvector('english_nostop', coalesce(subject,'') || ' ' ||coalesce(entities.name,'') || ' ' ||coalesce(to_char(ref, '999'),'')) @@ to_tsquery('english_nostop', %(q)s)
-        )
-        """
 
-    sql = """
-    -- BEGIN Basic info: we need to mix info from different tables and denormalize it
-    SELECT entities.*,
-           projects_project.name as project_name, projects_project.description as description, projects_project.slug as project_slug, projects_project.is_private as project_is_private,
-           projects_project.blocked_code as project_blocked_code, projects_project.tags_colors, projects_project.logo,
-           users_user.username assigned_to_username, users_user.full_name assigned_to_full_name, users_user.photo assigned_to_photo, users_user.email assigned_to_email
-        FROM (
-            {userstories_sql}
-            UNION
-            {tasks_sql}
-            UNION
-            {issues_sql}
-            UNION
-            {projects_sql}
-        ) as entities
-    -- END Basic info
+def update_user_activities_of_object(content_type, obj, update_fields=None):
+    """Update the project, the ref and the title of an object in the activity index of
+    all the users.
 
-    -- BEGIN Project info
-    LEFT JOIN projects_project
-        ON (entities.project = projects_project.id)
-    -- END Project info
+    :param content_type: Content type of the object.
+    :param obj: The object, already saved.
+    :param update_fields: The fields updated on save, if only some of them were.
+    """
+    source = _get_activity_source(content_type)
+    if source is None:
+        return
+
+    _, _, project_column, ref_column, title_column = source
+    if update_fields is not None:
+        indexed_fields = {"project", project_column, ref_column, title_column}
+        if not indexed_fields.intersection(update_fields):
+            return
+
+    values = {
+        "project_id": getattr(obj, project_column),
+        "ref": getattr(obj, ref_column) if ref_column != "NULL" else None,
+        "title": getattr(obj, title_column) or "",
+    }
+    model = apps.get_model("users", "UserActivity")
+    (model.objects.filter(content_type_id=content_type.id, object_id=obj.id)
+                  .exclude(**values)
+                  .update(**values))
 
-    -- BEGIN Assigned to user info
-    LEFT JOIN users_user
-        ON (assigned_to = users_user.id)
-    -- END Assigned to user info
 
-    -- BEGIN Permissions checking
-    LEFT JOIN projects_membership
-        -- Here we check the memberbships from the user requesting the info
-        ON (projects_membership.user_id = {from_user_id} AND projects_membership.project_id = entities.project)
+def remove_user_activities_of_object(content_type_id, object_id):
+    """Remove an object from the activity index of all the users."""
+    model = apps.get_model("users", "UserActivity")
+    model.objects.filter(content_type_id=content_type_id, object_id=object_id).delete()
 
-    LEFT JOIN users_role
-        ON (entities.project = users_role.project_id AND users_role.id =  projects_membership.role_id)
 
-    WHERE
-        -- public project
-        (
-            projects_project.is_private = false
-            OR(
-                -- private project where the view_ permission is included in the user role for that project or in the anon permissions
-                projects_project.is_private = true
-                AND(
-                    (entities.type = 'issue' AND 'view_issues' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                    OR (entities.type = 'task' AND 'view_tasks' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                    OR (entities.type = 'userstory' AND 'view_us' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                    OR (entities.type = 'project' AND 'view_project' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                )
-        ))
-    -- END Permissions checking
-        {filters_sql}
+def get_user_activity_cursor(element):
+    """Get the keyset pagination cursor pointing after an element of an activity list."""
+    return "{}_{}".format(element["created_date"].isoformat(), element["activity_id"])
 
-    ORDER BY entities.created_date DESC;
-    """
 
-    from_user_id = -1
-    if not from_user.is_anonymous():
-        from_user_id = from_user.id
+def parse_user_activity_cursor(cursor):
+    """Parse a keyset pagination cursor of an activity list, raising `WrongArguments`
+    if it's invalid.
 
-    sql = sql.format(
-        for_user_id=for_user.id,
-        from_user_id=from_user_id,
-        filters_sql=filters_sql,
-        userstories_sql=_build_sql_for_type(for_user, "userstory", "userstories_userstory", "notifications_watched", slug_column="null"),
-        tasks_sql=_build_sql_for_type(for_user, "task", "tasks_task", "notifications_watched", slug_column="null"),
-        issues_sql=_build_sql_for_type(for_user, "issue", "issues_issue", "notifications_watched", slug_column="null"),
-        projects_sql=_build_watched_sql_for_projects(for_user))
+    :return: A tuple with the date and the id of the last returned element.
+    """
+    try:
+        created_date, activity_id = cursor.rsplit("_", 1)
+        created_date = parse_datetime(created_date)
+        activity_id = int(activity_id)
+    except ValueError:
+        created_date = None
 
-    cursor = connection.cursor()
-    params = {
-        "type": type,
-        "q": to_tsquery(q) if q is not None else ""
-    }
-    cursor.execute(sql, params)
+    if created_date is None:
+        raise exc.WrongArguments(_("Invalid pagination cursor"))
 
-    desc = cursor.description
-    return [
-        dict(zip([col[0] for col in desc], row))
-        for row in cursor.fetchall()
-    ]
+    return (created_date, activity_id)
 
 
-def get_liked_list(for_user, from_user, type=None, q=None):
+def _get_user_activity_list(action, for_user, from_user, type=None, q=None, before=None, limit=None):
     filters_sql = ""
-    and_needed = False
 
     if type:
-        filters_sql += " AND type = %(type)s "
+        source = _ACTIVITY_SOURCES.get(type, None)
+        if source is None:
+            return []
+        filters_sql += " AND activity.content_type_id = %(content_type_id)s "
+        content_type_id = ContentType.objects.get_by_natural_key(source[0], type).id
+    else:
+        content_type_id = None
 
     if q:
         filters_sql += """ AND (
-            to_tsvector('english_nostop', coalesce(subject,'') || ' ' ||coalesce(entities.name,'') || ' ' ||coalesce(to_char(ref, '999'),'')) @@ to_tsquery('english_nostop', %(q)s)
+            to_tsvector('english_nostop', activity.title || ' ' || coalesce(to_char(activity.ref, '999'),'')) @@ to_tsquery('english_nostop', %(q)s)
         )
         """
 
+    if before is not None:
+        filters_sql += " AND (activity.created_date, activity.id) < (%(before_date)s, %(before_id)s) "
+
+    limit_sql = ""
+    if limit is not None:
+        limit_sql = "LIMIT %(limit)s"
+
     sql = """
-    -- BEGIN Basic info: we need to mix info from different tables and denormalize it
-    SELECT entities.*,
+    -- BEGIN Basic info: we read the current values of the indexed objects
+    SELECT activity.id AS activity_id, activity.object_id AS id, activity.object_id AS object_id,
+           django_content_type.model AS type, activity.created_date,
+           coalesce(userstories_userstory.ref, tasks_task.ref, issues_issue.ref) AS ref,
+           CASE django_content_type.model
+               WHEN 'userstory' THEN userstories_userstory.tags
+               WHEN 'task' THEN tasks_task.tags
+               WHEN 'issue' THEN issues_issue.tags
+               ELSE projects_project.tags
+           END AS tags,
+           activity.project_id AS project,
+           CASE WHEN django_content_type.model = 'project' THEN projects_project.slug END AS slug,
+           CASE WHEN django_content_type.model = 'project' THEN projects_project.name END AS name,
+           coalesce(userstories_userstory.subject, tasks_task.subject, issues_issue.subject) AS subject,
+           CASE django_content_type.model
+               WHEN 'project' THEN (SELECT count(*)
+                                      FROM notifications_notifypolicy
+                                     WHERE notifications_notifypolicy.project_id = projects_project.id
+                                       AND notifications_notifypolicy.notify_level != {none_notify_level})
+               ELSE coalesce(userstories_userstory.total_watchers, tasks_task.total_watchers, issues_issue.total_watchers, 0)
+           END AS total_watchers,
+           CASE WHEN django_content_type.model = 'project' THEN projects_project.total_fans END AS total_fans,
+           CASE WHEN django_content_type.model != 'project' THEN coalesce(votes_votes.count, 0) END AS total_voters,
+           coalesce(userstories_userstory.assigned_to_id, tasks_task.assigned_to_id, issues_issue.assigned_to_id) AS assigned_to,
+           coalesce(projects_userstorystatus.name, projects_taskstatus.name, projects_issuestatus.name) AS status,
+           coalesce(projects_userstorystatus.color, projects_taskstatus.color, projects_issuestatus.color) AS status_color,
            projects_project.name as project_name, projects_project.description as description, projects_project.slug as project_slug, projects_project.is_private as project_is_private,
-           projects_project.blocked_code as project_blocked_code, projects_project.tags_colors, projects_project.logo,
-           users_user.username assigned_to_username, users_user.full_name assigned_to_full_name, users_user.photo assigned_to_photo, users_user.email assigned_to_email
-        FROM (
-            {projects_sql}
-        ) as entities
+           projects_project.blocked_code as project_blocked_code, projects_project.tags_colors, projects_project.logo, projects_project.thumbnails as logo_thumbnails,
+           users_user.username assigned_to_username, users_user.full_name assigned_to_full_name, users_user.photo assigned_to_photo, users_user.thumbnails assigned_to_thumbnails, users_user.email assigned_to_email
+        FROM users_useractivity activity
+        INNER JOIN django_content_type
+            ON (django_content_type.id = activity.content_type_id)
+        INNER JOIN projects_project
+            ON (projects_project.id = activity.project_id)
+        LEFT JOIN userstories_userstory
+            ON (django_content_type.model = 'userstory' AND userstories_userstory.id = activity.object_id)
+        LEFT JOIN projects_userstorystatus
+            ON (projects_userstorystatus.id = userstories_userstory.status_id)
+        LEFT JOIN tasks_task
+            ON (django_content_type.model = 'task' AND tasks_task.id = activity.object_id)
+        LEFT JOIN projects_taskstatus
+            ON (projects_taskstatus.id = tasks_task.status_id)
+        LEFT JOIN issues_issue
+            ON (django_content_type.model = 'issue' AND issues_issue.id = activity.object_id)
+        LEFT JOIN projects_issuestatus
+            ON (projects_issuestatus.id = issues_issue.status_id)
+        LEFT JOIN votes_votes
+            ON (votes_votes.content_type_id = activity.content_type_id AND votes_votes.object_id = activity.object_id)
     -- END Basic info
 
-    -- BEGIN Project info
-    LEFT JOIN projects_project
-        ON (entities.project = projects_project.id)
-    -- END Project info
-
     -- BEGIN Assigned to user info
     LEFT JOIN users_user
-        ON (assigned_to = users_user.id)
+        ON (users_user.id = coalesce(userstories_userstory.assigned_to_id, tasks_task.assigned_to_id, issues_issue.assigned_to_id))
     -- END Assigned to user info
 
     -- BEGIN Permissions checking
     LEFT JOIN projects_membership
         -- Here we check the memberbships from the user requesting the info
-        ON (projects_membership.user_id = {from_user_id} AND projects_membership.project_id = entities.project)
+        ON (projects_membership.user_id = {from_user_id} AND projects_membership.project_id = activity.project_id)
 
     LEFT JOIN users_role
-        ON (entities.project = users_role.project_id AND users_role.id =  projects_membership.role_id)
+        ON (activity.project_id = users_role.project_id AND users_role.id =  projects_membership.role_id)
 
     WHERE
+        activity.user_id = {for_user_id}
+        AND activity.action = %(action)s
+        -- the object could have been deleted without sending signals
+        AND (django_content_type.model = 'project' OR coalesce(userstories_userstory.id, tasks_task.id, issues_issue.id) IS NOT NULL)
         -- public project
-        (
+        AND (
             projects_project.is_private = false
             OR(
                 -- private project where the view_ permission is included in the user role for that project or in the anon permissions
                 projects_project.is_private = true
                 AND(
-                    'view_project' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions))
+                    (django_content_type.model = 'issue' AND 'view_issues' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
+                    OR (django_content_type.model = 'task' AND 'view_tasks' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
+                    OR (django_content_type.model = 'userstory' AND 'view_us' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
+                    OR (django_content_type.model = 'project' AND 'view_project' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
                 )
         ))
     -- END Permissions checking
         {filters_sql}
 
-    ORDER BY entities.created_date DESC;
+    ORDER BY activity.created_date DESC, activity.id DESC
+    {limit_sql};
     """
 
     from_user_id = -1
@@ -467,13 +499,18 @@ def get_liked_list(for_user, from_user, type=None, q=None):
     sql = sql.format(
         for_user_id=for_user.id,
         from_user_id=from_user_id,
+        none_notify_level=NotifyLevel.none,
         filters_sql=filters_sql,
-        projects_sql=_build_liked_sql_for_projects(for_user))
+        limit_sql=limit_sql)
 
     cursor = connection.cursor()
     params = {
-        "type": type,
-        "q": to_tsquery(q) if q is not None else ""
+        "action": action,
+        "content_type_id": content_type_id,
+        "q": to_tsquery(q) if q is not None else "",
+        "before_date": before[0] if before is not None else None,
+        "before_id": before[1] if before is not None else None,
+        "limit": limit,
     }
     cursor.execute(sql, params)
 
@@ -484,95 +521,34 @@ def get_liked_list(for_user, from_user, type=None, q=None):
     ]
 
 
-def get_voted_list(for_user, from_user, type=None, q=None):
-    filters_sql = ""
-    and_needed = False
-
-    if type:
-        filters_sql += " AND type = %(type)s "
+def get_watched_list(for_user, from_user, type=None, q=None, before=None, limit=None):
+    """Get the objects watched by `for_user` visible for `from_user`, newest first.
 
-    if q:
-        filters_sql += """ AND (
-            to_tsvector('english_nostop', coalesce(subject,'') || ' ' ||coalesce(entities.name,'') || ' ' ||coalesce(to_char(ref, '999'),'')) @@ to_tsquery('english_nostop', %(q)s)
-        )
-        """
-
-    sql = """
-    -- BEGIN Basic info: we need to mix info from different tables and denormalize it
-    SELECT entities.*,
-           projects_project.name as project_name, projects_project.description as description, projects_project.slug as project_slug, projects_project.is_private as project_is_private,
-           projects_project.blocked_code as project_blocked_code, projects_project.tags_colors, projects_project.logo,
-           users_user.username assigned_to_username, users_user.full_name assigned_to_full_name, users_user.photo assigned_to_photo, users_user.email assigned_to_email
-        FROM (
-            {userstories_sql}
-            UNION
-            {tasks_sql}
-            UNION
-            {issues_sql}
-        ) as entities
-    -- END Basic info
-
-    -- BEGIN Project info
-    LEFT JOIN projects_project
-        ON (entities.project = projects_project.id)
-    -- END Project info
-
-    -- BEGIN Assigned to user info
-    LEFT JOIN users_user
-        ON (assigned_to = users_user.id)
-    -- END Assigned to user info
-
-    -- BEGIN Permissions checking
-    LEFT JOIN projects_membership
-        -- Here we check the memberbships from the user requesting the info
-        ON (projects_membership.user_id = {from_user_id} AND projects_membership.project_id = entities.project)
+    :param type: Only return the objects of this type.
+    :param q: Only return the objects matching this text.
+    :param before: Keyset pagination cursor, see `parse_user_activity_cursor`.
+    :param limit: Maximum number of objects.
+    """
+    return _get_user_activity_list(ACTIVITY_ACTION_WATCH, for_user, from_user, type=type, q=q,
+                                   before=before, limit=limit)
 
-    LEFT JOIN users_role
-        ON (entities.project = users_role.project_id AND users_role.id =  projects_membership.role_id)
 
-    WHERE
-        -- public project
-        (
-            projects_project.is_private = false
-            OR(
-                -- private project where the view_ permission is included in the user role for that project or in the anon permissions
-                projects_project.is_private = true
-                AND(
-                    (entities.type = 'issue' AND 'view_issues' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                    OR (entities.type = 'task' AND 'view_tasks' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                    OR (entities.type = 'userstory' AND 'view_us' = ANY (array_cat(users_role.permissions, projects_project.anon_permissions)))
-                )
-        ))
-    -- END Permissions checking
-        {filters_sql}
+def get_liked_list(for_user, from_user, type=None, q=None, before=None, limit=None):
+    """Get the objects liked by `for_user` visible for `from_user`, newest first.
 
-    ORDER BY entities.created_date DESC;
+    See `get_watched_list` for the filters.
     """
+    return _get_user_activity_list(ACTIVITY_ACTION_LIKE, for_user, from_user, type=type, q=q,
+                                   before=before, limit=limit)
 
-    from_user_id = -1
-    if not from_user.is_anonymous():
-        from_user_id = from_user.id
-
-    sql = sql.format(
-        for_user_id=for_user.id,
-        from_user_id=from_user_id,
-        filters_sql=filters_sql,
-        userstories_sql=_build_sql_for_type(for_user, "userstory", "userstories_userstory", "votes_vote", slug_column="null"),
-        tasks_sql=_build_sql_for_type(for_user, "task", "tasks_task", "votes_vote", slug_column="null"),
-        issues_sql=_build_sql_for_type(for_user, "issue", "issues_issue", "votes_vote", slug_column="null"))
 
-    cursor = connection.cursor()
-    params = {
-        "type": type,
-        "q": to_tsquery(q) if q is not None else ""
-    }
-    cursor.execute(sql, params)
+def get_voted_list(for_user, from_user, type=None, q=None, before=None, limit=None):
+    """Get the objects voted by `for_user` visible for `from_user`, newest first.
 
-    desc = cursor.description
-    return [
-        dict(zip([col[0] for col in desc], row))
-        for row in cursor.fetchall()
-    ]
+    See `get_watched_list` for the filters.
+    """
+    return _get_user_activity_list(ACTIVITY_ACTION_VOTE, for_user, from_user, type=type, q=q,
+                                   before=before, limit=limit)
 
 
 def has_available_slot_for_import_new_project(owner, is_private, total_memberships):
@@ -16,6 +16,83 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import django.dispatch
+from django.contrib.contenttypes.models import ContentType
+
+from taiga.projects.notifications.choices import NotifyLevel
+
+from . import services
+from .models import ACTIVITY_ACTION_WATCH, ACTIVITY_ACTION_LIKE, ACTIVITY_ACTION_VOTE
 
 
 user_cancel_account = django.dispatch.Signal(providing_args=["user", "request_data"])
+
+
+####################################
+# Signals for the activity index
+####################################
+
+def add_activity_when_create_watched(sender, instance, created, **kwargs):
+    if created:
+        content_type = ContentType.objects.get_for_id(instance.content_type_id)
+        services.add_user_activity(instance.user_id, ACTIVITY_ACTION_WATCH, content_type,
+                                   instance.object_id, instance.created_date)
+
+
+def remove_activity_when_delete_watched(sender, instance, **kwargs):
+    services.remove_user_activity(instance.user_id, ACTIVITY_ACTION_WATCH, instance.content_type_id,
+                                  instance.object_id)
+
+
+def update_activity_when_save_notify_policy(sender, instance, **kwargs):
+    # The projects are watched through the notify policies
+    content_type = ContentType.objects.get_by_natural_key("projects", "project")
+    if instance.notify_level != NotifyLevel.none:
+        services.add_user_activity(instance.user_id, ACTIVITY_ACTION_WATCH, content_type,
+                                   instance.project_id, instance.created_at)
+    else:
+        services.remove_user_activity(instance.user_id, ACTIVITY_ACTION_WATCH, content_type.id,
+                                      instance.project_id)
+
+
+def remove_activity_when_delete_notify_policy(sender, instance, **kwargs):
+    content_type = ContentType.objects.get_by_natural_key("projects", "project")
+    services.remove_user_activity(instance.user_id, ACTIVITY_ACTION_WATCH, content_type.id,
+                                  instance.project_id)
+
+
+def add_activity_when_create_like(sender, instance, created, **kwargs):
+    if created:
+        content_type = ContentType.objects.get_for_id(instance.content_type_id)
+        services.add_user_activity(instance.user_id, ACTIVITY_ACTION_LIKE, content_type,
+                                   instance.object_id, instance.created_date)
+
+
+def remove_activity_when_delete_like(sender, instance, **kwargs):
+    services.remove_user_activity(instance.user_id, ACTIVITY_ACTION_LIKE, instance.content_type_id,
+                                  instance.object_id)
+
+
+def add_activity_when_create_vote(sender, instance, created, **kwargs):
+    if created:
+        content_type = ContentType.objects.get_for_id(instance.content_type_id)
+        services.add_user_activity(instance.user_id, ACTIVITY_ACTION_VOTE, content_type,
+                                   instance.object_id, instance.created_date)
+
+
+def remove_activity_when_delete_vote(sender, instance, **kwargs):
+    services.remove_user_activity(instance.user_id, ACTIVITY_ACTION_VOTE, instance.content_type_id,
+                                  instance.object_id)
+
+
+def update_activities_when_save_object(sender, instance, created, update_fields=None, **kwargs):
+    # A new object isn't in the index of any user yet
+    if created:
+        return
+
+    content_type = ContentType.objects.get_for_model(instance)
+    services.update_user_activities_of_object(content_type, instance, update_fields=update_fields)
+
+
+def remove_activities_when_delete_object(sender, instance, **kwargs):
+    content_type = ContentType.objects.get_for_model(instance)
+    services.remove_user_activities_of_object(content_type.id, instance.id)
@@ -317,7 +317,8 @@ class MilestoneSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = milestone_models.Milestone
-        exclude = ("order", "watchers")
+        exclude = ("order", "watchers", "total_user_stories", "closed_user_stories", "total_tasks",
+                   "closed_tasks")
 
     def get_permalink(self, obj):
         return resolve_front_url("taskboard", obj.project.slug, obj.slug)
@@ -341,7 +342,8 @@ class UserStorySerializer(CustomAttributesValuesWebhookSerializerMixin, Editable
 
     class Meta:
         model = us_models.UserStory
-        exclude = ("backlog_order", "sprint_order", "kanban_order", "version", "total_watchers", "is_watcher")
+        exclude = ("backlog_order", "sprint_order", "kanban_order", "version", "total_watchers", "is_watcher",
+                   "total_tasks", "closed_tasks", "total_points", "total_voters", "watchers_ids")
 
     def get_permalink(self, obj):
         return resolve_front_url("userstory", obj.project.slug, obj.ref)
@@ -367,7 +369,7 @@ class TaskSerializer(CustomAttributesValuesWebhookSerializerMixin, EditableWatch
 
     class Meta:
         model = task_models.Task
-        exclude = ("version", "total_watchers", "is_watcher")
+        exclude = ("version", "total_watchers", "is_watcher", "total_voters", "watchers_ids")
 
     def get_permalink(self, obj):
         return resolve_front_url("task", obj.project.slug, obj.ref)
@@ -395,7 +397,7 @@ class IssueSerializer(CustomAttributesValuesWebhookSerializerMixin, EditableWatc
 
     class Meta:
         model = issue_models.Issue
-        exclude = ("version", "total_watchers", "is_watcher")
+        exclude = ("version", "total_watchers", "is_watcher", "total_voters", "watchers_ids")
 
     def get_permalink(self, obj):
         return resolve_front_url("issue", obj.project.slug, obj.ref)
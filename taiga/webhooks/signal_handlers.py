@@ -15,25 +15,87 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+
 from django.db import connection
 from django.conf import settings
 from django.utils import timezone
 
 from taiga.projects.history import services as history_service
 from taiga.projects.history.choices import HistoryType
+from taiga.projects.history.models import HistoryEntry
 
 from . import tasks
 
+import threading
+
 
 def _get_project_webhooks(project):
-    webhooks = []
-    for webhook in project.webhooks.all():
-        webhooks.append({
-            "id": webhook.pk,
-            "url": webhook.url,
-            "key": webhook.key,
-        })
-    return webhooks
+    return list(project.webhooks.values_list("id", "url", "key"))
+
+
+def _send_payload(webhooks, payload):
+    if settings.CELERY_ENABLED:
+        tasks.send_webhooks.delay(webhooks, payload)
+    else:
+        tasks.send_webhooks(webhooks, payload)
+
+
+class WebhooksBatch:
+    """
+    Collect the changes of a transaction to send them, on commit, in
+    "bulk" payloads (one per webhook if they don't exceed the limits).
+
+    Every change registers the flush with `on_commit` (it runs once), so
+    it's kept while any of the changes is. The changes of the rolled back
+    savepoints are discarded on flush: their history entries don't exist.
+    """
+    def __init__(self):
+        self.projects = OrderedDict()
+        self.flushed = False
+
+    def add(self, project_id, webhooks, history_entry_id, action, by, date, obj, change):
+        entries = self.projects.setdefault(project_id, (webhooks, []))[1]
+        entries.append((history_entry_id, (action, by, date, obj, change)))
+        connection.on_commit(self.flush)
+
+    def flush(self):
+        if self.flushed:
+            return None
+        self.flushed = True
+
+        history_entries_ids = [history_entry_id for webhooks, entries in self.projects.values()
+                                                for history_entry_id, entry in entries]
+        committed_ids = set(HistoryEntry.objects.filter(id__in=history_entries_ids)
+                                                .values_list("id", flat=True))
+
+        for webhooks, entries in self.projects.values():
+            entries = [entry for history_entry_id, entry in entries
+                       if history_entry_id in committed_ids]
+            if not entries:
+                continue
+
+            if len(entries) == 1:
+                payloads = [tasks.render_payload(*entries[0])]
+            else:
+                payloads = tasks.render_bulk_payloads(entries)
+
+            for payload in payloads:
+                _send_payload(webhooks, payload)
+
+
+_local = threading.local()
+
+
+def _get_current_batch():
+    batch = getattr(_local, "batch", None)
+
+    # The batch of a rolled back transaction isn't flushed, it's reused and
+    # its changes are discarded on the next flush.
+    if batch is None or batch.flushed:
+        batch = WebhooksBatch()
+        _local.batch = batch
+    return batch
 
 
 def on_new_history_entry(sender, instance, created, **kwargs):
@@ -52,24 +114,30 @@ def on_new_history_entry(sender, instance, created, **kwargs):
         return None
 
     webhooks = _get_project_webhooks(obj.project)
+    if not webhooks:
+        return None
 
     if instance.type == HistoryType.create:
-        task = tasks.create_webhook
-        extra_args = []
+        action = "create"
+        change = None
     elif instance.type == HistoryType.change:
-        task = tasks.change_webhook
-        extra_args = [instance]
+        action = "change"
+        change = instance
     elif instance.type == HistoryType.delete:
-        task = tasks.delete_webhook
-        extra_args = []
+        action = "delete"
+        change = None
 
     by = instance.owner
     date = timezone.now()
 
-    for webhook in webhooks:
-        args = [webhook["id"], webhook["url"], webhook["key"], by, date, obj] + extra_args
+    if settings.WEBHOOKS_BULK_MODE and connection.in_atomic_block:
+        _get_current_batch().add(obj.project_id, webhooks, instance.id, action, by, date, obj, change)
+        return None
+
+    def send_webhooks():
+        # The payload is rendered once and the same bytes are signed with
+        # the key of every webhook.
+        payload = tasks.render_payload(action, by, date, obj, change)
+        _send_payload(webhooks, payload)
 
-        if settings.CELERY_ENABLED:
-            connection.on_commit(lambda: task.delay(*args))
-        else:
-            connection.on_commit(lambda: task(*args))
+    connection.on_commit(send_webhooks)
@@ -17,10 +17,21 @@
 
 import hmac
 import hashlib
+import itertools
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connection
+
 from taiga.base.api.renderers import UnicodeJSONRenderer
+from taiga.base.utils import json
 from taiga.base.utils.db import get_typename_for_model_instance
 from taiga.celery import app
 
@@ -57,8 +68,38 @@ def _generate_signature(data, key):
     return mac.hexdigest()
 
 
-def _send_request(webhook_id, url, key, data):
-    serialized_data = UnicodeJSONRenderer().render(data)
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_session(url):
+    """
+    Get the session used for the requests to the host of `url`. Sessions
+    are shared by all the deliveries of the process so the connections
+    are reused.
+    """
+    parsed_url = urlsplit(url)
+    host = (parsed_url.scheme, parsed_url.netloc)
+
+    session = _sessions.get(host, None)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host, None)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=settings.WEBHOOKS_POOL_SIZE)
+                session.mount("{}://".format(parsed_url.scheme), adapter)
+                _sessions[host] = session
+    return session
+
+
+def _deliver(webhook_id, url, key, data, serialized_data=None):
+    """
+    Send a webhook request and return its log (not saved yet). `data` is
+    only rendered if `serialized_data` is not provided.
+    """
+    if serialized_data is None:
+        serialized_data = UnicodeJSONRenderer().render(data)
     signature = _generate_signature(serialized_data, key)
     headers = {
         "X-TAIGA-WEBHOOK-SIGNATURE": signature,
@@ -67,72 +108,173 @@ def _send_request(webhook_id, url, key, data):
     request = requests.Request('POST', url, data=serialized_data, headers=headers)
     prepared_request = request.prepare()
 
-    with requests.Session() as session:
-        try:
-            response = session.send(prepared_request)
-        except RequestException as e:
-            # Error sending the webhook
-            webhook_log = WebhookLog.objects.create(webhook_id=webhook_id, url=url, status=0,
-                                                    request_data=data,
-                                                    request_headers=dict(prepared_request.headers),
-                                                    response_data="error-in-request: {}".format(str(e)),
-                                                    response_headers={},
-                                                    duration=0)
-        else:
-            # Webhook was sent successfully
-            webhook_log = WebhookLog.objects.create(webhook_id=webhook_id, url=url,
-                                                    status=response.status_code,
-                                                    request_data=data,
-                                                    request_headers=dict(prepared_request.headers),
-                                                    response_data=response.content,
-                                                    response_headers=dict(response.headers),
-                                                    duration=response.elapsed.total_seconds())
-        finally:
-            # Only the last ten webhook logs traces are required
-            # so remove the leftover
-            ids = (WebhookLog.objects.filter(webhook_id=webhook_id)
-                                     .order_by("-id")
-                                     .values_list('id', flat=True)[10:])
-            WebhookLog.objects.filter(id__in=ids).delete()
-
-    return webhook_log
+    try:
+        response = _get_session(url).send(prepared_request, timeout=settings.WEBHOOKS_REQUEST_TIMEOUT)
+    except RequestException as e:
+        # Error sending the webhook
+        return WebhookLog(webhook_id=webhook_id, url=url, status=0,
+                          request_data=data,
+                          request_headers=dict(prepared_request.headers),
+                          response_data="error-in-request: {}".format(str(e)),
+                          response_headers={},
+                          duration=0)
 
+    # Webhook was sent successfully
+    return WebhookLog(webhook_id=webhook_id, url=url,
+                      status=response.status_code,
+                      request_data=data,
+                      request_headers=dict(prepared_request.headers),
+                      response_data=response.content,
+                      response_headers=dict(response.headers),
+                      duration=response.elapsed.total_seconds())
 
-@app.task
-def create_webhook(webhook_id, url, key, by, date, obj):
-    data = {}
-    data['action'] = "create"
-    data['type'] = _get_type(obj)
-    data['by'] = UserSerializer(by).data
-    data['date'] = date
-    data['data'] = _serialize(obj)
 
-    return _send_request(webhook_id, url, key, data)
+_pending_prune = Counter()
 
 
-@app.task
-def delete_webhook(webhook_id, url, key, by, date, obj):
-    data = {}
-    data['action'] = "delete"
-    data['type'] = _get_type(obj)
-    data['by'] = UserSerializer(by).data
-    data['date'] = date
-    data['data'] = _serialize(obj)
+def prune_logs(webhook_ids=None):
+    """
+    Only the last WEBHOOKS_LOGS_KEPT logs of every webhook are required,
+    so remove the leftover (of all the webhooks if `webhook_ids` is None).
+    """
+    where = "WHERE webhook_id = ANY(%(ids)s)" if webhook_ids is not None else ""
+    sql = """
+    DELETE FROM webhooks_webhooklog
+          WHERE id IN (SELECT id
+                         FROM (SELECT id, row_number() OVER (PARTITION BY webhook_id
+                                                             ORDER BY id DESC) AS position
+                                 FROM webhooks_webhooklog
+                                {where}) AS logs
+                        WHERE logs.position > %(kept)s);
+    """.format(where=where)
 
-    return _send_request(webhook_id, url, key, data)
+    cursor = connection.cursor()
+    cursor.execute(sql, {"ids": list(webhook_ids or []), "kept": settings.WEBHOOKS_LOGS_KEPT})
+    cursor.close()
+
+
+def _prune_logs_periodically(webhook_ids):
+    # Instead of pruning on every delivery, the logs of a webhook are pruned
+    # once every WEBHOOKS_LOGS_PRUNE_INTERVAL deliveries.
+    _pending_prune.update(webhook_ids)
+    ready_ids = [webhook_id for webhook_id in set(webhook_ids)
+                 if _pending_prune[webhook_id] >= settings.WEBHOOKS_LOGS_PRUNE_INTERVAL]
+    if ready_ids:
+        prune_logs(ready_ids)
+        for webhook_id in ready_ids:
+            del _pending_prune[webhook_id]
+
+
+def _send_requests(deliveries):
+    """
+    Send many webhook requests. `deliveries` is a list of tuples with the
+    following format:
+
+    [(<webhook id>, <url>, <key>, <data>[, <serialized data>]), ...]
+
+    The requests of a webhook are sent in order and the ones of different
+    webhooks concurrently (up to WEBHOOKS_DELIVERY_WORKERS threads). The
+    logs are saved at once and returned in the order of `deliveries`.
+    """
+    queues = OrderedDict()
+    for position, delivery in enumerate(deliveries):
+        queues.setdefault(delivery[0], []).append((position, delivery))
+
+    def deliver_queue(queue):
+        return [(position, _deliver(*delivery)) for position, delivery in queue]
+
+    workers = min(settings.WEBHOOKS_DELIVERY_WORKERS, len(queues))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(deliver_queue, queues.values()))
+    else:
+        results = [deliver_queue(queue) for queue in queues.values()]
+
+    webhook_logs = [None] * len(deliveries)
+    for position, webhook_log in itertools.chain.from_iterable(results):
+        webhook_logs[position] = webhook_log
+
+    if len(webhook_logs) == 1:
+        # bulk_create doesn't set the id and the single logs are serialized
+        webhook_logs[0].save()
+    elif webhook_logs:
+        WebhookLog.objects.bulk_create(webhook_logs)
+
+    _prune_logs_periodically([delivery[0] for delivery in deliveries])
+    return webhook_logs
+
+
+def _send_request(webhook_id, url, key, data, serialized_data=None):
+    return _send_requests([(webhook_id, url, key, data, serialized_data)])[0]
 
 
 @app.task
-def change_webhook(webhook_id, url, key, by, date, obj, change):
+def prune_webhook_logs():
+    prune_logs()
+
+
+def render_payload(action, by, date, obj, change=None):
+    """
+    Render the payload of the webhooks of a change of `obj` (a
+    history entry). It's rendered only once for all the webhooks
+    of the project.
+    """
     data = {}
-    data['action'] = "change"
+    data['action'] = action
     data['type'] = _get_type(obj)
     data['by'] = UserSerializer(by).data
     data['date'] = date
     data['data'] = _serialize(obj)
-    data['change'] = _serialize(change)
+    if change is not None:
+        data['change'] = _serialize(change)
 
-    return _send_request(webhook_id, url, key, data)
+    return UnicodeJSONRenderer().render(data)
+
+
+def render_bulk_payloads(entries):
+    """
+    Render the "bulk" payloads of many changes, `entries` is a list of
+    (<action>, <by>, <date>, <obj>, <change>) tuples. Every payload has
+    up to WEBHOOKS_BULK_MAX_ITEMS changes and, unless a single change is
+    bigger, WEBHOOKS_BULK_MAX_SIZE bytes.
+    """
+    action, by, date, obj, change = entries[0]
+    header = UnicodeJSONRenderer().render({
+        "action": "bulk",
+        "type": "bulk",
+        "by": UserSerializer(by).data,
+        "date": date,
+    })
+    # The rendered items are inserted in the rendered header
+    start = header[:-1] + b', "data": ['
+    end = b"]}"
+
+    payloads = []
+    items = []
+    size = len(start) + len(end)
+    for entry in entries:
+        item = render_payload(*entry)
+        if items and (len(items) >= settings.WEBHOOKS_BULK_MAX_ITEMS or
+                      size + len(item) + 1 > settings.WEBHOOKS_BULK_MAX_SIZE):
+            payloads.append(start + b",".join(items) + end)
+            items = []
+            size = len(start) + len(end)
+
+        items.append(item)
+        size += len(item) + 1
+
+    payloads.append(start + b",".join(items) + end)
+    return payloads
+
+
+@app.task
+def send_webhooks(webhooks, payload):
+    """
+    Send a rendered payload to many webhooks, `webhooks` is a list of
+    (<webhook id>, <url>, <key>) tuples.
+    """
+    data = json.loads(payload.decode("utf-8"))
+    return _send_requests([(webhook_id, url, key, data, payload) for webhook_id, url, key in webhooks])
 
 
 @app.task
@@ -100,3 +100,16 @@ def test_token_validate(client):
     decyphered_token = encryption.decrypt(response.data["cyphered_token"], token.application.key)[0]
     decyphered_token = json.loads(decyphered_token.decode("utf-8"))
     assert decyphered_token["token"] == token.token
+
+
+def test_revoked_token_doesnt_authenticate(client):
+    token = f.ApplicationTokenFactory(token="test-application-token")
+    url = reverse("users-me")
+
+    response = client.get(url, HTTP_AUTHORIZATION="Application {}".format(token.token))
+    assert response.status_code == 200
+
+    # Revoked by another process, nothing is invalidated in this one
+    models.ApplicationToken.objects.filter(id=token.id).update(token=None)
+    response = client.get(url, HTTP_AUTHORIZATION="Application {}".format(token.token))
+    assert response.status_code == 401
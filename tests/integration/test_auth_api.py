@@ -21,6 +21,9 @@ import pytest
 from django.core.urlresolvers import reverse
 from django.core import mail
 
+from taiga.auth.tokens import get_token_for_user
+from taiga.users.models import User
+
 from .. import factories
 
 pytestmark = pytest.mark.django_db
@@ -171,3 +174,19 @@ def test_auth_uppercase_ignore(client, settings):
 
     response = client.post(reverse("auth-list"), login_form)
     assert response.status_code == 400
+
+
+def test_authenticated_users_are_not_cached_in_a_local_memory_cache(client):
+    user = factories.UserFactory.create(username="first-username")
+    token = get_token_for_user(user, "authentication")
+
+    url = reverse("users-me")
+    response = client.get(url, HTTP_AUTHORIZATION="Bearer {}".format(token))
+    assert response.status_code == 200
+    assert response.data["username"] == "first-username"
+
+    # Another process could change the user, the update doesn't invalidate anything
+    User.objects.filter(id=user.id).update(username="second-username")
+    response = client.get(url, HTTP_AUTHORIZATION="Bearer {}".format(token))
+    assert response.status_code == 200
+    assert response.data["username"] == "second-username"
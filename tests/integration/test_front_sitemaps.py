@@ -0,0 +1,163 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# Copyright (C) 2014-2016 Anler Hernández <hello@anler.me>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+
+import os
+import pytest
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+
+from .. import factories as f
+
+from taiga.front.apps import connect_sitemaps_signals
+from taiga.front.apps import disconnect_sitemaps_signals
+from taiga.front.sitemaps import services
+from taiga.front.sitemaps import sitemaps
+
+pytestmark = [pytest.mark.django_db(transaction=True),
+              pytest.mark.urls("taiga.front.sitemaps.urls")]
+
+
+@pytest.fixture
+def sitemaps_path(request, settings, tmpdir):
+    settings.FRONT_SITEMAP_ENABLED = True
+    settings.FRONT_SITEMAP_PATH = str(tmpdir)
+    connect_sitemaps_signals()
+    request.addfinalizer(disconnect_sitemaps_signals)
+    return str(tmpdir)
+
+
+def _get_urls(section):
+    urls = {}
+    for shard in services._get_shards(section):
+        urls.update(services._read_shard(section, shard))
+    return urls
+
+
+def _get_locations(section):
+    return sorted(url_info["location"] for url_info in _get_urls(section).values())
+
+
+def _get_all_urls():
+    return {section: _get_urls(section) for section, sitemap_class in sitemaps.items()
+            if sitemap_class.model is not None}
+
+
+def test_create_edit_and_delete_user_story_updates_the_sitemap(sitemaps_path):
+    project = f.ProjectFactory.create(is_private=False)
+    us = f.UserStoryFactory.create(project=project, milestone=None)
+    location = sitemaps["userstories"]().location(us)
+
+    assert _get_locations("userstories") == [location]
+    assert os.path.exists(services.get_shard_path("userstories", services.get_shard(us.pk)))
+
+    us.ref = us.ref + 1000
+    us.save()
+    assert _get_locations("userstories") == [sitemaps["userstories"]().location(us)]
+
+    us_pk = us.pk
+    us.delete()
+    assert _get_locations("userstories") == []
+    assert not os.path.exists(services.get_shard_path("userstories", services.get_shard(us_pk)))
+
+
+def test_edit_and_delete_project_updates_the_sitemap(sitemaps_path):
+    project = f.ProjectFactory.create(is_private=False)
+    us = f.UserStoryFactory.create(project=project, milestone=None)
+    assert _get_locations("projects") == [sitemaps["projects"]().location(project)]
+
+    project.slug = "new-project-slug"
+    project.save()
+    assert _get_locations("projects") == [sitemaps["projects"]().location(project)]
+    assert _get_locations("userstories") == [sitemaps["userstories"]().location(us)]
+
+    project.delete()
+    assert _get_locations("projects") == []
+    assert _get_locations("userstories") == []
+
+
+def test_make_project_private_removes_its_items_from_the_sitemap(sitemaps_path):
+    project = f.ProjectFactory.create(is_private=False)
+    f.UserStoryFactory.create(project=project, milestone=None)
+    assert len(_get_locations("projects")) == 1
+    assert len(_get_locations("userstories")) == 1
+
+    project.is_private = True
+    project.anon_permissions = []
+    project.save()
+    assert _get_locations("projects") == []
+    assert _get_locations("userstories") == []
+
+
+def test_rebuild_sitemaps_equals_the_incremental_updates(sitemaps_path):
+    public_project = f.ProjectFactory.create(is_private=False)
+    private_project = f.ProjectFactory.create(is_private=True, anon_permissions=[])
+    for project in [public_project, private_project]:
+        f.UserStoryFactory.create(project=project, milestone=None)
+        f.TaskFactory.create(project=project, milestone=None, user_story=None)
+        f.IssueFactory.create(project=project, milestone=None)
+        f.WikiPageFactory.create(project=project)
+    deleted_us = f.UserStoryFactory.create(project=public_project, milestone=None)
+    deleted_us.delete()
+
+    incremental_urls = _get_all_urls()
+    assert incremental_urls["userstories"]
+
+    call_command("rebuild_sitemaps")
+    assert _get_all_urls() == incremental_urls
+
+
+def test_sitemap_views_dont_query_the_database(client, sitemaps_path):
+    project = f.ProjectFactory.create(is_private=False)
+    f.UserStoryFactory.create(project=project, milestone=None)
+    services.write_index()
+
+    shard = services.get_shard(project.pk)
+    with CaptureQueriesContext(connection) as queries:
+        index_response = client.get(reverse("front-sitemap-index"))
+        sitemap_response = client.get(reverse("front-sitemap", kwargs={"section": "projects",
+                                                                       "shard": shard}))
+    assert len(queries) == 0
+
+    assert index_response.status_code == 200
+    assert "sitemap-projects-{}.xml".format(shard).encode() in index_response.content
+    assert sitemap_response.status_code == 200
+    assert sitemaps["projects"]().location(project).encode() in sitemap_response.content
+
+    response = client.get(reverse("front-sitemap", kwargs={"section": "projects", "shard": shard + 1}))
+    assert response.status_code == 404
+
+
+def test_sitemap_updates_run_in_a_task_by_shard(settings, sitemaps_path):
+    settings.FRONT_SITEMAP_SHARD_SIZE = 2
+    project = f.ProjectFactory.create(is_private=False)
+
+    with mock.patch("taiga.front.tasks.update_sitemaps") as update_sitemaps_mock:
+        with transaction.atomic():
+            user_stories = [f.UserStoryFactory.create(project=project, milestone=None)
+                            for i in range(3)]
+
+    calls = [call[0] for call in update_sitemaps_mock.call_args_list if call[0][0] == "userstories"]
+    keys_by_shard = {}
+    for us in user_stories:
+        keys_by_shard.setdefault(services.get_shard(us.pk), []).append(us.pk)
+    assert sorted(keys for section, keys in calls) == sorted(keys_by_shard.values())
+    assert _get_locations("userstories") == []
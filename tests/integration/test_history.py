@@ -20,6 +20,8 @@ import pytest
 from unittest.mock import patch
 
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from .. import factories as f
 
 from taiga.base.utils import json
@@ -235,3 +237,24 @@ def test_delete_comment_by_project_owner(client):
     url = "%s?id=%s" % (url, history_entry.id)
     response = client.post(url, content_type="application/json")
     assert 200 == response.status_code, response.status_code
+
+
+def test_attach_owners_to_history_entries():
+    user1 = f.UserFactory.create()
+    user2 = f.UserFactory.create()
+    deleted_user_id = user2.id + 1000
+    # The hidden entries are not pushed to the timelines
+    entries = [
+        f.HistoryEntryFactory.create(type=HistoryType.change, key="userstories.userstory:1",
+                                     diff={}, is_hidden=True, user={"pk": user_id})
+        for user_id in [user1.id, user2.id, user1.id, deleted_user_id]
+    ]
+    entries = list(HistoryEntry.objects.filter(id__in=[entry.id for entry in entries])
+                                       .order_by("created_at"))
+
+    with CaptureQueriesContext(connection) as captured:
+        entries = services.attach_owners_to_history_entries(entries)
+        owners = [entry.owner for entry in entries]
+
+    assert len(captured.captured_queries) == 1
+    assert owners == [user1, user2, user1, None]
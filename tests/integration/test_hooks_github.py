@@ -92,6 +92,47 @@ def test_push_event_detected(client):
     assert response.status_code == 204
 
 
+def test_push_event_redelivered_is_processed_once(client):
+    project = f.ProjectFactory()
+    url = reverse("github-hook-list")
+    url = "%s?project=%s" % (url, project.id)
+    data = {"commits": [
+        {"message": "test message"},
+    ]}
+
+    GitHubViewSet._validate_signature = mock.Mock(return_value=True)
+
+    with mock.patch.object(event_hooks.PushEventHook, "process_event") as process_event_mock:
+        for i in range(2):
+            response = client.post(url, json.dumps(data),
+                                   HTTP_X_GITHUB_EVENT="push",
+                                   content_type="application/json")
+            assert response.status_code == 204
+
+        assert process_event_mock.call_count == 1
+
+    assert project.hook_deliveries.count() == 1
+    assert project.hook_deliveries.get().processed_date is not None
+
+
+def test_push_event_with_several_refs_processing(client):
+    issue_status = f.IssueStatusFactory()
+    project = issue_status.project
+    new_issue_status = f.IssueStatusFactory(project=project)
+    task_status = f.TaskStatusFactory(project=project)
+    new_task_status = f.TaskStatusFactory(project=project)
+    issue = f.IssueFactory.create(status=issue_status, project=project, owner=project.owner)
+    task = f.TaskFactory.create(status=task_status, project=project, owner=project.owner)
+    payload = {"commits": [
+        {"message": "test TG-%s #%s" % (issue.ref, new_issue_status.slug)},
+        {"message": "test TG-%s #%s" % (task.ref, new_task_status.slug)},
+    ]}
+    ev_hook = event_hooks.PushEventHook(project, payload)
+    ev_hook.process_event()
+    assert Issue.objects.get(id=issue.id).status.id == new_issue_status.id
+    assert Task.objects.get(id=task.id).status.id == new_task_status.id
+
+
 def test_push_event_issue_processing(client):
     creation_status = f.IssueStatusFactory()
     role = f.RoleFactory(project=creation_status.project, permissions=["view_issues"])
@@ -17,6 +17,9 @@
 
 import pytest
 import base64
+import io
+
+from unittest import mock
 
 from django.apps import apps
 from django.core.urlresolvers import reverse
@@ -1107,6 +1110,72 @@ def test_services_store_project_from_dict_with_no_members_public_project_slots_a
     assert "reaches your current limit of memberships for public" in str(excinfo.value)
 
 
+def test_services_store_project_from_dict_in_bulk(client):
+    user = f.UserFactory.create()
+    progress_calls = []
+
+    data = {
+        "slug": "bulk-project",
+        "name": "Bulk project",
+        "description": "Bulk project desc",
+        "roles": [{"name": "Role", "computable": True}],
+        "points": [{"name": "1", "value": 1}],
+        "us_statuses": [{"name": "New"}],
+        "user_stories": [
+            {
+                "subject": "Imported us with ref",
+                "ref": 42,
+                "role_points": [{"role": "Role", "points": "1"}],
+                "history": [
+                    {"type": 0, "user": [user.email, user.full_name], "comment": "First comment"},
+                    {"type": 0, "user": [user.email, user.full_name], "comment": "Second comment"},
+                ]
+            },
+            {
+                "subject": "Imported us without ref",
+            },
+        ]
+    }
+
+    project = services.store_project_from_dict(data, owner=user,
+                                               progress=lambda *args: progress_calls.append(args))
+
+    imported_us = project.user_stories.get(ref=42)
+    assert imported_us.role_points.count() == 1
+    assert imported_us.get_total_points() == 1
+
+    history_entries = apps.get_model("history", "HistoryEntry").objects.filter(
+                                                key="userstories.userstory:{}".format(imported_us.id))
+    assert history_entries.count() == 2
+
+    assert project.user_stories.get(subject="Imported us without ref").ref > 42
+
+    assert progress_calls[0] == ("roles", 1, len(services.store.IMPORT_STEPS))
+    assert progress_calls[-1] == ("timeline", len(services.store.IMPORT_STEPS), len(services.store.IMPORT_STEPS))
+
+
+def test_services_store_project_from_dict_sets_the_references_sequence_once(client):
+    user = f.UserFactory.create()
+
+    data = {
+        "slug": "refs-project",
+        "name": "Refs project",
+        "description": "Refs project desc",
+        "us_statuses": [{"name": "New"}],
+        "user_stories": [{"subject": "Imported us without ref"}] + [
+            {"subject": "Imported us {}".format(ref), "ref": ref} for ref in range(1, 11)
+        ]
+    }
+
+    with mock.patch("taiga.export_import.services.store.seq.set_max",
+                    wraps=services.store.seq.set_max) as set_max_mock:
+        project = services.store_project_from_dict(data, owner=user)
+
+    assert set_max_mock.call_count == 1
+    assert set_max_mock.call_args[0][1] == 10
+    assert project.user_stories.get(subject="Imported us without ref").ref > 10
+
+
 ##################################################################
 ## tes api/v1/importer/load-dummp
 ##################################################################
@@ -1486,6 +1555,58 @@ def test_valid_dump_import_with_celery_disabled(client, settings):
     assert response.data["name"] == "Valid project"
 
 
+def test_valid_archive_dump_import(client, settings):
+    settings.CELERY_ENABLED = False
+
+    project = f.create_project()
+    f.MembershipFactory(project=project, user=project.owner, is_admin=True)
+    user_story = f.create_userstory(project=project, owner=project.owner, subject="Archived us")
+    attachment = f.UserStoryAttachmentFactory.create(project=project, content_object=user_story)
+    wiki_page = f.WikiPageFactory.create(project=project, owner=project.owner)
+
+    output = io.BytesIO()
+    services.render_project_archive(project, output, workers=1)
+
+    client.login(project.owner)
+    url = reverse("importer-load-dump")
+    data = ContentFile(output.getvalue())
+    data.name = "test.tar.gz"
+
+    response = client.post(url, {'dump': data})
+    assert response.status_code == 201, response.data
+
+    new_project = Project.objects.get(id=response.data["id"])
+    assert new_project.id != project.id
+    assert new_project.name == project.name
+
+    new_user_story = new_project.user_stories.get()
+    assert new_user_story.ref == user_story.ref
+    assert new_user_story.subject == user_story.subject
+
+    new_attachment = new_user_story.attachments.get()
+    assert new_attachment.name == attachment.name
+    assert new_attachment.sha1 == attachment.sha1
+    assert new_attachment.attached_file.read() == b"File contents"
+
+    new_wiki_page = new_project.wiki_pages.get()
+    assert new_wiki_page.slug == wiki_page.slug
+    assert new_wiki_page.content == wiki_page.content
+
+
+def test_invalid_archive_dump_import(client, settings):
+    settings.CELERY_ENABLED = False
+
+    user = f.UserFactory.create()
+    client.login(user)
+
+    url = reverse("importer-load-dump")
+    data = ContentFile(b"\x1f\x8b not really an archive")
+    data.name = "test.tar.gz"
+
+    response = client.post(url, {'dump': data})
+    assert response.status_code == 400
+
+
 def test_invalid_dump_import_with_celery_disabled(client, settings):
     settings.CELERY_ENABLED = False
     user = f.UserFactory.create(max_memberships_public_projects=5)
@@ -17,6 +17,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import pytest
+import random
 import time
 import math
 import base64
@@ -942,3 +943,35 @@ def parse_ms_thread_index(index):
         ts.append(ts[-1] + datetime.timedelta(microseconds=(f << 18)//10))
 
     return guid, ts
+
+
+def test_stored_watchers_match_the_watched_objects():
+    rnd = random.Random(1234)
+    project = f.ProjectFactory.create()
+    users = [f.UserFactory.create() for i in range(5)]
+    objs = ([f.UserStoryFactory.create(project=project) for i in range(2)] +
+            [f.TaskFactory.create(project=project) for i in range(2)] +
+            [f.IssueFactory.create(project=project) for i in range(2)])
+
+    for i in range(100):
+        obj, user = rnd.choice(objs), rnd.choice(users)
+        if rnd.random() < 0.6:
+            services.add_watcher(obj, user)
+        else:
+            services.remove_watcher(obj, user)
+
+    for obj in objs:
+        obj_type = apps.get_model("contenttypes", "ContentType").objects.get_for_model(obj)
+        watchers_ids = sorted(models.Watched.objects.filter(content_type=obj_type, object_id=obj.id)
+                                                    .values_list("user_id", flat=True))
+
+        queryset = type(obj).objects.filter(id=obj.id)
+        queryset = utils.attach_watchers_to_queryset(queryset)
+        queryset = utils.attach_total_watchers_to_queryset(queryset)
+        queryset = utils.attach_is_watcher_to_queryset(queryset, users[0])
+        stored_obj = queryset.get()
+
+        assert sorted(stored_obj.watchers) == watchers_ids
+        assert stored_obj.total_watchers == len(watchers_ids)
+        assert stored_obj.is_watcher == (users[0].id in watchers_ids)
+
@@ -553,6 +553,47 @@ def test_update_projects_order_in_bulk(client):
     assert user.memberships.get(project=membership_2.project).user_order == 200
 
 
+def test_bulk_update_choices_order_only_updates_project_objects(client):
+    project = f.ProjectFactory.create()
+    f.MembershipFactory.create(project=project, user=project.owner, is_admin=True)
+    status_1 = f.IssueStatusFactory.create(project=project, order=1)
+    status_2 = f.IssueStatusFactory.create(project=project, order=2)
+    other_status = f.IssueStatusFactory.create(order=3)
+
+    url = reverse("issue-statuses-bulk-update-order")
+    data = {
+        "project": project.id,
+        "bulk_issue_statuses": [[status_1.id, 20], [status_2.id, 10], [other_status.id, 30]]
+    }
+
+    client.login(project.owner)
+    response = client.json.post(url, json.dumps(data))
+
+    assert response.status_code == 204
+    status_1.refresh_from_db()
+    status_2.refresh_from_db()
+    other_status.refresh_from_db()
+    assert status_1.order == 20
+    assert status_2.order == 10
+    assert other_status.order == 3
+
+
+def test_bulk_update_choices_order_with_invalid_data(client):
+    project = f.ProjectFactory.create()
+    f.MembershipFactory.create(project=project, user=project.owner, is_admin=True)
+
+    url = reverse("issue-statuses-bulk-update-order")
+    data = {
+        "project": project.id,
+        "bulk_issue_statuses": [["foo", 20]]
+    }
+
+    client.login(project.owner)
+    response = client.json.post(url, json.dumps(data))
+
+    assert response.status_code == 400
+
+
 def test_create_and_use_template(client):
     user = f.UserFactory.create(is_superuser=True)
     project = f.create_project()
@@ -79,6 +79,44 @@ def test_unique_reference_per_project(seq, refmodels):
     assert not seq.exists(seqname)
 
 
+@pytest.mark.django_db
+def test_reserve_sequence_values(seq):
+    seqname = "foo"
+    seq.create(seqname)
+
+    assert seq.next_values(seqname, 3) == [1, 2, 3]
+    assert seq.next_value(seqname) == 4
+
+    seq.delete(seqname)
+
+
+@pytest.mark.django_db
+def test_refs_are_allocated_before_saving(seq, refmodels):
+    project = factories.ProjectFactory.create()
+    seq.alter(refmodels.make_sequence_name(project), 100)
+
+    user_story = factories.UserStoryFactory.build(project=project)
+    user_story.save()
+
+    assert user_story.ref == 101
+    assert user_story.__class__.objects.get(id=user_story.id).ref == 101
+    reference = refmodels.Reference.objects.get(project=project, ref=101)
+    assert reference.object_id == user_story.id
+
+
+@pytest.mark.django_db
+def test_refs_of_user_stories_created_in_bulk(seq, refmodels):
+    from taiga.projects.userstories import services
+
+    project = factories.ProjectFactory.create()
+    seq.alter(refmodels.make_sequence_name(project), 100)
+
+    user_stories = services.create_userstories_in_bulk("User Story #1\nUser Story #2\n", project=project)
+
+    assert [us.ref for us in user_stories] == [101, 102]
+    assert refmodels.Reference.objects.filter(project=project, ref__in=[101, 102]).count() == 2
+
+
 @pytest.mark.django_db
 def test_regenerate_us_reference_on_project_change(seq, refmodels):
     project1 = factories.ProjectFactory.create()
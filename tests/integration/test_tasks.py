@@ -4,9 +4,12 @@ import csv
 from unittest import mock
 
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from taiga.base.utils import json
 from taiga.projects.tasks import services
+from taiga.projects.tasks.models import Task
 
 from .. import factories as f
 
@@ -36,6 +39,25 @@ Task #2
         db.save_in_bulk.assert_called_once_with(tasks, None, None)
 
 
+def test_update_task_does_not_fetch_its_previous_state():
+    project = f.ProjectFactory.create()
+    user_story1 = f.UserStoryFactory.create(project=project)
+    user_story2 = f.UserStoryFactory.create(project=project)
+    task = f.TaskFactory.create(project=project, user_story=user_story1)
+
+    task = Task.objects.get(id=task.id)
+    task.user_story = user_story2
+    with CaptureQueriesContext(connection) as captured:
+        task.save()
+
+    task_row_selects = [query["sql"] for query in captured.captured_queries
+                        if query["sql"].startswith("SELECT") and
+                           'FROM "tasks_task" WHERE "tasks_task"."id" =' in query["sql"]]
+    assert task_row_selects == []
+    assert task.prev.user_story_id == user_story1.id
+    assert task.get_loaded_state()["user_story_id"] == user_story2.id
+
+
 def test_create_task_without_status(client):
     user = f.UserFactory.create()
     project = f.ProjectFactory.create(owner=user)
@@ -273,3 +273,52 @@ def test_task_create(data):
     f.TaskFactory(user_story=data.user_story1, status=data.task_open_status)
     data.user_story1 = UserStory.objects.get(pk=data.user_story1.pk)
     assert data.user_story1.is_closed is False
+
+
+def test_tasks_counters_are_kept_when_saving_an_outdated_us(data):
+    data.task1.status = data.task_closed_status
+    data.task1.save()
+
+    # data.user_story1 was loaded before the tasks were created
+    data.user_story1.subject = "New subject"
+    data.user_story1.save()
+
+    user_story1 = UserStory.objects.get(pk=data.user_story1.pk)
+    assert user_story1.total_tasks == 3
+    assert user_story1.closed_tasks == 1
+
+
+def test_milestone_counters_when_tasks_and_user_stories_change(data):
+    milestone = f.MilestoneFactory.create(project=data.user_story1.project)
+
+    data.user_story1.milestone = milestone
+    data.user_story1.save()
+    milestone.refresh_from_db()
+    assert milestone.total_user_stories == 1
+    assert milestone.closed_user_stories == 0
+    assert milestone.total_tasks == 3
+    assert milestone.closed_tasks == 0
+    assert milestone.closed is False
+
+    tasks = list(Task.objects.filter(user_story=data.user_story1))
+    for task in tasks:
+        task.status = data.task_closed_status
+        task.save()
+
+    milestone.refresh_from_db()
+    assert milestone.closed_user_stories == 1
+    assert milestone.closed_tasks == 3
+    assert milestone.closed is True
+
+    tasks[2].delete()
+    milestone.refresh_from_db()
+    assert milestone.total_tasks == 2
+    assert milestone.closed is True
+
+    data.user_story1 = UserStory.objects.get(pk=data.user_story1.pk)
+    data.user_story1.milestone = None
+    data.user_story1.save()
+    milestone.refresh_from_db()
+    assert milestone.total_user_stories == 0
+    assert milestone.total_tasks == 0
+    assert milestone.closed_tasks == 0
@@ -1,5 +1,6 @@
 import pytest
 from tempfile import NamedTemporaryFile
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -10,6 +11,7 @@ from .. import factories as f
 from ..utils import DUMMY_BMP_DATA
 
 from taiga.base.utils import json
+from taiga.base.tasks import update_thumbnails
 from taiga.base.utils.thumbnails import get_thumbnail_url
 from taiga.users import models
 from taiga.users.serializers import LikedObjectSerializer, VotedObjectSerializer
@@ -17,6 +19,8 @@ from taiga.auth.tokens import get_token_for_user
 from taiga.permissions.permissions import MEMBERS_PERMISSIONS, ANON_PERMISSIONS, USER_PERMISSIONS
 from taiga.projects import choices as project_choices
 from taiga.users.services import get_watched_list, get_voted_list, get_liked_list
+from taiga.users.services import get_user_activity_cursor, parse_user_activity_cursor
+from taiga.users.services import get_photo_or_gravatar_url
 from taiga.projects.notifications.choices import NotifyLevel
 from taiga.projects.notifications.models import NotifyPolicy
 
@@ -297,6 +301,45 @@ def test_remove_avatar(client):
     assert not any(list(map(os.path.exists, original_photo_paths)))
 
 
+@pytest.mark.django_db(transaction=True)
+def test_user_photo_thumbnails_are_precomputed():
+    user = f.UserFactory()
+
+    with NamedTemporaryFile(delete=False) as avatar:
+        avatar.write(DUMMY_BMP_DATA)
+        avatar.seek(0)
+        user.photo = File(avatar)
+        user.save()
+
+    user = models.User.objects.get(id=user.id)
+    assert user.thumbnails["source"] == user.photo.name
+    assert user.thumbnails[settings.THN_AVATAR_SMALL] is not None
+    assert user.thumbnails[settings.THN_AVATAR_BIG] is not None
+
+    user.thumbnails[settings.THN_AVATAR_SMALL] = "/media/precomputed-avatar.png"
+    assert get_photo_or_gravatar_url(user).endswith("/media/precomputed-avatar.png")
+
+    # Outdated thumbnails are ignored
+    user.thumbnails["source"] = "user/old-photo.png"
+    assert get_photo_or_gravatar_url(user) == get_thumbnail_url(user.photo, settings.THN_AVATAR_SMALL)
+
+
+
+@pytest.mark.django_db(transaction=True)
+def test_user_photo_thumbnails_update_invalidates_the_cached_user():
+    user = f.UserFactory()
+
+    with NamedTemporaryFile(delete=False) as avatar:
+        avatar.write(DUMMY_BMP_DATA)
+        avatar.seek(0)
+        user.photo = File(avatar)
+        user.save()
+
+    with mock.patch("taiga.users.models.invalidate_cached_user") as invalidate_cached_user_mock:
+        update_thumbnails("users.User", user.id)
+
+    invalidate_cached_user_mock.assert_called_once_with(user.id)
+
 def test_list_contacts_private_projects(client):
     project = f.ProjectFactory.create()
     user_1 = f.UserFactory.create()
@@ -690,6 +733,61 @@ def test_get_voted_list_valid_info():
         assert instance_vote_info["assigned_to_photo"] != ""
 
 
+def test_watched_list_follows_the_changes_of_the_objects():
+    fav_user = f.UserFactory()
+    viewer_user = f.UserFactory()
+
+    project = f.ProjectFactory(is_private=False, name="Testing project")
+    user_story = f.UserStoryFactory(project=project, subject="Testing user story")
+    user_story.add_watcher(fav_user)
+
+    assert len(get_watched_list(fav_user, viewer_user, q="story")) == 1
+    assert len(get_watched_list(fav_user, viewer_user, q="renamed")) == 0
+
+    user_story.subject = "Renamed"
+    user_story.save()
+    assert len(get_watched_list(fav_user, viewer_user, q="story")) == 0
+    assert len(get_watched_list(fav_user, viewer_user, q="renamed")) == 1
+
+    user_story.remove_watcher(fav_user)
+    assert len(get_watched_list(fav_user, viewer_user)) == 0
+
+    user_story.add_watcher(fav_user)
+    user_story.delete()
+    assert len(get_watched_list(fav_user, viewer_user)) == 0
+    assert not models.UserActivity.objects.filter(user=fav_user).exists()
+
+
+def test_get_watched_list_with_keyset_pagination(client):
+    fav_user = f.UserFactory()
+
+    project = f.ProjectFactory(is_private=False, name="Testing project")
+    issues = [f.IssueFactory(project=project) for i in range(5)]
+    for issue in issues:
+        issue.add_watcher(fav_user)
+
+    first_page = get_watched_list(fav_user, fav_user, limit=3)
+    assert [elem["id"] for elem in first_page] == [issue.id for issue in reversed(issues)][:3]
+
+    before = parse_user_activity_cursor(get_user_activity_cursor(first_page[-1]))
+    second_page = get_watched_list(fav_user, fav_user, before=before, limit=3)
+    assert [elem["id"] for elem in second_page] == [issue.id for issue in reversed(issues)][3:]
+
+    client.login(fav_user)
+    url = reverse("users-watched", kwargs={"pk": fav_user.pk})
+    response = client.get(url, {"before": "", "page_size": 3})
+    assert response.status_code == 200
+    assert [elem["id"] for elem in response.data] == [issue.id for issue in reversed(issues)][:3]
+
+    response = client.get(response["X-Pagination-Next"])
+    assert response.status_code == 200
+    assert [elem["id"] for elem in response.data] == [issue.id for issue in reversed(issues)][3:]
+    assert not response.has_header("X-Pagination-Next")
+
+    response = client.get(url, {"before": "invalid"})
+    assert response.status_code == 400
+
+
 def test_get_watched_list_with_liked_and_voted_objects(client):
     fav_user = f.UserFactory()
 
@@ -120,6 +120,57 @@ def test_api_filter_by_subject_or_ref(client):
     assert number_of_stories == 1, number_of_stories
 
 
+def test_api_list_uses_the_serialized_cache(client, settings):
+    settings.SERIALIZED_CACHE_ENABLED = True
+    user = f.UserFactory.create()
+    project = f.ProjectFactory.create(owner=user)
+    f.MembershipFactory.create(project=project, user=user, is_admin=True)
+    us = f.UserStoryFactory.create(project=project, blocked_note="**first**", kanban_order=1)
+    url = reverse("userstories-list") + "?project={}".format(project.id)
+
+    client.login(user)
+    response = client.get(url)
+    assert response.status_code == 200
+    assert "first" in response.data[0]["blocked_note_html"]
+
+    # Changes that don't increase the version are only visible in the fresh fields
+    models.UserStory.objects.filter(id=us.id).update(blocked_note="**second**", kanban_order=2)
+    response = client.get(url)
+    assert "first" in response.data[0]["blocked_note_html"]
+    assert response.data[0]["kanban_order"] == 2
+
+    models.UserStory.objects.filter(id=us.id).update(version=us.version + 1)
+    response = client.get(url)
+    assert "second" in response.data[0]["blocked_note_html"]
+
+
+def test_api_list_serialized_cache_keeps_the_related_data_fresh(client, settings):
+    settings.SERIALIZED_CACHE_ENABLED = True
+    user = f.UserFactory.create(full_name="First name")
+    project = f.ProjectFactory.create(owner=user)
+    f.MembershipFactory.create(project=project, user=user, is_admin=True)
+    issue = f.IssueFactory.create(project=project, owner=user, subject="First subject")
+    us = f.UserStoryFactory.create(project=project, owner=user, tags=["first"],
+                                   generated_from_issue=issue)
+    url = reverse("userstories-list") + "?project={}".format(project.id)
+
+    client.login(user)
+    response = client.get(url)
+    assert response.data[0]["owner_extra_info"]["full_name_display"] == "First name"
+    assert response.data[0]["tags"] == ["first"]
+    assert response.data[0]["origin_issue"]["subject"] == "First subject"
+
+    # None of them increase the version of the user story
+    user.__class__.objects.filter(id=user.id).update(full_name="Second name")
+    models.UserStory.objects.filter(id=us.id).update(tags=["second"])
+    issue.subject = "Second subject"
+    issue.save()
+    response = client.get(url)
+    assert response.data[0]["owner_extra_info"]["full_name_display"] == "Second name"
+    assert response.data[0]["tags"] == ["second"]
+    assert response.data[0]["origin_issue"]["subject"] == "Second subject"
+
+
 def test_api_create_in_bulk_with_status(client):
     project = f.create_project()
     f.MembershipFactory.create(project=project, user=project.owner, is_admin=True)
@@ -308,6 +359,31 @@ def test_get_total_points(client):
     assert us_mixed.get_total_points() == 1.0
 
 
+def test_stored_total_points(client):
+    project = f.ProjectFactory.create()
+
+    role1 = f.RoleFactory.create(project=project, computable=True)
+    role2 = f.RoleFactory.create(project=project, computable=True)
+
+    points1 = f.PointsFactory.create(project=project, value=1)
+    points2 = f.PointsFactory.create(project=project, value=2)
+
+    us = f.UserStoryFactory.create(project=project)
+    us.role_points.all().delete()
+    f.RolePointsFactory.create(user_story=us, role=role1, points=points1)
+    f.RolePointsFactory.create(user_story=us, role=role2, points=points2)
+    assert models.UserStory.objects.get(pk=us.pk).total_points == 3.0
+
+    points2.value = 5
+    points2.save()
+    assert models.UserStory.objects.get(pk=us.pk).total_points == 6.0
+
+    role2.computable = False
+    role2.save()
+    assert models.UserStory.objects.get(pk=us.pk).total_points == 1.0
+    assert models.UserStory.objects.get(pk=us.pk).total_points == us.get_total_points()
+
+
 def test_api_filters_data(client):
     project = f.ProjectFactory.create()
     user1 = f.UserFactory.create(is_superuser=True)
@@ -474,6 +550,38 @@ def test_custom_fields_csv_generation():
     assert row[28] == "val1"
 
 
+def test_get_valid_csv_is_streamed(client):
+    url = reverse("userstories-csv")
+    project = f.ProjectFactory.create(userstories_csv_uuid=uuid.uuid4().hex)
+    us = f.UserStoryFactory.create(project=project, subject="Streamed us")
+
+    response = client.get("{}?uuid={}".format(url, project.userstories_csv_uuid))
+    assert response.status_code == 200
+    assert response.streaming
+
+    content = b"".join(response.streaming_content).decode("utf-8")
+    rows = list(csv.reader(content.splitlines()))
+    assert rows[0][0] == "ref"
+    assert rows[1][1] == "Streamed us"
+
+
+def test_csv_generation_in_chunks_without_custom_attributes_values():
+    project = f.ProjectFactory.create(userstories_csv_uuid=uuid.uuid4().hex)
+    attr = f.UserStoryCustomAttributeFactory.create(project=project, name="attr1", description="desc")
+    us1 = f.UserStoryFactory.create(project=project)
+    us2 = f.UserStoryFactory.create(project=project)
+    us3 = f.UserStoryFactory.create(project=project)
+    us2.custom_attributes_values.delete()
+
+    queryset = project.user_stories.all().order_by("ref")
+    data = services.userstories_to_csv_stream(project, queryset, chunk_size=2)
+    rows = list(csv.reader("".join(data).splitlines()))
+
+    assert len(rows) == 4
+    assert [row[0] for row in rows[1:]] == [str(us1.ref), str(us2.ref), str(us3.ref)]
+    assert rows[2][28] == ""
+
+
 def test_update_userstory_respecting_watchers(client):
     watching_user = f.create_user()
     project = f.ProjectFactory.create()
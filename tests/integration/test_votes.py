@@ -17,10 +17,12 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import pytest
+import random
 
 from django.contrib.contenttypes.models import ContentType
 
 from taiga.projects.votes import services as votes, models
+from taiga.projects.votes.utils import attach_total_voters_to_queryset
 
 from .. import factories as f
 
@@ -85,3 +87,24 @@ def test_get_voted():
     vote = f.VoteFactory(content_type=project_type, object_id=project.id)
 
     assert list(votes.get_voted(vote.user, type(project))) == [project]
+
+
+def test_stored_total_voters_match_the_votes():
+    rnd = random.Random(1234)
+    project = f.ProjectFactory()
+    users = [f.UserFactory() for i in range(5)]
+    objs = ([f.UserStoryFactory(project=project) for i in range(2)] +
+            [f.TaskFactory(project=project) for i in range(2)] +
+            [f.IssueFactory(project=project) for i in range(2)])
+
+    for i in range(100):
+        obj, user = rnd.choice(objs), rnd.choice(users)
+        if rnd.random() < 0.6:
+            votes.add_vote(obj, user)
+        else:
+            votes.remove_vote(obj, user)
+
+    for obj in objs:
+        queryset = attach_total_voters_to_queryset(type(obj).objects.filter(id=obj.id))
+        assert queryset.get().total_voters == votes.get_votes(obj)
+
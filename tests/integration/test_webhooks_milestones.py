@@ -38,11 +38,12 @@ def test_webhooks_when_create_milestone(settings):
 
     obj = f.MilestoneFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "create"
         assert data["type"] == "milestone"
         assert data["by"]["id"] == obj.owner.id
@@ -58,18 +59,20 @@ def test_webhooks_when_update_milestone(settings):
 
     obj = f.MilestoneFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
     obj.name = "test webhook update"
     obj.save()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "milestone"
         assert data["by"]["id"] == obj.owner.id
@@ -89,11 +92,12 @@ def test_webhooks_when_delete_milestone(settings):
 
     obj = f.MilestoneFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, delete=True)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "delete"
         assert data["type"] == "milestone"
         assert data["by"]["id"] == obj.owner.id
@@ -20,9 +20,13 @@ import pytest
 from unittest.mock import patch
 from unittest.mock import Mock
 
+from django.db import transaction
+
 from .. import factories as f
 
+from taiga.base.utils import json
 from taiga.projects.history import services
+from taiga.webhooks import tasks
 
 pytestmark = pytest.mark.django_db(transaction=True)
 
@@ -124,3 +128,133 @@ def test_send_request_one_webhook_signal(settings):
         with patch("taiga.webhooks.tasks.requests.Session.send", return_value=response) as session_send_mock:
             services.take_snapshot(obj, user=obj.owner, comment="test", delete=True)
             assert session_send_mock.call_count == 1
+
+
+def test_send_requests_keeps_the_order_of_every_webhook(settings):
+    settings.WEBHOOKS_LOGS_KEPT = 3
+    settings.WEBHOOKS_LOGS_PRUNE_INTERVAL = 1
+    webhook1 = f.WebhookFactory.create(url="http://localhost:8080/test1")
+    webhook2 = f.WebhookFactory.create(url="http://localhost:8080/test2")
+
+    deliveries = []
+    for i in range(5):
+        deliveries.append((webhook1.id, webhook1.url, webhook1.key, {"position": i}))
+        deliveries.append((webhook2.id, webhook2.url, webhook2.key, {"position": i}))
+
+    sent = []
+
+    def send(request, **kwargs):
+        sent.append((request.url, json.loads(request.body.decode("utf-8"))["position"]))
+        response = Mock(status_code=200, headers={}, content="ok")
+        response.elapsed.total_seconds.return_value = 1
+        return response
+
+    with patch("taiga.webhooks.tasks.requests.Session.send", side_effect=send):
+        logs = tasks._send_requests(deliveries)
+
+    assert [log.request_data for log in logs] == [data for _, _, _, data in deliveries]
+    assert [position for url, position in sent if url == webhook1.url] == list(range(5))
+    assert [position for url, position in sent if url == webhook2.url] == list(range(5))
+
+    assert webhook1.logs.count() == 3
+    assert webhook2.logs.count() == 3
+
+
+def test_history_entry_payload_is_rendered_once_and_signed_per_webhook(settings):
+    settings.WEBHOOKS_ENABLED = True
+    project = f.ProjectFactory()
+    f.WebhookFactory.create(project=project, url="http://localhost:8080/test1", key="key1")
+    f.WebhookFactory.create(project=project, url="http://localhost:8080/test2", key="key2")
+    obj = f.IssueFactory.create(project=project)
+
+    response = Mock(status_code=200, headers={}, content="ok")
+    response.elapsed.total_seconds.return_value = 100
+
+    with patch("taiga.webhooks.tasks.render_payload", wraps=tasks.render_payload) as render_payload_mock, \
+            patch("taiga.webhooks.tasks.requests.Session.send", return_value=response) as session_send_mock:
+        services.take_snapshot(obj, user=obj.owner, comment="test")
+
+    assert render_payload_mock.call_count == 1
+    requests = sorted((call[0][0] for call in session_send_mock.call_args_list), key=lambda r: r.url)
+    assert requests[0].body == requests[1].body
+    assert (requests[0].headers["X-TAIGA-WEBHOOK-SIGNATURE"] ==
+            tasks._generate_signature(requests[0].body, "key1"))
+    assert (requests[1].headers["X-TAIGA-WEBHOOK-SIGNATURE"] ==
+            tasks._generate_signature(requests[1].body, "key2"))
+
+
+def test_bulk_mode_sends_the_changes_of_a_transaction_together(settings):
+    settings.WEBHOOKS_ENABLED = True
+    settings.WEBHOOKS_BULK_MODE = True
+    settings.WEBHOOKS_BULK_MAX_ITEMS = 2
+    project = f.ProjectFactory()
+    f.WebhookFactory.create(project=project)
+    objects = [f.IssueFactory.create(project=project) for i in range(3)]
+
+    response = Mock(status_code=200, headers={}, content="ok")
+    response.elapsed.total_seconds.return_value = 100
+
+    with patch("taiga.webhooks.tasks.requests.Session.send", return_value=response) as session_send_mock:
+        with transaction.atomic():
+            for obj in objects:
+                services.take_snapshot(obj, user=obj.owner, comment="test")
+            assert session_send_mock.call_count == 0
+
+    assert session_send_mock.call_count == 2
+    payloads = [json.loads(call[0][0].body.decode("utf-8")) for call in session_send_mock.call_args_list]
+    assert [payload["action"] for payload in payloads] == ["bulk", "bulk"]
+    assert [[item["data"]["id"] for item in payload["data"]] for payload in payloads] == [
+        [objects[0].id, objects[1].id], [objects[2].id]]
+
+    # A transaction with a single change is sent as usual
+    with patch("taiga.webhooks.tasks.requests.Session.send", return_value=response) as session_send_mock:
+        with transaction.atomic():
+            services.take_snapshot(objects[0], user=objects[0].owner, comment="test")
+
+    assert session_send_mock.call_count == 1
+    assert json.loads(session_send_mock.call_args[0][0].body.decode("utf-8"))["action"] == "change"
+
+
+def test_bulk_mode_discards_the_changes_of_rolled_back_savepoints(settings):
+    settings.WEBHOOKS_ENABLED = True
+    settings.WEBHOOKS_BULK_MODE = True
+    project = f.ProjectFactory()
+    f.WebhookFactory.create(project=project)
+    objects = [f.IssueFactory.create(project=project) for i in range(4)]
+
+    response = Mock(status_code=200, headers={}, content="ok")
+    response.elapsed.total_seconds.return_value = 100
+
+    with patch("taiga.webhooks.tasks.requests.Session.send", return_value=response) as session_send_mock:
+        with transaction.atomic():
+            services.take_snapshot(objects[0], user=objects[0].owner, comment="test")
+            try:
+                with transaction.atomic():
+                    services.take_snapshot(objects[1], user=objects[1].owner, comment="test")
+                    raise RuntimeError()
+            except RuntimeError:
+                pass
+            with transaction.atomic():
+                services.take_snapshot(objects[2], user=objects[2].owner, comment="test")
+            services.take_snapshot(objects[3], user=objects[3].owner, comment="test")
+
+    assert session_send_mock.call_count == 1
+    payload = json.loads(session_send_mock.call_args[0][0].body.decode("utf-8"))
+    assert payload["action"] == "bulk"
+    assert [item["data"]["id"] for item in payload["data"]] == [objects[0].id, objects[2].id, objects[3].id]
+
+    # The changes of a rolled back transaction aren't sent with the next one
+    with patch("taiga.webhooks.tasks.requests.Session.send", return_value=response) as session_send_mock:
+        try:
+            with transaction.atomic():
+                services.take_snapshot(objects[0], user=objects[0].owner, comment="test")
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+        with transaction.atomic():
+            services.take_snapshot(objects[1], user=objects[1].owner, comment="test")
+
+    assert session_send_mock.call_count == 1
+    payload = json.loads(session_send_mock.call_args[0][0].body.decode("utf-8"))
+    assert payload["action"] == "change"
+    assert payload["data"]["id"] == objects[1].id
@@ -38,11 +38,12 @@ def test_webhooks_when_create_task(settings):
 
     obj = f.TaskFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "create"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -58,18 +59,20 @@ def test_webhooks_when_update_task(settings):
 
     obj = f.TaskFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
     obj.subject = "test webhook update"
     obj.save()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -89,11 +92,12 @@ def test_webhooks_when_delete_task(settings):
 
     obj = f.TaskFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, delete=True)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "delete"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -109,19 +113,21 @@ def test_webhooks_when_update_task_attachments(settings):
 
     obj = f.TaskFactory.create(project=project)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
     # Create attachments
     attachment1 = f.TaskAttachmentFactory(project=obj.project, content_object=obj, owner=obj.owner)
     attachment2 = f.TaskAttachmentFactory(project=obj.project, content_object=obj, owner=obj.owner)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -136,11 +142,12 @@ def test_webhooks_when_update_task_attachments(settings):
     attachment1.description = "new attachment description"
     attachment1.save()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -154,11 +161,12 @@ def test_webhooks_when_update_task_attachments(settings):
     # Delete attachment
     attachment2.delete()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -183,9 +191,10 @@ def test_webhooks_when_update_task_custom_attributes(settings):
     custom_attr_2 = f.TaskCustomAttributeFactory(project=obj.project)
     ct2_id = "{}".format(custom_attr_2.id)
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner)
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
     # Create custom attributes
     obj.custom_attributes_values.attributes_values = {
@@ -194,11 +203,12 @@ def test_webhooks_when_update_task_custom_attributes(settings):
     }
     obj.custom_attributes_values.save()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -213,11 +223,12 @@ def test_webhooks_when_update_task_custom_attributes(settings):
     obj.custom_attributes_values.attributes_values[ct1_id] = "test_2_updated"
     obj.custom_attributes_values.save()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
@@ -232,11 +243,12 @@ def test_webhooks_when_update_task_custom_attributes(settings):
     del obj.custom_attributes_values.attributes_values[ct1_id]
     obj.custom_attributes_values.save()
 
-    with patch('taiga.webhooks.tasks._send_request') as send_request_mock:
+    with patch('taiga.webhooks.tasks._send_requests') as send_requests_mock:
         services.take_snapshot(obj, user=obj.owner, comment="test_comment")
-        assert send_request_mock.call_count == 2
+        assert send_requests_mock.call_count == 1
+        assert len(send_requests_mock.call_args[0][0]) == 2
 
-        (webhook_id, url, key, data) = send_request_mock.call_args[0]
+        (webhook_id, url, key, data, payload) = send_requests_mock.call_args[0][0][-1]
         assert data["action"] == "change"
         assert data["type"] == "task"
         assert data["by"]["id"] == obj.owner.id
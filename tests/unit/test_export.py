@@ -17,10 +17,21 @@
 
 import pytest
 import io
+import os
+import tarfile
+
+from django.core.files.storage import default_storage
+
 from .. import factories as f
 
 from taiga.base.utils import json
 from taiga.export_import.services import render_project
+from taiga.export_import.services import render_project_archive
+from taiga.export_import.services import get_dump_format
+from taiga.export_import.services import load_dump
+from taiga.export_import.services.stream import StreamedSection
+from taiga.export_import.services.store import ImportContext
+from taiga.export_import import tasks
 
 pytestmark = pytest.mark.django_db
 
@@ -41,3 +52,91 @@ def test_export_user_story_finish_date(client):
     project_data = json.loads(output.getvalue())
     finish_date = project_data["user_stories"][0]["finish_date"]
     assert finish_date == "2014-10-22T00:00:00+0000"
+
+
+def test_export_project_archive(client):
+    user_story = f.UserStoryFactory.create(subject="Archived us")
+    f.UserStoryAttachmentFactory.create(project=user_story.project, content_object=user_story)
+    output = io.BytesIO()
+    render_project_archive(user_story.project, output, workers=1)
+
+    output.seek(0)
+    with tarfile.open(fileobj=output, mode="r:gz") as archive:
+        manifest = json.loads(archive.extractfile("manifest.json").read())
+        assert manifest["version"] == 1
+
+        project_data = json.loads(archive.extractfile("project.json").read())
+        assert project_data["slug"] == user_story.project.slug
+        assert "user_stories" not in project_data
+
+        lines = archive.extractfile("user_stories.ndjson").read().decode("utf-8").splitlines()
+        assert len(lines) == 1
+        user_story_data = json.loads(lines[0])
+        assert user_story_data["subject"] == "Archived us"
+
+        attached_file = user_story_data["attachments"][0]["attached_file"]
+        assert "data" not in attached_file
+        assert archive.extractfile(attached_file["path"]).read()
+
+
+def test_render_archive_dump(client):
+    user_story = f.UserStoryFactory.create(subject="Archived us")
+    project = user_story.project
+    path = tasks.get_dump_path(project.id, project.slug, "test", "archive")
+    storage_path = default_storage.path(path)
+    os.makedirs(os.path.dirname(storage_path), exist_ok=True)
+
+    tasks.render_dump(project, storage_path, "archive")
+
+    with tarfile.open(storage_path, mode="r:gz") as archive:
+        project_data = json.loads(archive.extractfile("project.json").read())
+        assert project_data["slug"] == user_story.project.slug
+        lines = archive.extractfile("user_stories.ndjson").read().decode("utf-8").splitlines()
+        assert json.loads(lines[0])["subject"] == "Archived us"
+
+    default_storage.delete(path)
+
+
+
+def test_import_path_has_the_dump_format_extension(client):
+    project = f.ProjectFactory.create()
+    output = io.BytesIO()
+    render_project_archive(project, output, workers=1)
+    output.seek(0)
+
+    dump_format = get_dump_format(output)
+    assert dump_format == "archive"
+    assert tasks.get_import_path("test", dump_format) == "imports/test.tar.gz"
+    assert get_dump_format(io.BytesIO(b'{"slug": "test"}')) == "json"
+    assert tasks.get_import_path("test") == "imports/test.json"
+
+def test_load_dump_streams_sections(client):
+    user_story = f.UserStoryFactory.create(subject="Streamed us")
+    f.UserStoryAttachmentFactory.create(project=user_story.project, content_object=user_story)
+    output = io.StringIO()
+    render_project(user_story.project, output)
+
+    dump = load_dump(io.BytesIO(output.getvalue().encode("utf-8")))
+    assert dump["slug"] == user_story.project.slug
+    assert isinstance(dump["user_stories"], StreamedSection)
+
+    user_stories = list(dump["user_stories"])
+    assert len(user_stories) == 1
+    assert user_stories[0]["subject"] == "Streamed us"
+    assert user_stories[0]["attachments"][0]["attached_file"].read()
+
+    # Sections can be iterated more than once
+    assert len(list(dump["user_stories"])) == 1
+
+
+def test_import_contexts_dont_share_the_bulk_create_buffer(client):
+    project = f.ProjectFactory.create()
+    context1 = ImportContext()
+    context2 = ImportContext()
+
+    context1.save_or_bulk_create(f.MilestoneFactory.build(project=project, owner=project.owner))
+    context2.flush_bulk_create()
+    assert project.milestones.count() == 0
+
+    context1.flush_bulk_create()
+    assert project.milestones.count() == 1
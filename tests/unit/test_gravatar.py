@@ -17,7 +17,10 @@
 
 import hashlib
 
+from collections import namedtuple
+
 from taiga.users.gravatar import get_gravatar_url
+from taiga.users.services import get_photos_or_gravatars_urls
 
 
 def test_get_gravatar_url():
@@ -28,3 +31,18 @@ def test_get_gravatar_url():
     assert email_hash in url
     assert 's=40' in url
     assert 'd=default-image-url' in url
+
+
+def test_get_photos_or_gravatars_urls():
+    UserData = namedtuple("UserData", ["id", "photo", "email"])
+    user1 = UserData(id=1, photo=None, email="user1@email.com")
+    user2 = UserData(id=2, photo=None, email="user2@email.com")
+
+    urls = get_photos_or_gravatars_urls([user1, user2, user1, None])
+
+    assert set(urls.keys()) == {1, 2}
+    assert hashlib.md5(user1.email.encode()).hexdigest() in urls[1]
+    assert hashlib.md5(user2.email.encode()).hexdigest() in urls[2]
+
+    big_urls = get_photos_or_gravatars_urls([user1], big=True)
+    assert big_urls[1] != urls[1]
@@ -0,0 +1,103 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import datetime
+import decimal
+import json as stdlib_json
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy
+
+from taiga.base.api.renderers import JSONRenderer
+from taiga.base.api.utils import encoders
+from taiga.base.utils import json
+
+
+VALUES = [
+    datetime.datetime(2014, 10, 22, 10, 30, 15, 123456, tzinfo=timezone.utc),
+    datetime.datetime(2014, 10, 22, 10, 30, 15),
+    datetime.date(2014, 10, 22),
+    datetime.time(10, 30, 15, 123456),
+    datetime.timedelta(hours=1, seconds=30),
+    decimal.Decimal("1.50"),
+    ugettext_lazy("New"),
+    "Iñtërnâtiônàlizætiøn 漢字 😀\x7f",
+]
+
+
+def _backends():
+    yield json.StdlibBackend()
+    try:
+        yield json.OrjsonBackend()
+    except ImportError:
+        pass
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_json_backends_encode_values_as_the_json_encoder(value, ensure_ascii):
+    expected = stdlib_json.dumps([value], cls=encoders.JSONEncoder, ensure_ascii=ensure_ascii)
+
+    for backend in _backends():
+        assert backend.dumps([value], ensure_ascii=ensure_ascii) == expected
+
+
+def test_json_backends_encode_documents_as_the_json_encoder():
+    data = {
+        "values": VALUES,
+        "nested": [{"id": 1, "total": decimal.Decimal("2.5"), "closed": False, "parent": None}],
+        1: "non string key",
+    }
+    expected = stdlib_json.dumps(data, cls=encoders.JSONEncoder)
+
+    for backend in _backends():
+        assert json.loads(backend.dumps(data)) == json.loads(expected)
+        assert backend.dumps(data, indent=4) == stdlib_json.dumps(data, cls=encoders.JSONEncoder, indent=4)
+
+
+@pytest.mark.parametrize("value", [1e20, 1.5e-7, float("nan"), float("inf"), 2 ** 70, -2 ** 70])
+def test_json_dumps_encodes_values_as_the_json_encoder_by_default(value):
+    expected = stdlib_json.dumps({"value": [value, 1]}, cls=encoders.JSONEncoder)
+    assert json.dumps({"value": [value, 1]}) == expected
+
+
+def test_json_orjson_backend_falls_back_to_the_stdlib_one_with_big_integers():
+    try:
+        backend = json.OrjsonBackend()
+    except ImportError:
+        pytest.skip("orjson is not installed")
+
+    assert backend.dumps([2 ** 70]) == stdlib_json.dumps([2 ** 70])
+
+
+def test_json_dumps_with_a_custom_encoder_class():
+    class AuxEncoder(encoders.JSONEncoder):
+        def default(self, o):
+            if isinstance(o, decimal.Decimal):
+                return float(o)
+            return super().default(o)
+
+    assert json.dumps({"value": decimal.Decimal("1.5")}, encoder_class=AuxEncoder) == '{"value": 1.5}'
+
+
+def test_json_renderer_uses_the_json_backend():
+    data = {"created_date": VALUES[0], "subject": VALUES[-1]}
+    rendered = JSONRenderer().render(data)
+
+    assert rendered == json.dumps(data).encode("utf-8")
+    assert json.loads(rendered) == json.loads(stdlib_json.dumps(data, cls=encoders.JSONEncoder))
@@ -0,0 +1,84 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from taiga.base.api import serializers
+
+
+class AuxObject:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class AuxNestedSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    greeting = serializers.SerializerMethodField("get_greeting")
+
+    def get_greeting(self, obj):
+        return "{} {}".format(self.context.get("greeting"), obj.name)
+
+
+class AuxSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    owner_name = serializers.CharField(source="owner.name")
+    owner = AuxNestedSerializer()
+
+
+def _aux_object(name, owner_name):
+    owner = AuxObject(name=owner_name) if owner_name else None
+    return AuxObject(name=name, owner=owner)
+
+
+def test_serializer_to_native_follows_dotted_sources():
+    objects = [_aux_object("one", "john"), _aux_object("two", None)]
+    data = AuxSerializer(objects, many=True, context={"greeting": "hi"}).data
+
+    assert data[0]["name"] == "one"
+    assert data[0]["owner_name"] == "john"
+    assert data[0]["owner"] == {"name": "john", "greeting": "hi john"}
+    assert data[1]["owner_name"] is None
+    assert data[1]["owner"] is None
+
+
+def test_serializer_native_plan_is_compiled_once():
+    serializer = AuxSerializer(_aux_object("one", "john"))
+    plan = serializer.get_native_plan()
+
+    serializer.to_native(_aux_object("two", "paul"))
+    assert serializer.get_native_plan() is plan
+
+
+def test_serializer_native_plan_is_compiled_again_when_fields_change():
+    serializer = AuxSerializer(_aux_object("one", "john"))
+    assert "extra" not in serializer.data
+
+    serializer._data = None
+    serializer.fields["extra"] = serializers.SerializerMethodField("get_extra")
+    serializer.get_extra = lambda obj: obj.name.upper()
+    assert serializer.data["extra"] == "ONE"
+
+    serializer._data = None
+    serializer.fields.pop("extra")
+    assert "extra" not in serializer.data
+
+
+def test_serializer_to_native_with_metadata():
+    serializer = AuxSerializer(_aux_object("one", "john"))
+    serializer.with_metadata = True
+    data = serializer.data
+
+    assert data["name"] == "one"
+    assert list(data.fields.keys()) == list(serializer.fields.keys())
@@ -0,0 +1,82 @@
+# Copyright (C) 2014-2016 Andrey Antukh <niwi@niwi.nz>
+# Copyright (C) 2014-2016 Jesús Espino <jespinog@gmail.com>
+# Copyright (C) 2014-2016 David Barragán <bameda@dbarragan.com>
+# Copyright (C) 2014-2016 Alejandro Alonso <alejandro.alonso@kaleidos.net>
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from taiga.base.api.throttling import SlidingWindowRateThrottle
+
+
+class AuxThrottle(SlidingWindowRateThrottle):
+    rate = "10/m"
+
+    def __init__(self, cache, now=None):
+        super().__init__()
+        self.cache = cache
+        if now is not None:
+            self.timer = lambda: now
+
+    def get_cache_key(self, request, view):
+        return "throttle_test"
+
+
+def test_sliding_window_throttle_limits_requests():
+    cache = LocMemCache("throttling-test", {})
+    throttle = AuxThrottle(cache, now=600)
+
+    assert all(throttle.allow_request(None, None) for i in range(10))
+    assert not throttle.allow_request(None, None)
+    assert throttle.wait() > 0
+
+    # Rejected requests don't consume the rate
+    assert cache.get("throttle_test_10") == 10
+
+
+def test_sliding_window_throttle_weights_the_previous_window():
+    cache = LocMemCache("throttling-test-weights", {})
+    throttle = AuxThrottle(cache, now=600)
+    assert all(throttle.allow_request(None, None) for i in range(10))
+
+    # In the middle of the next window half of the previous requests count
+    throttle = AuxThrottle(cache, now=690)
+    assert all(throttle.allow_request(None, None) for i in range(5))
+    assert not throttle.allow_request(None, None)
+
+    # The requests of two windows ago are forgotten
+    throttle = AuxThrottle(cache, now=720)
+    assert all(throttle.allow_request(None, None) for i in range(5))
+    assert not throttle.allow_request(None, None)
+
+
+def test_sliding_window_throttle_concurrent_requests():
+    cache = LocMemCache("throttling-test-concurrency", {})
+    results = []
+
+    def make_requests():
+        throttle = AuxThrottle(cache, now=600)
+        for i in range(5):
+            results.append(throttle.allow_request(None, None))
+
+    threads = [threading.Thread(target=make_requests) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 40
+    assert results.count(True) == 10
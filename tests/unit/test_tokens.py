@@ -52,3 +52,19 @@ def test_invalid_token_scope():
     user = f.UserFactory.create(email="old@email.com")
     token = get_token_for_user(user, "testing_scope")
     get_user_for_token(token, "testing_invalid_scope")
+
+
+def test_token_user_is_cached_until_the_user_changes():
+    user = f.UserFactory.create(email="old@email.com")
+    token = get_token_for_user(user, "testing_scope")
+
+    user_from_token = get_user_for_token(token, "testing_scope")
+    assert user_from_token.is_active
+
+    # Queryset updates don't invalidate the cache
+    type(user).objects.filter(id=user.id).update(full_name="Updated name")
+    assert get_user_for_token(token, "testing_scope").full_name == user.full_name
+
+    user.is_active = False
+    user.save()
+    assert not get_user_for_token(token, "testing_scope").is_active
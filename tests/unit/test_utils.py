@@ -19,9 +19,12 @@ import pytest
 from unittest import mock
 
 import django_sites as sites
+import hashlib
+import io
 import re
 
 from taiga.base.utils.urls import get_absolute_url, is_absolute_url, build_url
+from taiga.base.utils.files import get_file_sha1
 from taiga.base.utils.db import save_in_bulk, update_in_bulk, update_in_bulk_with_ids, to_tsquery
 
 pytestmark = pytest.mark.django_db
@@ -121,3 +124,9 @@ def test_to_tsquery():
         expected = re.sub("([0-9])", r"'\1':*", expected)
         actual = to_tsquery(input)
         assert actual == expected
+
+
+def test_get_file_sha1():
+    content = b"0123456789" * 1000
+    assert get_file_sha1(io.BytesIO(content), blocksize=64) == (hashlib.sha1(content).hexdigest(), len(content))
+    assert get_file_sha1(io.BytesIO(b"")) == (hashlib.sha1(b"").hexdigest(), 0)